@@ -0,0 +1,127 @@
+"""
+Pyscaffold Config Benchmark
+
+This script measures how fast each configuration backend parses the same settings. It
+builds a configuration of the shape of `config.yaml`, scaled up with extra sections to
+resemble a fleet configuration, writes it as YAML, TOML and JSON, and times each parser
+on its own, bypassing the parse cache and the sidecar. The pure-Python YAML loader is
+measured too, for comparison with libyaml's `CSafeLoader`.
+
+Usage:
+    python benchmarks/bench_config.py
+    python benchmarks/bench_config.py --sections 200 --repeat 50
+
+Functions:
+    build_settings: Build nested settings of the shape of `config.yaml`.
+    dump_toml: Format nested settings as TOML.
+    bench_backend: Time a parser on a configuration file.
+    main: Write the settings in each format and print each backend's timings.
+"""
+
+import sys
+import json
+import time
+import argparse
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import yaml
+
+from pyscaffold import config
+
+def build_settings(sections: int) -> dict:
+    """
+    Build nested settings of the shape of `config.yaml`.
+
+    Args:
+        sections (int): The number of extra sections to add.
+
+    Returns:
+        dict: Sections mapped to their settings, all strings, integers or booleans.
+    """
+    settings = {
+        'locations': {'PROJECTS': '/home/engineer/source/python/projects', 'TEST_PROJECTS': 'tests/dummyprojects'},
+        'venv': {'STRATEGY': 'standard', 'POOL_SIZE': 2},
+        'files': {'LINK_SHARED': False, 'DURABILITY': 'none'}
+    }
+    for index in range(sections):
+        settings[f'host{index}'] = {
+            'PROJECTS': f'/srv/host{index}/projects',
+            'STRATEGY': 'pool',
+            'POOL_SIZE': index % 8,
+            'LINK_SHARED': index % 2 == 0
+        }
+    return settings
+
+def dump_toml(settings: dict) -> str:
+    """
+    Format nested settings as TOML.
+
+    Args:
+        settings (dict): Sections mapped to their settings, all strings, integers or booleans.
+
+    Returns:
+        str: The settings as TOML tables.
+    """
+    lines = []
+    for section, values in settings.items():
+        lines.append(f'[{section}]')
+        lines.extend(f'{key} = {json.dumps(value)}' for key, value in values.items())
+        lines.append('')
+    return '\n'.join(lines)
+
+def bench_backend(load, path: Path, repeat: int) -> float:
+    """
+    Time a parser on a configuration file.
+
+    Args:
+        load (callable): The parser, taking the file opened in binary mode.
+        path (Path): The configuration file.
+        repeat (int): The number of times to parse the file.
+
+    Returns:
+        float: The mean time of one parse, in milliseconds.
+    """
+    started = time.perf_counter()
+    for _ in range(repeat):
+        with open(path, 'rb') as file:
+            load(file)
+    return (time.perf_counter() - started) / repeat * 1000
+
+def main() -> None:
+    """
+    Write the settings in each format and print each backend's timings.
+    """
+    parser = argparse.ArgumentParser(description='Measure how fast each configuration backend parses the same settings.')
+    parser.add_argument('--sections', type=int, default=100, help='Number of extra sections in the configuration (default: 100)')
+    parser.add_argument('--repeat', type=int, default=20, help='Number of parses timed per backend (default: 20)')
+    args = parser.parse_args()
+
+    settings = build_settings(args.sections)
+    with tempfile.TemporaryDirectory(prefix='pyscaffold-bench-') as directory:
+        files = {
+            'yaml': Path(directory) / 'config.yaml',
+            'toml': Path(directory) / 'config.toml',
+            'json': Path(directory) / 'config.json'
+        }
+        files['yaml'].write_text(yaml.safe_dump(settings, sort_keys=False))
+        files['toml'].write_text(dump_toml(settings))
+        files['json'].write_text(json.dumps(settings))
+
+        backends = [
+            ('yaml (pure Python)', lambda file: yaml.load(file, Loader=yaml.SafeLoader), files['yaml']),
+            ('yaml' + (' (libyaml)' if hasattr(yaml, 'CSafeLoader') else ''), config.load_yaml, files['yaml']),
+            ('toml', config.load_toml, files['toml']),
+            ('json', config.load_json, files['json'])
+        ]
+        print(f"Parsing {len(settings)} sections, {args.repeat} times per backend")
+        print(f"{'Backend':<20}{'Bytes':>10}{'ms/parse':>12}")
+        for name, load, path in backends:
+            with open(path, 'rb') as file:
+                assert load(file) == settings, f"{name} parsed different settings"
+            print(f"{name:<20}{path.stat().st_size:>10}{bench_backend(load, path, args.repeat):>12.3f}")
+
+if __name__ == '__main__':
+    main()
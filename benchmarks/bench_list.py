@@ -0,0 +1,94 @@
+"""
+Pyscaffold List Benchmark
+
+This script measures how fast a projects directory is scanned for `list`. It creates a
+projects root holding many project directories, half of them ready, and times the single
+`os.scandir` pass of `scan_projects` against checking each entry with `project_ready`,
+which makes a call per path it checks.
+
+Usage:
+    python benchmarks/bench_list.py
+    python benchmarks/bench_list.py --projects 20000 --repeat 5
+    python benchmarks/bench_list.py --root /mnt/disk/bench
+
+Functions:
+    create_projects: Create project directories under a projects root.
+    bench_scan: Time a scan of the projects root.
+    main: Create the projects root and print the timings of each scan.
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pyscaffold import utils
+
+def create_projects(root: Path, projects: int) -> None:
+    """
+    Create project directories under a projects root.
+
+    Args:
+        root (Path): The projects root.
+        projects (int): The number of project directories. Every other one is ready.
+    """
+    for index in range(projects):
+        project_path = root / f'Project{index:05d}'
+        project_path.mkdir()
+        (project_path / 'README.md').touch()
+        if index % 2 == 0:
+            (project_path / 'setup.py').touch()
+            (project_path / 'env').mkdir()
+
+def bench_scan(scan, root: Path, repeat: int) -> tuple:
+    """
+    Time a scan of the projects root.
+
+    Args:
+        scan (callable): The scan, taking the projects root and returning its ready projects.
+        root (Path): The projects root.
+        repeat (int): The number of scans timed.
+
+    Returns:
+        tuple: The number of ready projects found and the mean time of one scan, in seconds.
+    """
+    started = time.perf_counter()
+    for _ in range(repeat):
+        ready = scan(root)
+    return ready, (time.perf_counter() - started) / repeat
+
+def main() -> None:
+    """
+    Create the projects root and print the timings of each scan.
+    """
+    parser = argparse.ArgumentParser(description='Measure how fast a projects directory is scanned for `list`.')
+    parser.add_argument('--projects', type=int, default=10000, help='Number of project directories (default: 10000)')
+    parser.add_argument('--repeat', type=int, default=3, help='Number of scans timed per method (default: 3)')
+    parser.add_argument('--root', type=Path, default=None, help='Directory to create the projects under (default: a temporary directory)')
+    args = parser.parse_args()
+
+    scans = [
+        ('scan_projects', lambda root: sum(ready for _, ready in utils.scan_projects(root))),
+        ('project_ready', lambda root: sum(
+            utils.project_ready(root / name) for name in os.listdir(root)
+            if not name.startswith('.') and (root / name).is_dir()
+        ))
+    ]
+    root = Path(tempfile.mkdtemp(prefix='pyscaffold-bench-', dir=args.root))
+    try:
+        create_projects(root, args.projects)
+        print(f"Scanning {args.projects} projects under {root}, {args.repeat} times per method")
+        print(f"{'Method':<16}{'Ready':>8}{'Seconds':>10}{'Entries/s':>12}")
+        for name, scan in scans:
+            ready, elapsed = bench_scan(scan, root, args.repeat)
+            print(f"{name:<16}{ready:>8}{elapsed:>10.3f}{args.projects / elapsed:>12.0f}")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+if __name__ == '__main__':
+    main()
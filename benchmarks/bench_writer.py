@@ -0,0 +1,76 @@
+"""
+Pyscaffold Writer Benchmark
+
+This script measures the throughput of the bulk file writer in each durability mode. It
+renders a project once and writes it repeatedly into fresh directories, committing after
+each project as `start` does, and reports the files and projects written per second.
+
+Usage:
+    python benchmarks/bench_writer.py
+    python benchmarks/bench_writer.py --projects 200 --workers 4 --modes none batch
+    python benchmarks/bench_writer.py --root /mnt/disk/bench
+
+Functions:
+    bench_mode: Write a rendered project repeatedly with one durability mode.
+    main: Run the benchmark for each requested mode and print the results.
+"""
+
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pyscaffold.pyscaffold import Pyscaffold
+from pyscaffold.writer import DURABILITY_MODES, BulkWriter
+
+def bench_mode(tree, root: Path, durability: str, projects: int, workers: int) -> float:
+    """
+    Write a rendered project repeatedly with one durability mode.
+
+    Args:
+        tree (ProjectTree): The rendered project to write.
+        root (Path): The directory to write the projects under.
+        durability (str): The writer's durability mode.
+        projects (int): The number of projects to write.
+        workers (int): The number of writer threads.
+
+    Returns:
+        float: The elapsed time in seconds.
+    """
+    started = time.perf_counter()
+    with BulkWriter(durability, workers) as writer:
+        for index in range(projects):
+            project_path = root / f'{durability}-{index}'
+            project_path.mkdir()
+            tree.materialize(project_path, writer=writer)
+            writer.commit(project_path)
+    return time.perf_counter() - started
+
+def main() -> None:
+    """
+    Run the benchmark for each requested mode and print the results.
+    """
+    parser = argparse.ArgumentParser(description='Measure the bulk writer throughput of each durability mode.')
+    parser.add_argument('--projects', type=int, default=100, help='Number of projects written per mode (default: 100)')
+    parser.add_argument('--workers', type=int, default=None, help='Number of writer threads (default: the CPU count, at most 8)')
+    parser.add_argument('--modes', nargs='+', choices=DURABILITY_MODES, default=list(DURABILITY_MODES), help='Durability modes to measure (default: all)')
+    parser.add_argument('--root', type=Path, default=None, help='Directory to write under, on the filesystem to measure (default: a temporary directory)')
+    args = parser.parse_args()
+
+    tree = Pyscaffold.render_project_tree('BenchProject')
+    root = Path(tempfile.mkdtemp(prefix='pyscaffold-bench-', dir=args.root))
+    print(f"Writing {args.projects} projects of {len(tree)} files ({tree.size()} bytes) per mode under {root}")
+    print(f"{'Mode':<8}{'Seconds':>10}{'Files/s':>12}{'Projects/s':>12}")
+    try:
+        for durability in args.modes:
+            elapsed = bench_mode(tree, root, durability, args.projects, args.workers)
+            print(f"{durability:<8}{elapsed:>10.3f}{args.projects * len(tree) / elapsed:>12.0f}{args.projects / elapsed:>12.1f}")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+if __name__ == '__main__':
+    main()
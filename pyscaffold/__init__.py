@@ -1 +1,50 @@
-from ._version import __version__
\ No newline at end of file
+"""
+Pyscaffold
+
+The Pyscaffold package. Its main classes are exported here as lazy attributes (PEP 562):
+each is imported from its module the first time it is accessed, so importing the package
+or one of its modules does not import the rest of the application.
+
+Attributes:
+    __version__ (str): The version of the package.
+    Pyscaffold, ProjectResult: From `pyscaffold.pyscaffold`.
+    Config, colors: From `pyscaffold.config`.
+    ProjectTree: From `pyscaffold.tree`.
+    Template: From `pyscaffold.templates`.
+"""
+
+from importlib import import_module
+
+from ._version import __version__
+
+# Lazily exported attributes mapped to the module defining them
+LAZY_ATTRIBUTES = {
+    'Pyscaffold': 'pyscaffold.pyscaffold',
+    'ProjectResult': 'pyscaffold.pyscaffold',
+    'Config': 'pyscaffold.config',
+    'colors': 'pyscaffold.config',
+    'ProjectTree': 'pyscaffold.tree',
+    'Template': 'pyscaffold.templates'
+}
+
+def __getattr__(name: str):
+    """
+    Import a lazily exported attribute on first access.
+
+    Args:
+        name (str): The name of the attribute.
+
+    Returns:
+        any: The attribute, which is then kept in the package's namespace.
+
+    Raises:
+        AttributeError: If the package exports no attribute with this name.
+    """
+    if name not in LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(LAZY_ATTRIBUTES[name]), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(LAZY_ATTRIBUTES))
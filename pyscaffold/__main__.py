@@ -6,8 +6,17 @@ It initializes the application, processes command-line arguments, and
 invokes the appropriate functionality based on the subcommands provided.
 
 Usage:
+    pyscaffold list
     pyscaffold start projectA --python 3.10
+    pyscaffold start projectA projectB projectC --jobs 3
+    pyscaffold start projectA projectB projectC --engine asyncio
+    pyscaffold start projectA --compile --invalidation-mode unchecked-hash
+    pyscaffold start projectA --link-shared
+    pyscaffold start projectA projectB --durability batch
     pyscaffold resume projectA
+    pyscaffold sync
+    pyscaffold pool fill --python-version 3.11 --size 4
+    pyscaffold interpreters --refresh
 
 Arguments:
     -h, --help      Show this help message and exit.
@@ -27,11 +36,17 @@ from pyscaffold.arg_parser import create_parser
 from pyscaffold.utils import preprocess_arguments
 
 SUBCOMMANDS = {
-    'list': None,
+    'list': Pyscaffold.list_projects,
     'start': Pyscaffold.start,
-    'resume': Pyscaffold.resume
+    'resume': Pyscaffold.resume,
+    'sync': Pyscaffold.sync,
+    'pool': Pyscaffold.pool,
+    'interpreters': Pyscaffold.list_interpreters
 }
 
+# Commands that do not operate on the projects directory
+STANDALONE_COMMANDS = {'interpreters'}
+
 def execute(command, args):
     """
     Invoke the function associated with the specified command.
@@ -60,5 +75,9 @@ def main():
     """
     parser = create_parser()
     args = parser.parse_args()
-    preprocess_arguments(args)
+    if args.command not in STANDALONE_COMMANDS:
+        preprocess_arguments(args)
     execute(args.command, args)
+
+if __name__ == '__main__':
+    main()
@@ -3,7 +3,11 @@ Pyscaffold Argument Parser
 
 This module contains the argument parsing functionality of the Pyscaffold application.
 It defines the command-line interface (CLI) for the application using argparse,
-enabling users to list, start, and resume projects with various options.
+enabling users to list, start, resume and sync projects with various options, to
+manage the prewarmed virtual environment pool, and to list the available interpreters.
+
+Classes:
+    BannerArgumentParser: An argument parser that reads its banner only when help is shown.
 
 Functions:
     create_parser: Creates and configures the argument parser for the Pyscaffold CLI.
@@ -11,7 +15,29 @@ Functions:
 
 import argparse
 from pyscaffold.config import colors
-from pyscaffold.fragments import pyscaffold_ascii
+
+class BannerArgumentParser(argparse.ArgumentParser):
+    """
+    An argument parser whose description is a fragment of the template pack, read only
+    when the help message is formatted, so parsing a command never opens the pack.
+    """
+
+    def __init__(self, *args, banner: str = None, **kwargs):
+        """
+        Initialize the parser.
+
+        Args:
+            banner (str, optional): The name of the fragment shown as the description, e.g. 'pyscaffold_ascii'.
+            *args, **kwargs: Passed on to `argparse.ArgumentParser`.
+        """
+        super().__init__(*args, **kwargs)
+        self.banner = banner
+
+    def format_help(self) -> str:
+        if self.banner and self.description is None:
+            from pyscaffold.pack import load_fragment
+            self.description = load_fragment(self.banner)
+        return super().format_help()
 
 def create_parser() -> argparse.ArgumentParser:
     """
@@ -24,7 +50,7 @@ def create_parser() -> argparse.ArgumentParser:
     Returns:
         argparse.ArgumentParser: The configured argument parser.
     """
-    parser = argparse.ArgumentParser(
+    parser = BannerArgumentParser(
         prog='pyscaffold',
         fromfile_prefix_chars='@',
         usage=(
@@ -35,7 +61,7 @@ def create_parser() -> argparse.ArgumentParser:
             f'{colors.WARNING}[{colors.ENDC}{colors.OKBLUE}PROJECTB{colors.ENDC} ...{colors.WARNING}]{colors.ENDC}'
         ),
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        description=pyscaffold_ascii,
+        banner='pyscaffold_ascii',
         epilog='Build it! :)')
     
     parser.add_argument('--version', action='version', version='%(prog)s 1.0.0')
@@ -49,9 +75,33 @@ def create_parser() -> argparse.ArgumentParser:
     start_parser.add_argument('project_names', nargs='+', type=str, help='Name(s) of the project to start')
     start_parser.add_argument('-p', '--python-version', type=str, default='3.11', help='Python version to use on start')
     start_parser.add_argument('-d', '--destination', type=str, help='Valid directory pathname as project directory')
+    start_parser.add_argument('-j', '--jobs', type=int, help='Number of projects to scaffold in parallel (default: 1, or the CPU count with the asyncio engine)')
+    start_parser.add_argument('-e', '--engine', choices=['process', 'asyncio'], default='process', help='Engine used to run the scaffold pipelines')
+    start_parser.add_argument('-n', '--dry-run', action='store_true', help='List the files each project would be created with, without writing anything')
+    start_parser.add_argument('--venv-strategy', choices=['standard', 'cache', 'pool', 'shared-pip'], help='How virtual environments are created (default: the venv.STRATEGY setting)')
+    start_parser.add_argument('--link-shared', action='store_true', help='Hardlink the files every project shares from the blob store (default: the files.LINK_SHARED setting)')
+    start_parser.add_argument('--durability', choices=['none', 'batch', 'full'], help='Whether written files are synced to disk not at all, once per project, or one by one (default: the files.DURABILITY setting)')
+    start_parser.add_argument('--compile', action='store_true', help="Precompile each project's package and tests to bytecode with its own interpreter")
+    start_parser.add_argument('--invalidation-mode', choices=['timestamp', 'checked-hash', 'unchecked-hash'], default='timestamp', help='How precompiled bytecode is checked against its source (default: timestamp)')
 
     resume_parser = subparsers.add_parser('resume', help='Resume a project')
     resume_parser.add_argument('project_name', type=str, help='Name of the project to resume')
     resume_parser.add_argument('-d', '--destination', type=str, help='Valid directory pathname as project directory')
+
+    sync_parser = subparsers.add_parser('sync', help='Rewrite the files of projects still as generated from older templates')
+    sync_parser.add_argument('project_names', nargs='*', type=str, help='Name(s) of the projects to sync (default: every project)')
+    sync_parser.add_argument('-d', '--destination', type=str, help='Valid directory pathname as project directory')
+    sync_parser.add_argument('-j', '--jobs', type=int, help='Number of projects to sync in parallel (default: the CPU count)')
+    sync_parser.add_argument('-n', '--dry-run', action='store_true', help='Report the files that would be rewritten, without writing anything')
+    sync_parser.add_argument('--link-shared', action='store_true', help='Hardlink rewritten shared files from the blob store (default: the files.LINK_SHARED setting)')
+
+    pool_parser = subparsers.add_parser('pool', help='Manage the prewarmed virtual environment pool')
+    pool_parser.add_argument('action', choices=['fill'], help='Pool action to perform')
+    pool_parser.add_argument('-p', '--python-version', type=str, default='3.11', help='Python version of the pooled environments')
+    pool_parser.add_argument('-s', '--size', type=int, help='Number of environments to keep ready (default: the venv.POOL_SIZE setting)')
+    pool_parser.add_argument('-d', '--destination', type=str, help='Valid directory pathname as project directory')
+
+    interpreters_parser = subparsers.add_parser('interpreters', help='List the Python interpreters found on PATH')
+    interpreters_parser.add_argument('-r', '--refresh', action='store_true', help='Rescan PATH instead of using the cached registry')
     
     return parser
\ No newline at end of file
@@ -0,0 +1,157 @@
+"""
+Pyscaffold Async Engine
+
+This module contains the asyncio-based engine behind `Pyscaffold.start`. Virtual
+environments are created with `asyncio.create_subprocess_exec`, and while those
+subprocesses run the event loop renders and writes the package, tests and project
+files of the other projects in flight.
+
+Functions:
+    deploy_virtual_environment_async: Launch the creation of a project's virtual environment.
+    run_project_async: Run the scaffold pipeline for a single project on the event loop.
+    run_projects_async: Run the scaffold pipeline for several projects concurrently.
+"""
+
+import time
+import asyncio
+import subprocess
+import collections
+from pathlib import Path
+
+from pyscaffold import interpreters
+from pyscaffold import staging
+from pyscaffold.pyscaffold import Pyscaffold, ProjectResult
+
+async def deploy_virtual_environment_async(project_path: Path, python_version: str = '3.11') -> asyncio.subprocess.Process:
+    """
+    Launch the creation of a virtual environment in the specified project directory.
+
+    The coroutine returns as soon as the `venv` subprocess has been spawned, so the
+    caller can do other work before awaiting `wait_for_virtual_environment`.
+
+    Args:
+        project_path (Path): The path to the project directory.
+        python_version (str): The version of Python to use for the virtual environment (default: '3.11').
+
+    Returns:
+        asyncio.subprocess.Process: The running `venv` subprocess.
+
+    Raises:
+        InterpreterNotFoundError: If the specified Python version is not installed or not found in PATH.
+    """
+    venv_path = project_path / 'env'
+    python_executable = interpreters.find_interpreter(python_version)
+
+    return await asyncio.create_subprocess_exec(python_executable, '-m', 'venv', str(venv_path))
+
+async def wait_for_virtual_environment(process: asyncio.subprocess.Process, project_path: Path) -> bool:
+    """
+    Wait for a `venv` subprocess launched by `deploy_virtual_environment_async` to finish.
+
+    Args:
+        process (asyncio.subprocess.Process): The running `venv` subprocess.
+        project_path (Path): The path to the project directory.
+
+    Returns:
+        bool: True if the virtual environment was created successfully.
+
+    Raises:
+        subprocess.CalledProcessError: If there is an error creating the virtual environment.
+    """
+    venv_path = project_path / 'env'
+    returncode = await process.wait()
+
+    if returncode != 0:
+        error = subprocess.CalledProcessError(returncode, ['-m', 'venv', str(venv_path)])
+        print(f"Error creating virtual environment: {error}")
+        raise error
+
+    return True
+
+async def run_project_async(project_name: str, python_version: str, destination: str, limit: asyncio.Semaphore, **options) -> ProjectResult:
+    """
+    Run the scaffold pipeline for a single project on the event loop, isolating any failure.
+
+    The project is rendered into a staging directory and committed into place with a single
+    rename, or discarded in the background if anything fails.
+    The `venv` subprocess is spawned first; the project files are then rendered and written while it runs.
+    Strategies other than 'standard', and environments of the running Python version, which
+    are built in-process, do not spawn a `venv` subprocess, so they run on a worker thread instead.
+
+    Args:
+        project_name (str): The name of the project to create.
+        python_version (str): The version of Python to use for the virtual environment.
+        destination (str): The path where the project folder should be created.
+        limit (asyncio.Semaphore): Bounds how many projects are in flight at once.
+        **options: Pipeline options. The 'venv_strategy' key selects how the virtual environment is created,
+            the 'link_shared' key whether shared files are hardlinked from the blob store and the 'durability'
+            key how durably the files are written.
+
+    Returns:
+        ProjectResult: The outcome of the pipeline for this project, with the number of metadata
+            operations made for its files.
+    """
+    async with limit:
+        started = time.perf_counter()
+        process = None
+        venv_task = None
+        ops = collections.Counter()
+        venv_strategy = options.get('venv_strategy', 'standard')
+        durability = options.get('durability', 'none')
+        staging_path = staging.staging_path(project_name, destination)
+        try:
+            project_path = staging.create_staging_folder(project_name, destination, staging_path, ops)
+            print(f"Starting project: {project_name} at {Path(destination) / project_name}")
+
+            if venv_strategy == 'standard' and not interpreters.is_running_interpreter(python_version):
+                process = await deploy_virtual_environment_async(project_path, python_version)
+            else:
+                venv_task = asyncio.create_task(asyncio.to_thread(
+                    Pyscaffold.deploy_virtual_environment, project_path, python_version, venv_strategy, destination
+                ))
+
+            tree = Pyscaffold.render_project_tree(project_name)
+            await asyncio.to_thread(
+                Pyscaffold.materialize_project, tree, project_path, Pyscaffold.blob_store(**options), durability, ops
+            )
+
+            if process is not None:
+                await wait_for_virtual_environment(process, project_path)
+            else:
+                await venv_task
+
+            Pyscaffold.write_project_manifest(project_path, tree, python_version, venv_strategy, durability)
+
+            project_path = staging.commit_staging_folder(staging_path, Path(destination) / project_name, ops, durability != 'none')
+            print(f"Virtual environment created at {project_path / 'env'}")
+        except Exception as e:
+            if process is not None and process.returncode is None:
+                process.kill()
+                await process.wait()
+            if venv_task is not None and not venv_task.done():
+                await asyncio.wait([venv_task])
+            staging.discard_staging_folder(staging_path)
+            print(f"Error starting project '{project_name}': {e}")
+            return ProjectResult(project_name, 'failed', time.perf_counter() - started, Path(destination) / project_name, str(e), sum(ops.values()))
+
+        return ProjectResult(project_name, 'ok', time.perf_counter() - started, project_path, None, sum(ops.values()))
+
+async def run_projects_async(project_names, python_version: str, destination: str, jobs: int, **options) -> list:
+    """
+    Run the scaffold pipeline for several projects concurrently on one event loop.
+
+    Args:
+        project_names (list of str): The names of the projects to create.
+        python_version (str): The version of Python to use for the virtual environments.
+        destination (str): The path where the project folders should be created.
+        jobs (int): The maximum number of projects in flight at once.
+        **options: Pipeline options passed on to `run_project_async`.
+
+    Returns:
+        list of ProjectResult: The outcome for each project, in the order given.
+    """
+    limit = asyncio.Semaphore(jobs)
+    return await asyncio.gather(*(
+        run_project_async(project_name, python_version, destination, limit, **options)
+        for project_name in project_names
+    ))
@@ -0,0 +1,314 @@
+"""
+Pyscaffold Blobs
+
+This module contains the content-addressed blob store of the Pyscaffold application. Files
+whose content is the same for every project, such as the .gitignore, the LICENSE and the
+empty `__init__.py` files, are written once into the store, named after the SHA-256 of their
+content, and hardlinked into each project instead of being rewritten byte-for-byte.
+
+Blobs are read-only, so a linked file is shared between every project holding it. A file
+that has to be edited is first given a private copy (copy-on-modify); `check_project` finds
+linked files that were modified in place anyway. The first project found holding the edit
+keeps it in a private copy, the altered blob is evicted from the store so no new project
+links to it, and the other projects sharing it are restored from their rendered content.
+
+Classes:
+    BlobStore: A directory of read-only blobs named after the hash of their content.
+
+Functions:
+    write_file: Create a file and write its full content.
+    unshare: Replace a linked file with a private, writable copy of its content.
+    relink: Replace a file with a link to the blob holding its content.
+    check_project: Check the shared files of a project, keeping or undoing edits made in place.
+"""
+
+import os
+import errno
+import hashlib
+import threading
+from pathlib import Path
+
+from pyscaffold.config import Config
+from pyscaffold.bytecode import invalidate_bytecode
+
+BLOB_MODE = 0o444
+FILE_MODE = 0o644
+
+# Blobs modified in place, kept until no project file shares them anymore
+ALTERED_DIRECTORY = 'altered'
+
+# Errors of `os.link` after which the file is written as a copy instead
+LINK_FALLBACK_ERRORS = {errno.EXDEV, errno.EMLINK, errno.EPERM, errno.EACCES, errno.ENOTSUP}
+
+def write_file(path: Path, content: bytes, mode: int, dir_fd: int = None) -> None:
+    """
+    Create a file and write its full content.
+
+    Args:
+        path (Path): The path of the file, which must not exist.
+        content (bytes): The file's content.
+        mode (int): The permissions of the new file.
+        dir_fd (int, optional): A directory descriptor a relative path is resolved from.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode, dir_fd=dir_fd)
+    try:
+        view = memoryview(content)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+class BlobStore():
+    """
+    A directory of read-only blobs named after the SHA-256 of their content.
+    """
+
+    def __init__(self, root: Path):
+        """
+        Initialize the store.
+
+        Args:
+            root (Path): The directory holding the blobs. It is created when the first blob is stored.
+        """
+        self.root = Path(root)
+        # The blob of each (device, inode), built on first use by `find`
+        self._inodes = None
+        # The inodes of altered blobs whose edit a project already kept
+        self.kept = set()
+
+    @classmethod
+    def default(cls, config=None) -> 'BlobStore':
+        """
+        Retrieve the blob store in the pyscaffold cache directory.
+
+        Args:
+            config (Config or ConfigSnapshot, optional): The settings to read the cache directory from.
+                Defaults to loading the configuration.
+
+        Returns:
+            BlobStore: The store under the cache directory's 'blobs' directory.
+        """
+        return cls((config or Config()).get_cache_directory_path() / 'blobs')
+
+    @staticmethod
+    def digest(content: bytes) -> str:
+        """
+        Compute the name of a blob.
+
+        Args:
+            content (bytes): The blob's content.
+
+        Returns:
+            str: The hexadecimal SHA-256 of the content.
+        """
+        return hashlib.sha256(content).hexdigest()
+
+    def path(self, digest: str) -> Path:
+        """
+        Retrieve the path of a blob, fanned out by the first two characters of its name.
+
+        Args:
+            digest (str): The name of the blob.
+
+        Returns:
+            Path: The blob's path in the store.
+        """
+        return self.root / digest[:2] / digest[2:]
+
+    def put(self, content: bytes) -> Path:
+        """
+        Store a blob, unless a blob with the same content is already stored.
+
+        The blob is written next to its final path and renamed into place, so concurrent
+        writers of the same content never expose a partial blob.
+
+        Args:
+            content (bytes): The blob's content.
+
+        Returns:
+            Path: The path of the stored blob.
+        """
+        path = self.path(self.digest(content))
+        if path.exists():
+            return path
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_name(f'.{path.name}.{os.getpid()}.{threading.get_ident()}')
+        write_file(temporary, content, BLOB_MODE)
+        os.replace(temporary, path)
+        return path
+
+    def link(self, content: bytes, target: Path, dir_fd: int = None) -> bool:
+        """
+        Create a file as a hardlink to the blob holding its content.
+
+        If the file cannot be linked, e.g. because the store is on another filesystem,
+        it is written as a regular copy instead.
+
+        Args:
+            content (bytes): The file's content.
+            target (Path): The path of the file to create, which must not exist.
+            dir_fd (int, optional): A directory descriptor a relative target is resolved from.
+
+        Returns:
+            bool: True if the file was linked, False if it was written as a copy.
+
+        Raises:
+            OSError: If the file can neither be linked nor written.
+        """
+        try:
+            os.link(self.put(content), target, dst_dir_fd=dir_fd)
+            return True
+        except OSError as e:
+            if e.errno not in LINK_FALLBACK_ERRORS:
+                raise
+
+        write_file(target, content, FILE_MODE, dir_fd)
+        return False
+
+    def evict(self, blob: Path) -> Path:
+        """
+        Move a blob that was modified in place out of the store's content names.
+
+        New files are no longer linked to it, but it is kept under 'altered' until the last
+        file still sharing it has been restored, so those files can still be found.
+
+        Args:
+            blob (Path): The altered blob.
+
+        Returns:
+            Path: The blob's path under 'altered', or None if no file shares it anymore and it was deleted.
+        """
+        altered = self.root / ALTERED_DIRECTORY
+        stat = blob.stat()
+        key = (stat.st_dev, stat.st_ino)
+        if blob.parent != altered:
+            altered.mkdir(parents=True, exist_ok=True)
+            evicted = altered / f'{blob.parent.name}{blob.name}'
+            os.replace(blob, evicted)
+            blob = evicted
+        if stat.st_nlink == 1:
+            blob.unlink()
+            blob = None
+        if self._inodes is not None:
+            if blob is None:
+                self._inodes.pop(key, None)
+            else:
+                self._inodes[key] = blob
+        return blob
+
+    def find(self, stat: os.stat_result) -> Path:
+        """
+        Find the blob a file is linked to.
+
+        The store is scanned once, on the first call, into a map of every blob's inode.
+        Blobs stored afterwards are not in the map; they hold their original content, so
+        their files are recognised by name instead.
+
+        Args:
+            stat (os.stat_result): The status of the file.
+
+        Returns:
+            Path: The blob sharing the file's inode, or None if there is none.
+        """
+        if self._inodes is None:
+            self._inodes = {}
+            if self.root.is_dir():
+                for fanout in os.scandir(self.root):
+                    if not fanout.is_dir(follow_symlinks=False):
+                        continue
+                    for entry in os.scandir(fanout.path):
+                        entry_stat = entry.stat(follow_symlinks=False)
+                        self._inodes[(entry_stat.st_dev, entry_stat.st_ino)] = Path(entry.path)
+        return self._inodes.get((stat.st_dev, stat.st_ino))
+
+def unshare(path: Path) -> None:
+    """
+    Replace a linked file with a private, writable copy of its content (copy-on-modify).
+
+    Args:
+        path (Path): The file to unshare.
+    """
+    path = Path(path)
+    content = path.read_bytes()
+    temporary = path.with_name(f'.{path.name}.{os.getpid()}')
+    write_file(temporary, content, FILE_MODE)
+    os.replace(temporary, path)
+
+def relink(path: Path, content: bytes, store: BlobStore) -> None:
+    """
+    Replace a file with a link to the blob holding its content, or a copy if it cannot be linked.
+
+    The cached bytecode of a replaced module is removed, so it is compiled again from the new source.
+
+    Args:
+        path (Path): The file to replace.
+        content (bytes): The file's content.
+        store (BlobStore): The blob store.
+    """
+    path = Path(path)
+    temporary = path.with_name(f'.{path.name}.{os.getpid()}')
+    temporary.unlink(missing_ok=True)
+    store.link(content, temporary)
+    os.replace(temporary, path)
+    invalidate_bytecode(path)
+
+def check_project(project_path: Path, tree, store: BlobStore = None, repair: bool = True) -> dict:
+    """
+    Check the shared files of a project against the blob store.
+
+    Only the files the rendered tree marks as shared are checked, and only if they share
+    their inode with another file. Such a file is 'linked' if its content still matches the
+    blob's name. A file written to in place changed every project sharing its blob: the
+    first project found holding the edit reports it as 'modified' and keeps it in a private
+    copy, and the altered blob is evicted from the store. Every other project sharing it
+    reports it as 'restored' and is linked to its rendered content again.
+
+    Which project made the edit cannot be told from the shared inode, so projects that
+    share blobs should be checked one at a time, in a stable order.
+
+    Args:
+        project_path (Path): The path of the project.
+        tree (ProjectTree): The project rendered from the current templates.
+        store (BlobStore, optional): The blob store. Defaults to the store in the cache directory.
+        repair (bool): Whether to unshare modified files and restore the others (default: True).
+
+    Returns:
+        dict: The path of each linked shared file, relative to the project, mapped to its status.
+    """
+    store = store or BlobStore.default()
+    project_path = Path(project_path)
+    statuses = {}
+
+    for path in sorted(tree.shared):
+        file_path = project_path / path
+        try:
+            stat = os.lstat(file_path)
+        except FileNotFoundError:
+            continue
+        if stat.st_nlink < 2:
+            continue
+        relative = str(path)
+        blob = store.path(store.digest(file_path.read_bytes()))
+        if blob.exists() and os.path.samestat(stat, blob.stat()):
+            statuses[relative] = 'linked'
+            continue
+
+        # Files linked elsewhere than to the store are left alone
+        altered = store.find(stat)
+        if altered is None:
+            continue
+        key = (stat.st_dev, stat.st_ino)
+        if key in store.kept or altered.parent.name == ALTERED_DIRECTORY:
+            statuses[relative] = 'restored'
+            if repair:
+                relink(file_path, tree[path], store)
+                store.evict(altered)
+        else:
+            statuses[relative] = 'modified'
+            store.kept.add(key)
+            if repair:
+                unshare(file_path)
+                store.evict(altered)
+
+    return statuses
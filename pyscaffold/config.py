@@ -3,13 +3,371 @@ Pyscaffold Config
 
 This module contains configuration definitions for the Pyscaffold application.
 
+Parsed configuration files are cached by their stamp, i.e. their resolved path,
+modification time and size. Within a process, a file is parsed once however many
+`Config` instances read it; across processes, the parsed settings are kept in a
+marshalled sidecar next to the file, so it is only parsed again once it changed.
+
+Configuration files can be written in YAML, TOML or JSON; the parser is chosen from the
+file's extension, using the fastest one available for each format.
+
+Unless a file is given, `Config` loads a layered configuration: the built-in defaults, the
+user's `~/.config/pyscaffold/config.yaml`, the `.pyscaffold.yaml` file in the projects root
+and the `PYSCAFFOLD_*` environment variables, each overriding the ones before it. The
+merged view is cached with the stamp of every layer, so only a layer that changed is read
+again, and the layers are only merged again once one of them changed.
+
+Once loaded, the settings are indexed by dotted key, such as 'locations.PROJECTS', so
+`Config.get` is a single lookup; adding or updating settings keeps the index in sync. A
+`ConfigSnapshot` is a frozen copy of the settings that is cheap to send to worker processes,
+so `start` reads the configuration once and hands the snapshot to every project's pipeline.
+
 Classes:
     colors: Defines color codes for terminal output.
-    Config: Manages configuration settings loaded from a YAML file.
+    Config: Manages configuration settings loaded from a YAML, TOML or JSON file.
+    ConfigSnapshot: A frozen, read-only copy of configuration settings, indexed by dotted key.
+
+Functions:
+    load_yaml: Parse a YAML configuration file, with libyaml when it is available.
+    load_toml: Parse a TOML configuration file.
+    load_json: Parse a JSON configuration file.
+    parse_file: Parse a configuration file with the backend matching its extension.
+    file_stamp: Compute the stamp a configuration file is cached under.
+    sidecar_path: Retrieve the path of a configuration file's sidecar.
+    read_sidecar: Read the parsed settings of a configuration file from its sidecar.
+    write_sidecar: Write the parsed settings of a configuration file to its sidecar.
+    default_config_path: Retrieve the path of the built-in default configuration.
+    user_config_path: Retrieve the path of the user's configuration.
+    cache_directory_path: Resolve the pyscaffold cache directory, creating it if needed.
+    projects_config_path: Retrieve the path of the configuration shared by the projects under a projects root.
+    environment_settings: Read settings from the 'PYSCAFFOLD_*' environment variables.
+    merge_settings: Merge a configuration layer over the settings below it.
+    read_layer: Retrieve the settings of a configuration layer, reading them only if its stamp changed.
+    read_file_layer: Retrieve the settings of a configuration layer held in a file, which may not exist.
+    flatten: Walk nested settings, yielding the dotted key of every setting and section.
 """
 
-import yaml
+import os
+import copy
+import json
+import marshal
 from pathlib import Path
+from types import MappingProxyType
+
+SIDECAR_VERSION = 1
+
+CONFIG_FILE = 'config.yaml'
+
+PROJECTS_CONFIG_FILE = '.pyscaffold.yaml'
+
+ENV_PREFIX = 'PYSCAFFOLD_'
+
+def load_yaml(file) -> dict:
+    """
+    Parse a YAML configuration file, with libyaml's `CSafeLoader` when it is available.
+
+    Args:
+        file (file object): The configuration file, opened in binary mode.
+
+    Returns:
+        dict: The parsed settings.
+    """
+    import yaml
+
+    return yaml.load(file, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
+def load_toml(file) -> dict:
+    """
+    Parse a TOML configuration file with the standard library's `tomllib`.
+
+    Args:
+        file (file object): The configuration file, opened in binary mode.
+
+    Returns:
+        dict: The parsed settings.
+    """
+    import tomllib
+
+    return tomllib.load(file)
+
+def load_json(file) -> dict:
+    """
+    Parse a JSON configuration file.
+
+    Args:
+        file (file object): The configuration file, opened in binary mode.
+
+    Returns:
+        dict: The parsed settings.
+    """
+    return json.load(file)
+
+# The parser of each supported configuration file extension
+BACKENDS = {
+    '.yaml': load_yaml,
+    '.yml': load_yaml,
+    '.toml': load_toml,
+    '.json': load_json
+}
+
+def parse_file(config_path) -> dict:
+    """
+    Parse a configuration file with the backend matching its extension.
+
+    Args:
+        config_path (str or Path): Path to the configuration file.
+
+    Returns:
+        dict: The parsed settings.
+
+    Raises:
+        ValueError: If the file's extension has no backend.
+    """
+    suffix = Path(config_path).suffix.lower()
+    if suffix not in BACKENDS:
+        raise ValueError(f"Unsupported configuration file '{config_path}'. Use one of: {', '.join(BACKENDS)}.")
+    with open(config_path, 'rb') as file:
+        return BACKENDS[suffix](file)
+
+# The marshalled settings of each parsed configuration file, by resolved path, with their stamp
+_parse_cache = {}
+
+def file_stamp(config_path) -> tuple:
+    """
+    Compute the stamp a configuration file is cached under.
+
+    Args:
+        config_path (str or Path): Path to the configuration file.
+
+    Returns:
+        tuple: The file's resolved path, modification time in nanoseconds and size.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    path = Path(config_path).resolve()
+    stat = os.stat(path)
+    return (str(path), stat.st_mtime_ns, stat.st_size)
+
+def sidecar_path(config_path) -> Path:
+    """
+    Retrieve the path of a configuration file's sidecar.
+
+    Args:
+        config_path (str or Path): Path to the configuration file.
+
+    Returns:
+        Path: The hidden '.<name>.marshal' file next to the configuration file.
+    """
+    path = Path(config_path)
+    return path.with_name(f'.{path.name}.marshal')
+
+def read_sidecar(stamp: tuple) -> bytes:
+    """
+    Read the parsed settings of a configuration file from its sidecar.
+
+    Args:
+        stamp (tuple): The configuration file's current stamp, as computed by `file_stamp`.
+
+    Returns:
+        bytes: The marshalled settings, or None if there is no sidecar or it is stale or unreadable.
+    """
+    try:
+        with open(sidecar_path(stamp[0]), 'rb') as f:
+            version, sidecar_stamp, data = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if version != SIDECAR_VERSION or sidecar_stamp != stamp or not isinstance(data, bytes):
+        return None
+    return data
+
+def write_sidecar(stamp: tuple, data: bytes) -> bool:
+    """
+    Write the parsed settings of a configuration file to its sidecar, replacing it atomically.
+
+    Args:
+        stamp (tuple): The configuration file's stamp when it was parsed.
+        data (bytes): The marshalled settings.
+
+    Returns:
+        bool: True if the sidecar was written, False if its directory is not writable.
+    """
+    path = sidecar_path(stamp[0])
+    temporary = path.with_name(f'{path.name}.{os.getpid()}')
+    try:
+        with open(temporary, 'wb') as f:
+            marshal.dump((SIDECAR_VERSION, stamp, data), f)
+        os.replace(temporary, path)
+    except OSError:
+        try:
+            os.unlink(temporary)
+        except OSError:
+            pass
+        return False
+    return True
+
+# The settings of each configuration layer, by layer name, with the stamp they were read under
+_layer_cache = {}
+
+# The marshalled merge of the layers, by the layers' stamps; only the latest merge is kept
+_merged_cache = {}
+
+def default_config_path() -> Path:
+    """
+    Retrieve the path of the built-in default configuration.
+
+    Returns:
+        Path: The 'config.yaml' shipped with the package.
+    """
+    return Path(__file__).resolve().parent.parent / CONFIG_FILE
+
+def user_config_path() -> Path:
+    """
+    Retrieve the path of the user's configuration.
+
+    Returns:
+        Path: 'pyscaffold/config.yaml' under $XDG_CONFIG_HOME, or under ~/.config when that is unset.
+    """
+    return Path(os.getenv('XDG_CONFIG_HOME') or Path.home() / '.config') / 'pyscaffold' / CONFIG_FILE
+
+def cache_directory_path(setting: str = None) -> Path:
+    """
+    Resolve the pyscaffold cache directory, creating it if needed.
+
+    Args:
+        setting (str, optional): The 'locations.CACHE' setting, which takes precedence; otherwise
+            the directory is 'pyscaffold' under $XDG_CACHE_HOME, or under ~/.cache when that is unset.
+
+    Returns:
+        Path: The resolved cache directory pathname.
+    """
+    if setting:
+        path = Path(setting).expanduser()
+    else:
+        path = Path(os.getenv('XDG_CACHE_HOME') or Path.home() / '.cache') / 'pyscaffold'
+
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+def projects_config_path(*layers) -> Path:
+    """
+    Retrieve the path of the configuration shared by the projects under a projects root.
+
+    Args:
+        layers (dict): The settings of the layers that may name the projects root as
+            'locations.PROJECTS', the last one taking precedence.
+
+    Returns:
+        Path: The '.pyscaffold.yaml' file in the projects root, or None if no root is set.
+    """
+    for settings in reversed(layers):
+        locations = settings.get('locations')
+        projects = locations.get('PROJECTS') if isinstance(locations, dict) else None
+        if projects:
+            return Path(projects).expanduser() / PROJECTS_CONFIG_FILE
+    return None
+
+def environment_settings(environ=None) -> dict:
+    """
+    Read settings from the environment.
+
+    A variable named 'PYSCAFFOLD_<SECTION>_<KEY>' sets the setting '<section>.<KEY>', e.g.
+    'PYSCAFFOLD_VENV_POOL_SIZE' sets 'venv.POOL_SIZE'. Integers, floats and booleans
+    written as JSON are converted; any other value is kept as a string.
+
+    Args:
+        environ (mapping, optional): The environment to read. Defaults to `os.environ`.
+
+    Returns:
+        dict: The settings, by section.
+    """
+    settings = {}
+    for name, value in (os.environ if environ is None else environ).items():
+        section, _, key = name[len(ENV_PREFIX):].partition('_')
+        if not name.startswith(ENV_PREFIX) or not section or not key:
+            continue
+        try:
+            parsed = json.loads(value)
+        except ValueError:
+            parsed = value
+        if isinstance(parsed, (bool, int, float)):
+            value = parsed
+        settings.setdefault(section.lower(), {})[key] = value
+    return settings
+
+def merge_settings(base: dict, layer: dict) -> dict:
+    """
+    Merge a configuration layer over the settings below it.
+
+    Args:
+        base (dict): The settings of the layers below.
+        layer (dict): The settings of the layer, which take precedence.
+
+    Returns:
+        dict: The merged settings. Sections present in both are merged recursively; neither
+            argument is modified.
+    """
+    merged = dict(base)
+    for key, value in layer.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            value = merge_settings(merged[key], value)
+        merged[key] = value
+    return merged
+
+def read_layer(name: str, stamp: tuple, read) -> dict:
+    """
+    Retrieve the settings of a configuration layer, reading them only if its stamp changed.
+
+    Args:
+        name (str): The name of the layer.
+        stamp (tuple): The layer's current stamp.
+        read (callable): Reads the layer's settings.
+
+    Returns:
+        dict: The layer's settings, shared with the cache; they must not be modified.
+    """
+    cached = _layer_cache.get(name)
+    if cached is None or cached[0] != stamp:
+        cached = _layer_cache[name] = (stamp, read())
+    return cached[1]
+
+def read_file_layer(name: str, config_path) -> tuple:
+    """
+    Retrieve the settings of a configuration layer held in a file, which may not exist.
+
+    Args:
+        name (str): The name of the layer.
+        config_path (str or Path): Path to the layer's configuration file, or None for no file.
+
+    Returns:
+        tuple: The layer's stamp and its settings, which are empty when there is no file.
+    """
+    try:
+        stamp = file_stamp(config_path) if config_path is not None else None
+    except OSError:
+        stamp = (str(config_path), None)
+    if stamp is None or stamp[1] is None:
+        return stamp, {}
+    return stamp, read_layer(name, stamp, lambda: Config.read_settings(config_path) or {})
+
+def flatten(settings, prefix: str = None):
+    """
+    Walk nested settings, yielding the dotted key of every setting and section.
+
+    Args:
+        settings: The settings, or a single value.
+        prefix (str, optional): The dotted key of `settings` itself, which is yielded first.
+
+    Yields:
+        tuple: Each dotted key, such as 'locations.PROJECTS', with its value. Sections are
+            yielded with their dict, before the settings they hold.
+    """
+    if prefix is not None:
+        yield prefix, settings
+    if isinstance(settings, (dict, MappingProxyType)):
+        for key, value in settings.items():
+            if isinstance(key, str):
+                yield from flatten(value, key if prefix is None else f'{prefix}.{key}')
 
 class colors():
     """Defines color codes for terminal output."""
@@ -25,7 +383,7 @@ class colors():
 
 class Config():
     """
-    Manages configuration settings loaded from a YAML file.
+    Manages configuration settings loaded from a YAML, TOML or JSON file.
 
     Attributes:
         settings (dict): The dictionary to store configuration settings.
@@ -35,42 +393,136 @@ class Config():
         Initializes the Config instance, loading settings from the specified file.
 
         Args:
-            config_path (str or Path, optional): Path to the YAML configuration file. Defaults to 'config.yaml' in the parent directory.
+            config_path (str or Path, optional): Path to the YAML, TOML or JSON configuration file. Defaults to the
+                layered configuration, see `load_layers`.
         """
         self.settings = {}
+        self.index = {}
         if config_path is None:
-            config_path = Path(__file__).resolve().parent.parent / 'config.yaml'
-        self.load_from_file(config_path)
+            self.load_layers()
+        else:
+            self.load_from_file(config_path)
+
+    def load_layers(self):
+        """
+        Load the layered configuration, and index it by dotted key.
+
+        The layers, each overriding the ones before it, are the built-in defaults, the user's
+        configuration, the '.pyscaffold.yaml' file in the projects root and the 'PYSCAFFOLD_*'
+        environment variables. The projects root is the 'locations.PROJECTS' setting of the
+        other layers. Missing files are skipped.
+
+        Each layer is only read again once its stamp changed, and the layers are only merged
+        again once one of them changed. Each instance gets its own copy of the merged settings.
+
+        Raises:
+            ValueError: If a layer's file extension has no backend.
+        """
+        environment = {name: value for name, value in os.environ.items() if name.startswith(ENV_PREFIX)}
+        default_stamp, defaults = read_file_layer('default', default_config_path())
+        user_stamp, user = read_file_layer('user', user_config_path())
+        environment_stamp = tuple(sorted(environment.items()))
+        overrides = read_layer('environment', environment_stamp, lambda: environment_settings(environment))
+        root = projects_config_path(defaults, user, overrides)
+        projects_stamp, projects = read_file_layer('projects', root)
+
+        stamps = (default_stamp, user_stamp, projects_stamp, environment_stamp)
+        data = _merged_cache.get(stamps)
+        if data is not None:
+            settings = marshal.loads(data)
+        else:
+            settings = merge_settings({}, defaults)
+            for layer in (user, projects, overrides):
+                settings = merge_settings(settings, layer)
+            try:
+                data = marshal.dumps(settings)
+            except ValueError:
+                # Settings marshal cannot represent, such as dates, are merged every time
+                settings = copy.deepcopy(settings)
+            else:
+                _merged_cache.clear()
+                _merged_cache[stamps] = data
+                settings = marshal.loads(data)
+
+        self.settings = settings
+        self.index = dict(flatten(self.settings))
 
     def load_from_file(self, config_path):
         """
-        Load configuration settings from a YAML file.
+        Load configuration settings from a YAML, TOML or JSON file, and index them by dotted key.
+
+        The file is only parsed if neither the process-wide cache nor its sidecar hold
+        settings parsed from it with its current stamp. Each instance gets its own copy
+        of the settings, so changing them does not affect other instances.
         
         Args:
-            config_path (str): Path to the YAML configuration file.
+            config_path (str): Path to the configuration file. Its extension selects the parser.
+
+        Raises:
+            ValueError: If the file's extension has no backend.
+        """
+        self.settings = self.read_settings(config_path)
+        self.index = dict(flatten(self.settings))
+
+    @staticmethod
+    def read_settings(config_path):
+        """
+        Read the settings of a configuration file, from the parse cache or its sidecar when they are current.
+
+        Args:
+            config_path (str): Path to the configuration file.
+
+        Returns:
+            dict: A copy of the file's settings that the caller owns.
+
+        Raises:
+            ValueError: If the file's extension has no backend.
         """
-        with open(config_path, 'r') as file:
-            self.settings = yaml.safe_load(file)
+        stamp = file_stamp(config_path)
+        cached = _parse_cache.get(stamp[0])
+        if cached is not None and cached[0] == stamp:
+            return marshal.loads(cached[1])
+
+        data = read_sidecar(stamp)
+        if data is None:
+            settings = parse_file(config_path)
+            try:
+                data = marshal.dumps(settings)
+            except ValueError:
+                # Settings marshal cannot represent, such as dates, are parsed every time
+                return settings
+            write_sidecar(stamp, data)
+            _parse_cache[stamp[0]] = (stamp, data)
+            return settings
+
+        _parse_cache[stamp[0]] = (stamp, data)
+        return marshal.loads(data)
 
     def get(self, key, default=None):
         """
         Retrieve a configuration value by its key.
         
         Args:
-            key (str): The key to look up in the configuration.
+            key (str): The key to look up in the configuration, e.g. 'locations.PROJECTS'.
             default: The default value to return if the key is not found.
         
         Returns:
             any: The value associated with the key, or the default value.
         """
-        keys = key.split('.')
-        value = self.settings
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k, default)
-            else:
-                return default
-        return value
+        return self.index.get(key, default)
+
+    def _set_index(self, key, value):
+        """
+        Replace the index entries of a setting and everything below it.
+
+        Args:
+            key (str): The dotted key of the setting.
+            value: The setting's new value.
+        """
+        if key in self.index:
+            for old_key, _ in flatten(self.index[key], key):
+                del self.index[old_key]
+        self.index.update(flatten(value, key))
 
     def add_setting(self, name, **kwargs):
         """
@@ -84,6 +536,7 @@ class Config():
             Config: The current instance of the Config class.
         """
         self.settings[name] = kwargs
+        self._set_index(name, kwargs)
         return self
 
     def update_setting(self, name, **kwargs):
@@ -99,10 +552,25 @@ class Config():
         """
         if name in self.settings:
             self.settings[name].update(kwargs)
+            for key, value in kwargs.items():
+                self._set_index(f'{name}.{key}', value)
         else:
             self.settings[name] = kwargs
+            self._set_index(name, kwargs)
         return self
 
+    def snapshot(self) -> 'ConfigSnapshot':
+        """
+        Take a frozen, read-only copy of the current settings.
+
+        Returns:
+            ConfigSnapshot: The snapshot, answering `get` like this instance does now.
+        """
+        return ConfigSnapshot(
+            (key, value) for key, value in self.index.items()
+            if not isinstance(value, dict) or not value
+        )
+
     def display(self):
         """
         Display all configuration settings.
@@ -118,11 +586,12 @@ class Config():
             Path: The resolved projects directory pathname.
         
         Raises:
-            ValueError: If the resolved path does not exist.
+            ValueError: If the setting is unset or the resolved path does not exist.
         """
-        path = Path(self.get("locations.PROJECTS"))
+        path = self.get("locations.PROJECTS")
+        path = Path(path).expanduser() if path else None
 
-        if not path.exists():
+        if path is None or not path.exists():
             raise ValueError('Projects directory has not been set.')
         
         return path
@@ -148,3 +617,87 @@ class Config():
             raise ValueError('Tests directory does not exist.')
         
         return path
+
+    def get_cache_directory_path(self) -> Path:
+        """
+        Retrieve the path to the pyscaffold cache directory, creating it if needed.
+
+        The 'locations.CACHE' setting takes precedence; otherwise the directory is
+        'pyscaffold' under $XDG_CACHE_HOME, or under ~/.cache when that is unset.
+
+        Returns:
+            Path: The resolved cache directory pathname.
+        """
+        return cache_directory_path(self.get("locations.CACHE"))
+
+class ConfigSnapshot():
+    """
+    A frozen, read-only copy of configuration settings, indexed by dotted key.
+
+    Only the individual settings are stored and pickled; the sections are rebuilt as
+    read-only mappings when the snapshot is created, e.g. in a worker process.
+    """
+    __slots__ = ('_settings', '_index')
+
+    def __init__(self, settings):
+        """
+        Initialize the snapshot.
+
+        Args:
+            settings (iterable of tuple): The dotted key and value of every setting that is not a section.
+        """
+        settings = tuple(settings)
+        nested = {}
+        for key, value in settings:
+            *sections, name = key.split('.')
+            node = nested
+            for section in sections:
+                node = node.setdefault(section, {})
+            node[name] = value
+        object.__setattr__(self, '_settings', settings)
+        object.__setattr__(self, '_index', dict(flatten(_freeze(nested))))
+
+    def get(self, key, default=None):
+        """
+        Retrieve a configuration value by its key.
+
+        Args:
+            key (str): The key to look up in the configuration, e.g. 'locations.PROJECTS'.
+            default: The default value to return if the key is not found.
+
+        Returns:
+            any: The value associated with the key, or the default value. Sections are read-only mappings.
+        """
+        return self._index.get(key, default)
+
+    def get_cache_directory_path(self) -> Path:
+        """
+        Retrieve the path to the pyscaffold cache directory, creating it if needed.
+
+        Returns:
+            Path: The resolved cache directory pathname.
+        """
+        return cache_directory_path(self.get("locations.CACHE"))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"'{type(self).__name__}' object is read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"'{type(self).__name__}' object is read-only")
+
+    def __reduce__(self):
+        return (type(self), (self._settings,))
+
+def _freeze(settings):
+    """
+    Turn nested settings into read-only mappings.
+
+    Args:
+        settings: The settings, or a single value.
+
+    Returns:
+        The value, with every dict replaced by a read-only mapping.
+    """
+    if isinstance(settings, (dict, MappingProxyType)):
+        return MappingProxyType({key: _freeze(value) for key, value in settings.items()})
+    return settings
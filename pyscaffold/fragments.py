@@ -1,7 +1,9 @@
 """
 Pyscaffold Fragments
 
-This module contains format strings used to load boilerplate code in the Pyscaffold application.
+This module contains the templates used to load boilerplate code in the Pyscaffold application.
+Placeholders are written `${ProjectName}` and `${packagename}` and are rendered by
+`pyscaffold.templates`, so the braces of the generated code are written as they are.
 
 """
 
@@ -19,9 +21,9 @@ pyscaffold_ascii = '\033[36m'  + r"""
 
 PKG_CONFIG_PY = (
     "\"\"\"\n"
-    "{ProjectName} Config\n"
+    "${ProjectName} Config\n"
     "\n"
-    "This module contains configuration definitions for the {ProjectName} application.\n"
+    "This module contains configuration definitions for the ${ProjectName} application.\n"
     "\n"
     "\"\"\"\n"
     "import yaml\n"
@@ -40,7 +42,7 @@ PKG_CONFIG_PY = (
     "\n"    
     "class Config():\n"
     "    def __init__(self, config_path=None):\n"
-    "        self.settings = {{}}\n"
+    "        self.settings = {}\n"
     "        if config_path is None:\n"
     "            config_path = Path(__file__).resolve().parent.parent / 'config.yaml'\n"
     "        self.load_from_file(config_path)\n"
@@ -138,17 +140,17 @@ PKG_CONFIG_PY = (
 
 PKG_HELPERS_PY = (
     "\"\"\"\n"
-    "{ProjectName} Helpers\n"
+    "${ProjectName} Helpers\n"
     "\n"
-    "This module contains helper function definitions for the {ProjectName} application.\n"
+    "This module contains helper function definitions for the ${ProjectName} application.\n"
     "\"\"\"\n"
 )
 
 PKG_UTILS_PY = (
     "\"\"\"\n"
-    "{ProjectName} Utilities\n"
+    "${ProjectName} Utilities\n"
     "\n"
-    "This module contains utility function definitions for the {ProjectName} application.\n"
+    "This module contains utility function definitions for the ${ProjectName} application.\n"
     "\n"
     "\"\"\"\n"
     "import argparse\n"
@@ -171,52 +173,52 @@ PKG_UTILS_PY = (
 
 PKG_MODULE_PY = (
     "\"\"\"\n"
-    "{ProjectName}\n"
+    "${ProjectName}\n"
     "\n"
-    "This module contains the class definition for the {ProjectName} class.\n"
+    "This module contains the class definition for the ${ProjectName} class.\n"
     "\n"
     "\"\"\"\n"
-    "class {ProjectName}():\n"
+    "class ${ProjectName}():\n"
     "    @staticmethod\n"
     "    def subcommand1(*args, **kwargs):\n"
-    "        print('In {packagename} -> args: ', args)\n"
-    "        print('In {packagename} -> kwargs: ', kwargs)\n"
+    "        print('In ${packagename} -> args: ', args)\n"
+    "        print('In ${packagename} -> kwargs: ', kwargs)\n"
     "        return\n"
     "\n"
     "    @staticmethod\n"
     "    def subcommand2(*args, **kwargs):\n"
-    "        print('In {packagename} -> args: ', args)\n"
-    "        print('In {packagename} -> kwargs: ', kwargs)\n"
+    "        print('In ${packagename} -> args: ', args)\n"
+    "        print('In ${packagename} -> kwargs: ', kwargs)\n"
     "        return\n"
     "\n"
     "    @staticmethod\n"
     "    def subcommand3(*args, **kwargs):\n"
-    "        print('In {packagename} -> args: ', args)\n"
-    "        print('In {packagename} -> kwargs: ', kwargs)\n"
+    "        print('In ${packagename} -> args: ', args)\n"
+    "        print('In ${packagename} -> kwargs: ', kwargs)\n"
     "        return\n"
     "\n"
 )
 
 PKG_ARG_PARSER_PY = (
     "\"\"\"\n"
-    "{ProjectName} Argument Parser\n"
+    "${ProjectName} Argument Parser\n"
     "\n"
-    "This module contains the argument parsing functionality of the {ProjectName} application.\n"
+    "This module contains the argument parsing functionality of the ${ProjectName} application.\n"
     "\n"
     "\"\"\"\n"
     "import argparse\n"
-    "from {packagename}.config import colors\n"
+    "from ${packagename}.config import colors\n"
     "\n"
     "def create_parser():\n"
     "    parser = argparse.ArgumentParser(\n"
-    "        prog='{packagename}',\n"
+    "        prog='${packagename}',\n"
     "        fromfile_prefix_chars='@',\n"
     "        usage=(\n"
-    "            f'{{colors.BOLD}}%(prog)s{{colors.ENDC}} '\n"
-    "            f'{{colors.OKCYAN}}COMMAND{{colors.ENDC}} '\n"
-    "            f'{{colors.WARNING}}[{{colors.ENDC}}OPTION{{colors.WARNING}}]{{colors.ENDC}} '\n"
-    "            f'{{colors.OKBLUE}}PROJECTA{{colors.ENDC}} '\n"
-    "            f'{{colors.WARNING}}[{{colors.ENDC}}{{colors.OKBLUE}}PROJECTB{{colors.ENDC}} ...{{colors.WARNING}}]{{colors.ENDC}}'\n"
+    "            f'{colors.BOLD}%(prog)s{colors.ENDC} '\n"
+    "            f'{colors.OKCYAN}COMMAND{colors.ENDC} '\n"
+    "            f'{colors.WARNING}[{colors.ENDC}OPTION{colors.WARNING}]{colors.ENDC} '\n"
+    "            f'{colors.OKBLUE}PROJECTA{colors.ENDC} '\n"
+    "            f'{colors.WARNING}[{colors.ENDC}{colors.OKBLUE}PROJECTB{colors.ENDC} ...{colors.WARNING}]{colors.ENDC}'\n"
     "        ),\n"
     "        formatter_class=argparse.RawDescriptionHelpFormatter,\n"
     "    )\n"
@@ -241,16 +243,16 @@ PKG_ARG_PARSER_PY = (
 
 PKG_MAIN_PY = (
     "\"\"\"\n"
-    "Entry point for the {ProjectName} application.\n"
+    "Entry point for the ${ProjectName} application.\n"
     "\n"    
-    "This script serves as the main entry point for the {ProjectName} application. \n"
+    "This script serves as the main entry point for the ${ProjectName} application. \n"
     "It initializes the application, processes command-line arguments, and \n"
     "starts the main functionality of the project.\n"
     "\n"
     "Usage:\n"
-    "    {packagename} subcommand1 <argument> [options]\n"
-    "    {packagename} subcommand2 <argument> [options]\n"
-    "    {packagename} subcommand3 <argument> [options]\n"
+    "    ${packagename} subcommand1 <argument> [options]\n"
+    "    ${packagename} subcommand2 <argument> [options]\n"
+    "    ${packagename} subcommand3 <argument> [options]\n"
     "\n"
     "Arguments:\n"
     "    -h, --help      Show this help message and exit.\n"
@@ -262,22 +264,22 @@ PKG_MAIN_PY = (
     "\n"
     "\"\"\"\n"
     "\n"
-    "from {packagename}.{packagename} import {ProjectName}\n"
-    "from {packagename}.arg_parser import create_parser\n"
-    "from {packagename}.utils import preprocess_arguments\n"
+    "from ${packagename}.${packagename} import ${ProjectName}\n"
+    "from ${packagename}.arg_parser import create_parser\n"
+    "from ${packagename}.utils import preprocess_arguments\n"
     "\n"
-    "SUBCOMMANDS = {{\n"
-    "    'subcommand1': {ProjectName}.subcommand1,\n"
-    "    'subcommand2': {ProjectName}.subcommand2,\n"
-    "    'subcommand3': {ProjectName}.subcommand3\n"
-    "}}\n"
+    "SUBCOMMANDS = {\n"
+    "    'subcommand1': ${ProjectName}.subcommand1,\n"
+    "    'subcommand2': ${ProjectName}.subcommand2,\n"
+    "    'subcommand3': ${ProjectName}.subcommand3\n"
+    "}\n"
     "\n"
     "def execute(command, args):\n"
     "    func = SUBCOMMANDS[command]\n"
     "    try:\n"
     "        result = func(**vars(args))\n"
     "    except Exception as e:\n"
-    "        print(f'Error: {{e}}')\n"
+    "        print(f'Error: {e}')\n"
     "    else:\n"
     "        return result\n"
     "\n"
@@ -291,14 +293,14 @@ PKG_MAIN_PY = (
 
 TEST_CONFIG_PY = (
     "\"\"\"\n"
-    "{ProjectName} Test Configuration\n"
+    "${ProjectName} Test Configuration\n"
     "\n"
-    "This module contains tests for the {ProjectName} configuration settings.\n"
+    "This module contains tests for the ${ProjectName} configuration settings.\n"
     "\n"
     "\"\"\"\n"
     "\n"
     "import pytest\n"
-    "from {packagename}.config import Config\n"
+    "from ${packagename}.config import Config\n"
     "\n"
     "sample_config = \"\"\"\n"
     "collection:\n"
@@ -343,20 +345,20 @@ TEST_CONFIG_PY = (
 
 TEST_HELPERS_PY = (
     "\"\"\"\n"
-    "{ProjectName} Test Helpers\n"
+    "${ProjectName} Test Helpers\n"
     "\n"
-    "This module contains tests for the {ProjectName} helper functions.\n"
+    "This module contains tests for the ${ProjectName} helper functions.\n"
     "\n"
     "\"\"\"\n"
     "import pytest\n"
-    "from {packagename}.helpers import * # Use explicit imports\n"
+    "from ${packagename}.helpers import * # Use explicit imports\n"
 )
 
 TEST_UTILS_PY = (
     "\"\"\"\n"
-    "{ProjectName} Test Utilities\n"
+    "${ProjectName} Test Utilities\n"
     "\n"
-    "This module contains tests for the {ProjectName} utility functions.\n"
+    "This module contains tests for the ${ProjectName} utility functions.\n"
     "\n"
     "\"\"\"\n"
     "import shutil\n"
@@ -365,8 +367,8 @@ TEST_UTILS_PY = (
     "\n"
     "import pytest\n"
     "\n"
-    "from {packagename}.config import Config\n"
-    "from {packagename}.utils import *\n"
+    "from ${packagename}.config import Config\n"
+    "from ${packagename}.utils import *\n"
     "\n"
     "@pytest.fixture(scope='function')\n"
     "def setup_and_teardown():\n"
@@ -397,17 +399,17 @@ TEST_UTILS_PY = (
 
 TEST_PACKAGE_MODULE_PY = (
     "\"\"\"\n"
-    "{ProjectName} Tests\n"
+    "${ProjectName} Tests\n"
     "\n"
-    "This module contains tests for the {ProjectName} class.\n"
+    "This module contains tests for the ${ProjectName} class.\n"
     "\n"
     "\"\"\"\n"
     "import shutil\n"
     "\n"
     "import pytest\n"
     "\n"
-    "from {packagename}.config import Config\n"
-    "from {packagename}.{packagename} import {ProjectName}\n"
+    "from ${packagename}.config import Config\n"
+    "from ${packagename}.${packagename} import ${ProjectName}\n"
     "\n"
     "@pytest.fixture(scope='function')\n"
     "def setup_and_teardown():\n"
@@ -424,34 +426,34 @@ TEST_PACKAGE_MODULE_PY = (
     "\n"
     "def test_subcommand1(setup_and_teardown):\n"
     "    dummy_dir, config = setup_and_teardown\n"
-    "    assert {ProjectName}.subcommand1 == True\n"
+    "    assert ${ProjectName}.subcommand1 == True\n"
     "\n"
     "def test_subcommand2(setup_and_teardown):\n"
     "    dummy_dir, config = setup_and_teardown\n"
-    "    assert {ProjectName}.subcommand2 == True\n"
+    "    assert ${ProjectName}.subcommand2 == True\n"
     "\n"
     "def test_subcommand3(setup_and_teardown):\n"
     "    dummy_dir, config = setup_and_teardown\n"
-    "    assert {ProjectName}.subcommand3 == True\n"
+    "    assert ${ProjectName}.subcommand3 == True\n"
     "\n"
 )
 
 TEST_PKG_ARG_PARSER_PY = (
     "\"\"\"\n"
-    "{ProjectName} Test Arg Parser\n"
+    "${ProjectName} Test Arg Parser\n"
     "\n"
-    "This module contains tests for the {ProjectName} argument parser functionality.\n"
+    "This module contains tests for the ${ProjectName} argument parser functionality.\n"
     "\n"
     "\"\"\"\n"
     "import pytest\n"
-    "from {packagename}.arg_parser import create_parser\n"
+    "from ${packagename}.arg_parser import create_parser\n"
     "\n"
     "def test_version_option(capsys):\n"
     "    parser = create_parser()\n"
     "    with pytest.raises(SystemExit):\n"
     "        parser.parse_args(['--version'])\n"
     "    captured = capsys.readouterr()\n"
-    "    assert '{packagename} 1.0.0' in captured.out\n"
+    "    assert '${packagename} 1.0.0' in captured.out\n"
     "\n"
     "def test_subcommand1():\n"
     "    parser = create_parser()\n"
@@ -476,9 +478,9 @@ TEST_PKG_ARG_PARSER_PY = (
 
 TEST_CLI_PY = (
     "\"\"\"\n"
-    "{ProjectName} Test CLI\n"
+    "${ProjectName} Test CLI\n"
     "\n"
-    "This module contains tests for the {ProjectName} CLI.\n"
+    "This module contains tests for the ${ProjectName} CLI.\n"
     "\n"
     "\"\"\"\n"
     "import shutil\n"
@@ -487,7 +489,7 @@ TEST_CLI_PY = (
     "\n"
     "import pytest\n"
     "\n"
-    "from {packagename}.config import Config\n"
+    "from ${packagename}.config import Config\n"
     "\n"
     "@pytest.fixture(scope='function', autouse=True)\n"
     "def setup_and_teardown():\n"
@@ -509,7 +511,7 @@ TEST_CLI_PY = (
     "@pytest.mark.skip(reason=REASON)\n"
     "@pytest.mark.script_launch_mode('subprocess')\n"
     "def test_cli_help(script_runner):\n"
-    "    result = script_runner.run(['{packagename}', '--help'])\n"
+    "    result = script_runner.run(['${packagename}', '--help'])\n"
     "    assert result.success\n"
     "    assert 'usage' in result.stdout\n"
     "    assert result.stderr == ''\n"
@@ -517,7 +519,7 @@ TEST_CLI_PY = (
     "@pytest.mark.skip(reason=REASON)\n"
     "@pytest.mark.script_launch_mode('subprocess')\n"
     "def test_cli_version(script_runner):\n"
-    "    result = script_runner.run(['{packagename}', '--version'])\n"
+    "    result = script_runner.run(['${packagename}', '--version'])\n"
     "    assert result.success\n"
     "    assert '0.1.0' in result.stdout  # Adjust based on your actual version\n"
     "    assert result.stderr == ''\n"
@@ -526,19 +528,19 @@ TEST_CLI_PY = (
     "@pytest.mark.script_launch_mode('subprocess')\n"
     "def test_subcommand1(script_runner, setup_and_teardown):\n"
     "    dummy_projects_dir = setup_and_teardown\n"
-    "    ret = script_runner.run(['{packagename}', 'subcommand1', 'arg1', '--option1', 'optval'])\n"
+    "    ret = script_runner.run(['${packagename}', 'subcommand1', 'arg1', '--option1', 'optval'])\n"
     "    assert ret.success\n"    
 )
 
 PROJECT_SETUP_PY = (
     "\"\"\"\n"
-    "{ProjectName} Setup\n"
+    "${ProjectName} Setup\n"
     "\n"
-    "This module contains the setuptools.setup() definition for the {ProjectName} program.\n"
+    "This module contains the setuptools.setup() definition for the ${ProjectName} program.\n"
     "\n"
     "Usage\n"
     "    pipx install --editable .\n"
-    "    pipx inject {packagename} -r requirements.txt\n"
+    "    pipx inject ${packagename} -r requirements.txt\n"
     "\"\"\"\n"
     "from setuptools import setup, find_packages\n"
     "\n"
@@ -546,7 +548,7 @@ PROJECT_SETUP_PY = (
     "    long_description = fh.read()\n"
     "\n"
     "setup(\n"
-    "    name='{ProjectName}',\n"
+    "    name='${ProjectName}',\n"
     "    version='0.1.0',\n"
     "    author='Emille Giddings',\n"
     "    author_email='emilledigital@gmail.com',\n"
@@ -555,12 +557,12 @@ PROJECT_SETUP_PY = (
     "    long_description_content_type='text/markdown',\n"
     "    packages=find_packages(),\n"
     "    include_package_data=True,\n"
-    "    package_data={{\n"
+    "    package_data={\n"
     "        '': ['config.yaml', 'data/gitignore-python', 'data/LICENSE']\n"
-    "    }},\n"
-    "    entry_points={{\n"
-    "        'console_scripts': ['{packagename}={packagename}.__main__:main']\n"
-    "    }},\n"
+    "    },\n"
+    "    entry_points={\n"
+    "        'console_scripts': ['${packagename}=${packagename}.__main__:main']\n"
+    "    },\n"
     "    tests_require=['pytest'],\n"
     "    classifiers=[\n"
     "        'Programming Language :: Python :: 3',\n"
@@ -578,14 +580,14 @@ PROJECT_SETUP_PY = (
 )
 
 PROJECT_README_PY = (
-    "# {ProjectName}"
+    "# ${ProjectName}"
 
 )
 
 PROJECT_MANIFEST_IN = (
-    "include {packagename}/config.yaml\n"
-    "include {packagename}/data/gitignore-python\n"
-    "include {packagename}/data/LICENSE"
+    "include ${packagename}/config.yaml\n"
+    "include ${packagename}/data/gitignore-python\n"
+    "include ${packagename}/data/LICENSE"
 )
 
 PROJECT_PYTEST_INI = (
@@ -0,0 +1,201 @@
+"""
+Pyscaffold Interpreters
+
+This module contains the interpreter registry of the Pyscaffold application. PATH is
+scanned once for `pythonX.Y` executables, each one's real path and full version are
+recorded, and the result is persisted in the pyscaffold cache directory. The cached
+registry is reused until PATH or the modification time of one of its directories changes.
+
+Classes:
+    InterpreterNotFoundError: Raised when no interpreter is registered for a Python version.
+
+Functions:
+    scan_interpreters: Scan PATH for `pythonX.Y` executables and probe their versions.
+    load_registry: Load the interpreter registry, rescanning PATH only when it changed.
+    find_interpreter: Resolve a Python version to its registered interpreter.
+    is_running_interpreter: Check whether a Python version resolves to the interpreter running pyscaffold.
+"""
+
+import os
+import re
+import json
+import sys
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from pyscaffold.config import Config
+
+INTERPRETER_PATTERN = re.compile(r'^python(\d+\.\d+)$')
+
+# The registry loaded by this process, with the PATH it was loaded for
+_registry = (None, None)
+
+class InterpreterNotFoundError(RuntimeError):
+    """Raised when no interpreter is registered for a Python version."""
+    def __init__(self, python_version: str):
+        super().__init__(f'Python {python_version} is not installed or not found in PATH.')
+        self.python_version = python_version
+
+def path_stamp(path_env: str) -> list:
+    """
+    Build the stamp used to invalidate the cached registry.
+
+    Args:
+        path_env (str): The value of the PATH environment variable.
+
+    Returns:
+        list: PATH itself followed by the modification time of each of its directories.
+    """
+    stamp = [path_env]
+    for directory in path_env.split(os.pathsep):
+        try:
+            stamp.append(os.stat(directory).st_mtime_ns)
+        except OSError:
+            stamp.append(None)
+    return stamp
+
+def probe_version(executable: str) -> str:
+    """
+    Ask an interpreter for its full version.
+
+    Args:
+        executable (str): The path of the interpreter.
+
+    Returns:
+        str: The full version, e.g. '3.11.7', or None if the interpreter does not run.
+    """
+    try:
+        result = subprocess.run(
+            [executable, '-c', 'import sys; print(sys.version.split()[0])'],
+            capture_output=True, text=True, timeout=30
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout.strip() if result.returncode == 0 and result.stdout.strip() else None
+
+def scan_interpreters(path_env: str) -> dict:
+    """
+    Scan PATH for `pythonX.Y` executables and probe their versions.
+
+    As with `shutil.which`, the first match along PATH wins for each version.
+    Executables that fail to run, such as shims for uninstalled versions, or that report
+    another version than their name, such as conda's `python3.1`, are skipped.
+
+    Args:
+        path_env (str): The value of the PATH environment variable.
+
+    Returns:
+        dict: Each found version mapped to its 'path', 'realpath' and full 'version'.
+    """
+    candidates = {}
+    for directory in path_env.split(os.pathsep):
+        try:
+            entries = list(os.scandir(directory or '.'))
+        except OSError:
+            continue
+        for entry in entries:
+            match = INTERPRETER_PATTERN.match(entry.name)
+            if match and match.group(1) not in candidates and os.access(entry.path, os.X_OK) and not entry.is_dir():
+                candidates[match.group(1)] = os.path.abspath(entry.path)
+
+    with ThreadPoolExecutor() as executor:
+        versions = dict(zip(candidates, executor.map(probe_version, candidates.values())))
+
+    return {
+        version: {'path': path, 'realpath': os.path.realpath(path), 'version': versions[version]}
+        for version, path in candidates.items()
+        if versions[version] and versions[version].startswith(f'{version}.')
+    }
+
+def registry_path() -> Path:
+    """
+    Retrieve the path of the cached interpreter registry.
+
+    Returns:
+        Path: The path of the registry file in the pyscaffold cache directory.
+    """
+    return Config().get_cache_directory_path() / 'interpreters.json'
+
+def load_registry(refresh: bool = False) -> dict:
+    """
+    Load the interpreter registry, rescanning PATH only when it changed.
+
+    The registry is kept in memory for the rest of the process, so resolving many
+    versions costs a single load.
+
+    Args:
+        refresh (bool): If True, rescan PATH even if the cached registry is current.
+
+    Returns:
+        dict: Each found version mapped to its 'path', 'realpath' and full 'version'.
+    """
+    global _registry
+    path_env = os.environ.get('PATH', os.defpath)
+    if not refresh and _registry[0] == path_env:
+        return _registry[1]
+
+    stamp = path_stamp(path_env)
+    cache_file = registry_path()
+    interpreters = None
+    if not refresh:
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('stamp') == stamp:
+                interpreters = cached['interpreters']
+        except (OSError, ValueError, KeyError):
+            pass
+
+    if interpreters is None:
+        interpreters = scan_interpreters(path_env)
+        temporary = cache_file.with_name(f'.{cache_file.name}.{os.getpid()}')
+        try:
+            with open(temporary, 'w', encoding='utf-8') as f:
+                json.dump({'stamp': stamp, 'interpreters': interpreters}, f)
+            os.replace(temporary, cache_file)
+        except OSError:
+            pass
+
+    _registry = (path_env, interpreters)
+    return interpreters
+
+def find_interpreter(python_version: str) -> str:
+    """
+    Resolve a Python version to its registered interpreter.
+
+    Args:
+        python_version (str): The Python version, e.g. '3.11'.
+
+    Returns:
+        str: The absolute path of the interpreter.
+
+    Raises:
+        InterpreterNotFoundError: If no interpreter is registered for the version.
+    """
+    interpreter = load_registry().get(python_version)
+    if interpreter is None:
+        raise InterpreterNotFoundError(python_version)
+    return interpreter['path']
+
+def is_running_interpreter(python_version: str) -> bool:
+    """
+    Check whether a Python version resolves to the interpreter running pyscaffold.
+
+    The registered interpreter must report the same full version and resolve to the same
+    installation, so a `pythonX.Y` on PATH that is another patch release or another
+    installation of the same release than the running one does not match.
+
+    Args:
+        python_version (str): The Python version, e.g. '3.11'.
+
+    Returns:
+        bool: True if virtual environments of this version can be built in-process.
+    """
+    if python_version != f'{sys.version_info[0]}.{sys.version_info[1]}':
+        return False
+    interpreter = load_registry().get(python_version)
+    if interpreter is None or interpreter['version'] != sys.version.split()[0]:
+        return False
+    running = getattr(sys, '_base_executable', None) or sys.executable
+    return os.path.realpath(interpreter['realpath']) == os.path.realpath(running)
@@ -0,0 +1,228 @@
+"""
+Pyscaffold Manifest
+
+This module contains the manifest of a generated project. The manifest is a small JSON
+file at the project root, `.pyscaffold-manifest`, recording for every generated file the
+template and template version it was rendered from, its size, modification time and the
+SHA-256 of its content, along with the interpreter of the project's virtual environment.
+
+Reading this one file answers whether a project is ready and, by comparing the recorded
+sizes and modification times with a `stat` of each file, which files drifted since they
+were generated; only files whose `stat` changed are read and hashed again.
+
+Functions:
+    digest: Compute the hash recorded for a file's content.
+    file_entry: Record a generated file as it is on disk.
+    read_environment: Read the interpreter details of a virtual environment.
+    build_manifest: Build the manifest of a generated project.
+    read_manifest: Read the manifest of a project.
+    write_manifest: Write the manifest of a project.
+    current_digest: Compute the hash of a file, trusting the manifest while its `stat` is unchanged.
+    drifted_files: List the generated files of a project that are missing or were modified.
+    project_ready: Check from its manifest whether a project is ready.
+"""
+
+import os
+import json
+from pathlib import Path
+
+MANIFEST_FILE = '.pyscaffold-manifest'
+MANIFEST_VERSION = 2
+
+def digest(content: bytes) -> str:
+    """
+    Compute the hash recorded for a file's content.
+
+    Args:
+        content (bytes): The file's content.
+
+    Returns:
+        str: The hexadecimal SHA-256 of the content.
+    """
+    import hashlib
+
+    return hashlib.sha256(content).hexdigest()
+
+def file_entry(path: Path, content: bytes, source: tuple = None) -> dict:
+    """
+    Record a generated file as it is on disk.
+
+    Args:
+        path (Path): The file on disk, written with `content`.
+        content (bytes): The file's content.
+        source (tuple, optional): The name and version of the template the file was rendered from.
+
+    Returns:
+        dict: The file's 'template', 'version', 'size', 'mtime_ns' and 'sha256'.
+    """
+    stat = os.stat(path)
+    template, version = source or (None, None)
+    return {
+        'template': template,
+        'version': version,
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'sha256': digest(content)
+    }
+
+def read_environment(venv_path: Path, python_version: str = None, strategy: str = None) -> dict:
+    """
+    Read the interpreter details of a virtual environment from its `pyvenv.cfg`.
+
+    Args:
+        venv_path (Path): The path of the virtual environment.
+        python_version (str, optional): The Python version the environment was requested for.
+        strategy (str, optional): The strategy the environment was created with.
+
+    Returns:
+        dict: The environment's 'directory', requested 'python_version', full 'version', the 'home'
+            and 'executable' of its base interpreter and its 'strategy', or None if there is no environment.
+    """
+    venv_path = Path(venv_path)
+    try:
+        with open(venv_path / 'pyvenv.cfg', 'r', encoding='utf-8') as f:
+            settings = dict(
+                (key.strip(), value.strip())
+                for key, _, value in (line.partition('=') for line in f) if value
+            )
+    except OSError:
+        return None
+    return {
+        'directory': venv_path.name,
+        'python_version': python_version,
+        'version': settings.get('version') or settings.get('version_info'),
+        'home': settings.get('home'),
+        'executable': settings.get('executable'),
+        'strategy': strategy
+    }
+
+def build_manifest(tree, project_path: Path, environment: dict = None) -> dict:
+    """
+    Build the manifest of a project whose files were just written from a tree.
+
+    Args:
+        tree (ProjectTree): The rendered project files.
+        project_path (Path): The project directory the tree was written to.
+        environment (dict, optional): The details of the project's virtual environment, as read by `read_environment`.
+
+    Returns:
+        dict: The manifest, with an entry under 'files' for each file and the environment under 'venv'.
+    """
+    project_path = Path(project_path)
+    return {
+        'version': MANIFEST_VERSION,
+        'files': {
+            str(path): file_entry(project_path / path, tree[path], tree.sources.get(path))
+            for path in tree
+        },
+        'venv': environment
+    }
+
+def read_manifest(project_path: Path) -> dict:
+    """
+    Read the manifest of a project.
+
+    Manifests of the first format, which only recorded hashes, are converted on the fly.
+
+    Args:
+        project_path (Path): The path of the project.
+
+    Returns:
+        dict: The manifest, or None if the project has none or it cannot be read.
+    """
+    try:
+        with open(Path(project_path) / MANIFEST_FILE, 'rb') as f:
+            manifest = json.loads(f.read())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict):
+        return None
+    if manifest.get('version') == 1:
+        return {
+            'version': MANIFEST_VERSION,
+            'files': {path: {'sha256': sha256} for path, sha256 in manifest.get('files', {}).items()},
+            'venv': None
+        }
+    if manifest.get('version') != MANIFEST_VERSION:
+        return None
+    return manifest
+
+def write_manifest(project_path: Path, manifest: dict) -> Path:
+    """
+    Write the manifest of a project, replacing any previous one atomically.
+
+    Args:
+        project_path (Path): The path of the project.
+        manifest (dict): The manifest to write.
+
+    Returns:
+        Path: The path of the manifest file.
+    """
+    path = Path(project_path) / MANIFEST_FILE
+    temporary = path.with_name(f'{MANIFEST_FILE}.{os.getpid()}')
+    with open(temporary, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, separators=(',', ':'), sort_keys=True)
+    os.replace(temporary, path)
+    return path
+
+def current_digest(path: Path, entry: dict = None) -> tuple:
+    """
+    Compute the hash of a file, trusting the manifest while the file's `stat` is unchanged.
+
+    Args:
+        path (Path): The file on disk.
+        entry (dict, optional): The file's entry in the manifest.
+
+    Returns:
+        tuple: The file's hash and its `os.stat_result`, or (None, None) if the file is missing.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None, None
+    if entry and (entry.get('size'), entry.get('mtime_ns')) == (stat.st_size, stat.st_mtime_ns):
+        return entry['sha256'], stat
+    with open(path, 'rb') as f:
+        return digest(f.read()), stat
+
+def drifted_files(project_path: Path, manifest: dict = None) -> dict:
+    """
+    List the generated files of a project that are missing or were modified since.
+
+    Args:
+        project_path (Path): The path of the project.
+        manifest (dict, optional): The project's manifest. Defaults to reading it.
+
+    Returns:
+        dict: The path of each drifted file mapped to 'missing' or 'modified', or None if the
+            project has no manifest.
+    """
+    project_path = Path(project_path)
+    manifest = manifest or read_manifest(project_path)
+    if manifest is None:
+        return None
+
+    drifted = {}
+    for path, entry in manifest['files'].items():
+        sha256, _ = current_digest(project_path / path, entry)
+        if sha256 is None:
+            drifted[path] = 'missing'
+        elif sha256 != entry['sha256']:
+            drifted[path] = 'modified'
+    return drifted
+
+def project_ready(project_path: Path) -> bool:
+    """
+    Check from its manifest whether a project is ready, i.e. was generated with a virtual environment.
+
+    Args:
+        project_path (Path): The path of the project.
+
+    Returns:
+        bool: True if the manifest records a virtual environment, or None if the project has no
+            manifest or its virtual environment was not recorded, e.g. because it was created later.
+    """
+    manifest = read_manifest(project_path)
+    if manifest is None or not manifest.get('venv'):
+        return None
+    return True
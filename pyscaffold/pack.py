@@ -0,0 +1,223 @@
+"""
+Pyscaffold Pack
+
+This module contains the template pack of the Pyscaffold application. The templates defined
+in `pyscaffold.fragments` are compiled into a single file in the pyscaffold cache directory,
+holding a compact binary index of each template's name, offset and length followed by the
+templates themselves. The pack is memory-mapped, so a command only reads the index and the
+templates it actually renders, and `pyscaffold.fragments` is only imported to rebuild the pack
+after it changed.
+
+Pack layout (little-endian):
+    magic (8 bytes) | template count (uint32)
+    per template: name length (uint16) | name (UTF-8) | offset (uint64) | length (uint64)
+    template contents (UTF-8), at the offsets given in the index
+
+Classes:
+    TemplatePack: A memory-mapped template pack.
+
+Functions:
+    installation_id: Identify this installation among the ones sharing the cache directory.
+    pack_path: Retrieve the path of the template pack matching the installed fragments.
+    build_pack: Write a template pack from a mapping of names to template sources.
+    load_pack: Open the template pack of this installation, building it first if it is stale.
+    load_fragment: Read one template from the template pack.
+"""
+
+import os
+import mmap
+import struct
+import threading
+from pathlib import Path
+
+from pyscaffold.config import Config
+
+PACK_MAGIC = b'PSCFPAK1'
+HEADER = struct.Struct('<8sI')
+NAME_LENGTH = struct.Struct('<H')
+LOCATION = struct.Struct('<QQ')
+
+FRAGMENTS_SOURCE = Path(__file__).with_name('fragments.py')
+
+# The pack opened by this process
+_pack = None
+_pack_lock = threading.Lock()
+
+class TemplatePack():
+    """
+    A memory-mapped template pack, read lazily one template at a time.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Map a template pack and read its index.
+
+        Args:
+            path (Path): The path of the pack.
+
+        Raises:
+            ValueError: If the file is not a template pack.
+        """
+        self.path = Path(path)
+        with open(self.path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, count = HEADER.unpack_from(self._map, 0)
+        if magic != PACK_MAGIC:
+            self._map.close()
+            raise ValueError(f"'{self.path}' is not a template pack.")
+
+        self.index = {}
+        position = HEADER.size
+        for _ in range(count):
+            (name_length,) = NAME_LENGTH.unpack_from(self._map, position)
+            position += NAME_LENGTH.size
+            name = self._map[position:position + name_length].decode('utf-8')
+            position += name_length
+            self.index[name] = LOCATION.unpack_from(self._map, position)
+            position += LOCATION.size
+
+    def get(self, name: str) -> str:
+        """
+        Read a template from the pack.
+
+        Args:
+            name (str): The name of the template, e.g. 'PKG_MAIN_PY'.
+
+        Returns:
+            str: The template's source.
+
+        Raises:
+            KeyError: If the pack holds no template with this name.
+        """
+        offset, length = self.index[name]
+        return self._map[offset:offset + length].decode('utf-8')
+
+    def names(self) -> list:
+        """
+        List the templates held by the pack.
+
+        Returns:
+            list of str: The template names, in the order they are stored.
+        """
+        return list(self.index)
+
+    def close(self) -> None:
+        """
+        Unmap the pack.
+        """
+        self._map.close()
+
+def build_pack(path: Path, templates: dict) -> Path:
+    """
+    Write a template pack from a mapping of names to template sources.
+
+    The pack is written next to its final location and renamed into place, so readers
+    never see a partial pack.
+
+    Args:
+        path (Path): The path of the pack to write.
+        templates (dict): Template names mapped to their sources.
+
+    Returns:
+        Path: The path of the pack.
+    """
+    path = Path(path)
+    encoded = [(name.encode('utf-8'), source.encode('utf-8')) for name, source in templates.items()]
+
+    offset = HEADER.size + sum(NAME_LENGTH.size + len(name) + LOCATION.size for name, _ in encoded)
+    index = []
+    for name, content in encoded:
+        index += [NAME_LENGTH.pack(len(name)), name, LOCATION.pack(offset, len(content))]
+        offset += len(content)
+
+    temporary = path.with_name(f'.{path.name}.{os.getpid()}')
+    with open(temporary, 'wb') as f:
+        f.write(HEADER.pack(PACK_MAGIC, len(encoded)))
+        f.writelines(index)
+        f.writelines(content for _, content in encoded)
+    os.replace(temporary, path)
+    return path
+
+def fragment_templates() -> dict:
+    """
+    Collect the templates defined in `pyscaffold.fragments`.
+
+    Returns:
+        dict: The name of every string defined in the module mapped to its value.
+    """
+    from pyscaffold import fragments
+    return {
+        name: value for name, value in vars(fragments).items()
+        if not name.startswith('_') and isinstance(value, str)
+    }
+
+def installation_id() -> str:
+    """
+    Identify this installation among the ones sharing the pyscaffold cache directory.
+
+    Returns:
+        str: A short hash of the resolved path of `fragments.py` and the package version.
+    """
+    import hashlib
+    from pyscaffold._version import __version__
+
+    return hashlib.sha256(f'{FRAGMENTS_SOURCE.resolve()}\0{__version__}'.encode()).hexdigest()[:12]
+
+def pack_path() -> Path:
+    """
+    Retrieve the path of the template pack matching the installed fragments.
+
+    The name holds this installation's id and the modification time, size and inode of
+    `fragments.py`, so installations sharing the cache never read each other's pack, and
+    an upgraded, reinstalled or edited installation gets a new one. Only `fragments.py` is
+    stat'ed; it is read when the pack is rebuilt.
+
+    Returns:
+        Path: The path of the pack in the pyscaffold cache directory.
+    """
+    stat = os.stat(FRAGMENTS_SOURCE)
+    stamp = f'{stat.st_mtime_ns:x}-{stat.st_size:x}-{stat.st_ino:x}'
+    return Config().get_cache_directory_path() / f'templates-{installation_id()}-{stamp}.pack'
+
+def load_pack() -> TemplatePack:
+    """
+    Open the template pack of this installation, building it first if it is stale.
+
+    Packs this installation built for older versions of the fragments are removed when a
+    new one is built; the packs of other installations are left alone. The pack is opened
+    once per process.
+
+    Returns:
+        TemplatePack: The template pack.
+    """
+    global _pack
+    with _pack_lock:
+        if _pack is not None:
+            return _pack
+
+        path = pack_path()
+        try:
+            _pack = TemplatePack(path)
+        except (OSError, ValueError, struct.error):
+            build_pack(path, fragment_templates())
+            for stale in path.parent.glob(f'templates-{installation_id()}-*.pack'):
+                if stale != path:
+                    stale.unlink(missing_ok=True)
+            _pack = TemplatePack(path)
+        return _pack
+
+def load_fragment(name: str) -> str:
+    """
+    Read one template from the template pack.
+
+    Args:
+        name (str): The name of the template, e.g. 'PKG_MAIN_PY'.
+
+    Returns:
+        str: The template's source.
+
+    Raises:
+        KeyError: If no template has this name.
+    """
+    return load_pack().get(name)
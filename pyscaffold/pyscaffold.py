@@ -7,14 +7,30 @@ and test packages, configuring Git ignore files, and managing virtual environmen
 """
 
 import os
-import shutil
+import time
 import subprocess
+import collections
 from pathlib import Path
-from typing import Tuple
+from typing import TYPE_CHECKING, NamedTuple, Optional, Tuple
 
 from pyscaffold import helpers
-from pyscaffold import fragments
 from pyscaffold import utils
+from pyscaffold.config import Config
+from pyscaffold.templates import compile_template, compile_fragment
+
+# The engines, virtual environments and staging are only imported by the commands
+# that use them, so that e.g. `pyscaffold resume` starts without them
+if TYPE_CHECKING:
+    from pyscaffold.tree import ProjectTree
+
+class ProjectResult(NamedTuple):
+    """The outcome of scaffolding a single project."""
+    name: str
+    status: str
+    duration: float
+    path: Path
+    error: Optional[str] = None
+    metadata_ops: Optional[int] = None
 
 class Pyscaffold():
     """
@@ -23,30 +39,30 @@ class Pyscaffold():
     """
 
     basic_package_content_map = {
-        '__main__.py': fragments.PKG_MAIN_PY,
-        'utils.py': fragments.PKG_UTILS_PY,
-        'config.py': fragments.PKG_CONFIG_PY,
-        'helpers.py': fragments.PKG_HELPERS_PY,
-        'arg_parser.py': fragments.PKG_ARG_PARSER_PY,
-        '{packagename}.py': fragments.PKG_MODULE_PY
+        '__main__.py': compile_fragment('PKG_MAIN_PY'),
+        'utils.py': compile_fragment('PKG_UTILS_PY'),
+        'config.py': compile_fragment('PKG_CONFIG_PY'),
+        'helpers.py': compile_fragment('PKG_HELPERS_PY'),
+        'arg_parser.py': compile_fragment('PKG_ARG_PARSER_PY'),
+        '${packagename}.py': compile_fragment('PKG_MODULE_PY')
     }
 
     basic_test_package_content_map = {
-        'test_config.py': fragments.TEST_CONFIG_PY,
-        'test_helpers.py': fragments.TEST_HELPERS_PY,
-        'test_utils.py': fragments.TEST_UTILS_PY,        
-        'test_arg_parser.py': fragments.TEST_PKG_ARG_PARSER_PY,
-        'test_cli.py': fragments.TEST_CLI_PY,
-        'test_{packagename}.py': fragments.TEST_PACKAGE_MODULE_PY
+        'test_config.py': compile_fragment('TEST_CONFIG_PY'),
+        'test_helpers.py': compile_fragment('TEST_HELPERS_PY'),
+        'test_utils.py': compile_fragment('TEST_UTILS_PY'),
+        'test_arg_parser.py': compile_fragment('TEST_PKG_ARG_PARSER_PY'),
+        'test_cli.py': compile_fragment('TEST_CLI_PY'),
+        'test_${packagename}.py': compile_fragment('TEST_PACKAGE_MODULE_PY')
     }
 
     basic_project_content_map = {
-        'setup.py': fragments.PROJECT_SETUP_PY,
-        'README.md': fragments.PROJECT_README_PY,
-        'MANIFEST.in': fragments.PROJECT_MANIFEST_IN,
-        'pytest.ini': fragments.PROJECT_PYTEST_INI,
-        'LICENSE': fragments.PROJECT_LICENSE,
-        'config.yaml': fragments.PROJECT_CONFIG_YAML
+        'setup.py': compile_fragment('PROJECT_SETUP_PY'),
+        'README.md': compile_fragment('PROJECT_README_PY'),
+        'MANIFEST.in': compile_fragment('PROJECT_MANIFEST_IN'),
+        'pytest.ini': compile_fragment('PROJECT_PYTEST_INI'),
+        'LICENSE': compile_fragment('PROJECT_LICENSE'),
+        'config.yaml': compile_fragment('PROJECT_CONFIG_YAML')
     }
     
     @staticmethod
@@ -66,16 +82,60 @@ class Pyscaffold():
             OSError: If the destination path is not a valid directory.
         """
         project_path = Path(destination) / project_name
-        
-        if project_path.exists():
+
+        # A single mkdir both creates the folder and checks the destination
+        try:
+            os.mkdir(project_path)
+        except FileExistsError:
             raise FileExistsError(f"The project folder '{project_path}' already exists.")
-        
-        if not os.path.isdir(destination):
+        except (FileNotFoundError, NotADirectoryError):
             raise OSError(f"The destination path '{destination}' is invalid.")
-
-        project_path.mkdir(parents=True, exist_ok=True)
         return project_path
      
+    @staticmethod
+    def add_rendered_files(tree: 'ProjectTree', directory: str, content_map: dict, project_name: str, package_name: str) -> None:
+        """
+        Render the files of a content map into a project tree.
+
+        Files rendered from templates without placeholders are marked as shared, as they are the
+        same for every project, and each file records the name and version of its template.
+
+        Args:
+            tree (ProjectTree): The tree to add the files to.
+            directory (str): The directory of the files, relative to the tree's root, or '' for the root.
+            content_map (dict): The file name templates mapped to the templates of their contents.
+            project_name (str): The value of the `ProjectName` placeholder.
+            package_name (str): The value of the `packagename` placeholder.
+        """
+        from pyscaffold.templates import render_cache
+
+        for filename_template, content in content_map.items():
+            filename = compile_template(filename_template).render(packagename=package_name)
+            tree.add(
+                f'{directory}/{filename}' if directory else filename,
+                render_cache.render(content, project_name, package_name),
+                shared=not content.names,
+                source=(content.name, content.version)
+            )
+
+    @staticmethod
+    def write_tree(tree: 'ProjectTree', path: Path) -> None:
+        """
+        Write a rendered tree into a directory, reporting the first file that could not be written.
+
+        Args:
+            tree (ProjectTree): The rendered files.
+            path (Path): The directory to write into, which must exist.
+
+        Raises:
+            OSError: If there is an error writing any of the files.
+        """
+        try:
+            tree.materialize(Path(path))
+        except OSError as e:
+            print(f"Error writing file {e.filename or path}: {e}")
+            raise
+
     @staticmethod
     def inject_basic_package_contents(project_name: str, package_name: str, package_path: Path) -> None:
         """
@@ -89,14 +149,11 @@ class Pyscaffold():
         Raises:
             Exception: If there is an error writing any of the files.
         """
-        for filename_template, content in Pyscaffold.basic_package_content_map.items():
-            filename = filename_template.format(packagename=package_name)
-            try:
-                with open(package_path / filename, "w", encoding="utf-8") as f:
-                    f.write(content.format(ProjectName=project_name, packagename=package_name))
-            except Exception as e:
-                print(f"Error writing file {filename}: {e}")
-                raise
+        from pyscaffold.tree import ProjectTree
+
+        tree = ProjectTree()
+        Pyscaffold.add_rendered_files(tree, '', Pyscaffold.basic_package_content_map, project_name, package_name)
+        Pyscaffold.write_tree(tree, package_path)
 
     @staticmethod
     def deploy_basic_project_package(project_name: str, project_location: Path) -> Tuple[str, Path]:
@@ -117,18 +174,11 @@ class Pyscaffold():
             package_name = helpers.apply_package_naming_convention(project_name)
             package_path = Path(project_location) / package_name
             package_path.mkdir(parents=True, exist_ok=True)
-            
-            # Create __init__.py file
-            with open(package_path / "__init__.py", "w", encoding="utf-8") as f:
-                f.write("")
-            
-            # Deploy package content
-            Pyscaffold.inject_basic_package_contents(project_name, package_name, package_path)
-        
+            Pyscaffold.write_tree(Pyscaffold.render_project_tree(project_name).subtree(package_name), package_path)
         except Exception as e:
             print(f"Error deploying basic project package: {e}")
             raise
-        
+
         return package_name, package_path
 
     @staticmethod
@@ -144,14 +194,11 @@ class Pyscaffold():
         Raises:
             Exception: If there is an error writing any of the files.
         """
-        for filename_template, content in Pyscaffold.basic_test_package_content_map.items():
-            filename = filename_template.format(packagename=test_package_name)
-            try:
-                with open(test_package_path / filename, "w", encoding="utf-8") as f:
-                    f.write(content.format(ProjectName=project_name, packagename=test_package_name))
-            except Exception as e:
-                print(f"Error writing file {filename}: {e}")
-                raise
+        from pyscaffold.tree import ProjectTree
+
+        tree = ProjectTree()
+        Pyscaffold.add_rendered_files(tree, '', Pyscaffold.basic_test_package_content_map, project_name, test_package_name)
+        Pyscaffold.write_tree(tree, test_package_path)
     
     @staticmethod
     def deploy_basic_tests_package(project_name: str, project_location: Path) -> Tuple[str, Path]:
@@ -172,15 +219,7 @@ class Pyscaffold():
             test_package_name = "tests"
             test_package_path = Path(project_location) / test_package_name
             test_package_path.mkdir(parents=True, exist_ok=True)
-
-            # Create __init__.py file
-            with open(test_package_path / "__init__.py", "w", encoding="utf-8") as f:
-                f.write("")
-
-            # Deploy package content
-            package_name = helpers.apply_package_naming_convention(project_name)
-            Pyscaffold.inject_basic_test_package_contents(project_name, package_name, test_package_path)
-
+            Pyscaffold.write_tree(Pyscaffold.render_project_tree(project_name).subtree(test_package_name), test_package_path)
         except Exception as e:
             print(f"Error deploying basic test package: {e}")
             raise
@@ -199,13 +238,11 @@ class Pyscaffold():
         Raises:
             Exception: If there is an error writing any of the files.
         """
-        for filename, content in Pyscaffold.basic_project_content_map.items():
-            try:
-                with open(project_path / filename, "w", encoding="utf-8") as f:
-                    f.write(content.format(ProjectName=project_name, packagename=project_name))
-            except Exception as e:
-                print(f"Error writing file {filename}: {e}")
-                raise
+        from pyscaffold.tree import ProjectTree
+
+        tree = ProjectTree()
+        Pyscaffold.add_rendered_files(tree, '', Pyscaffold.basic_project_content_map, project_name, project_name)
+        Pyscaffold.write_tree(tree, project_path)
     
     @staticmethod
     def inject_gitignore(project_path: Path) -> None:
@@ -220,18 +257,12 @@ class Pyscaffold():
             FileNotFoundError: If the .gitignore template file is not found.
             RuntimeError: For unexpected errors during the .gitignore injection process.
         """
-        data_directory = Path(__file__).parent.parent / 'data'
-        gitignore_path = data_directory / 'gitignore-python'
-        
+        from pyscaffold.tree import ProjectTree
+
         try:
-            # Read the content of gitignore file
-            with open(gitignore_path, 'r', encoding='utf-8') as f:
-                gitignore_content = f.read()
-            
-            # Write content to .gitignore in the project directory
-            with open(project_path / '.gitignore', 'w', encoding='utf-8') as f:
-                f.write(gitignore_content)
-        
+            tree = ProjectTree()
+            Pyscaffold.add_gitignore(tree)
+            tree.materialize(Path(project_path))
         except PermissionError as e:
             # Specific handling for permission errors
             raise PermissionError(f"Permission error: {e}")
@@ -241,32 +272,89 @@ class Pyscaffold():
         except Exception as e:
             # General exception handling
             raise RuntimeError(f"Unexpected error: {e}")
+
+    @staticmethod
+    def add_gitignore(tree: 'ProjectTree') -> None:
+        """
+        Add the .gitignore shared by every project to a project tree.
+
+        Args:
+            tree (ProjectTree): The tree to add the file to.
+
+        Raises:
+            FileNotFoundError: If the .gitignore template file is not found.
+        """
+        gitignore_path = Path(__file__).parent.parent / 'data' / 'gitignore-python'
+        tree.add('.gitignore', gitignore_path.read_bytes(), shared=True, source=('gitignore-python', None))
     
     @staticmethod
-    def deploy_virtual_environment(project_path: Path, python_version: str = '3.11') -> bool:
+    def render_project_tree(project_name: str) -> 'ProjectTree':
+        """
+        Render every file of a new project into memory.
+
+        The tree holds the package, the test package, the project files and the .gitignore.
+        It is the single render path of a project: the `deploy_*` and `inject_*` methods
+        write parts of it. The empty `__init__.py` files and the .gitignore are marked as
+        shared, like the files rendered from templates without placeholders.
+
+        Args:
+            project_name (str): The name of the project.
+
+        Returns:
+            ProjectTree: The rendered project files, relative to the project directory.
+
+        Raises:
+            FileNotFoundError: If the .gitignore template file is not found.
+        """
+        from pyscaffold.tree import ProjectTree
+
+        package_name = helpers.apply_package_naming_convention(project_name)
+        tree = ProjectTree()
+
+        tree.add(f'{package_name}/__init__.py', '', shared=True)
+        Pyscaffold.add_rendered_files(tree, package_name, Pyscaffold.basic_package_content_map, project_name, package_name)
+
+        tree.add('tests/__init__.py', '', shared=True)
+        Pyscaffold.add_rendered_files(tree, 'tests', Pyscaffold.basic_test_package_content_map, project_name, package_name)
+
+        Pyscaffold.add_rendered_files(tree, '', Pyscaffold.basic_project_content_map, project_name, project_name)
+        Pyscaffold.add_gitignore(tree)
+
+        return tree
+
+    @staticmethod
+    def deploy_virtual_environment(project_path: Path, python_version: str = '3.11', strategy: str = 'standard', projects_root: Path = None) -> bool:
         """
         Create a virtual environment in the specified project directory.
 
+        The project is usually still in its staging directory, so its creation is reported
+        once the project is committed, at its final location.
+
         Args:
             project_path (Path): The path to the project directory.
             python_version (str): The version of Python to use for the virtual environment (default: '3.11').
+            strategy (str): The name of the strategy in `venvs.VENV_STRATEGIES` used to create it (default: 'standard').
+            projects_root (Path, optional): The directory holding the projects. Defaults to the project's parent directory.
 
         Returns:
             bool: True if the virtual environment was created successfully.
 
         Raises:
-            RuntimeError: If the specified Python version is not installed or not found in PATH.
+            ValueError: If the strategy is unknown.
+            InterpreterNotFoundError: If the specified Python version is not installed or not found in PATH.
             subprocess.CalledProcessError: If there is an error creating the virtual environment.
         """
+        from pyscaffold import interpreters, venvs
+
         venv_path = project_path / 'env'
-        python_executable = f'python{python_version}'
 
-        if not shutil.which(python_executable):
-            raise RuntimeError(f'Python {python_version} is not installed or not found in PATH.')
+        if strategy not in venvs.VENV_STRATEGIES:
+            raise ValueError(f"Unknown virtual environment strategy '{strategy}'.")
+
+        python_executable = interpreters.find_interpreter(python_version)
 
         try:
-            subprocess.run([python_executable, '-m', 'venv', str(venv_path)], check=True)
-            print(f"Virtual environment created at {venv_path}")
+            venvs.VENV_STRATEGIES[strategy](venv_path, python_version, python_executable, Path(projects_root or project_path.parent))
         except subprocess.CalledProcessError as e:
             print(f"Error creating virtual environment: {e}")
             raise
@@ -274,51 +362,302 @@ class Pyscaffold():
         return True
     
     @staticmethod
-    def start(project_names, python_version, **kwargs) -> bool:
+    def write_project_manifest(project_path: Path, tree: 'ProjectTree', python_version: str, venv_strategy: str, durability: str = 'none') -> Path:
         """
-        Initialize and set up projects with the specified names.
+        Record the manifest of a project whose files and virtual environment were just created.
 
         Args:
-            project_names (list of str): The names of the projects to be created.
+            project_path (Path): The directory the project was written to.
+            tree (ProjectTree): The rendered project files.
+            python_version (str): The Python version the virtual environment was requested for.
+            venv_strategy (str): The strategy the virtual environment was created with.
+            durability (str): The project's durability mode. Unless it is 'none', the manifest and
+                the directory holding it are synced to disk (default: 'none').
+
+        Returns:
+            Path: The path of the manifest file.
+        """
+        from pyscaffold import manifest
+
+        environment = manifest.read_environment(Path(project_path) / 'env', python_version, venv_strategy)
+        path = manifest.write_manifest(project_path, manifest.build_manifest(tree, project_path, environment))
+        if durability != 'none':
+            from pyscaffold.writer import fsync_path
+
+            fsync_path(path)
+            fsync_path(project_path)
+        return path
+
+    @staticmethod
+    def blob_store(**options):
+        """
+        Retrieve the blob store shared files are linked from, if linking is enabled.
+
+        Args:
+            **options: Pipeline options. The 'link_shared' key enables linking and the 'config' key
+                holds the settings the cache directory is read from, defaulting to loading the configuration.
+
+        Returns:
+            BlobStore: The blob store in the cache directory, or None if files are written as copies.
+        """
+        if not options.get('link_shared'):
+            return None
+        from pyscaffold.blobs import BlobStore
+        return BlobStore.default(options.get('config'))
+
+    @staticmethod
+    def materialize_project(tree: 'ProjectTree', project_path: Path, store=None, durability: str = 'none', ops: collections.Counter = None) -> int:
+        """
+        Write a rendered project with a bulk writer and make it as durable as requested.
+
+        Args:
+            tree (ProjectTree): The rendered project files.
+            project_path (Path): The directory to write the project into, which must exist.
+            store (BlobStore, optional): The blob store to link shared files from.
+            durability (str): The writer's durability mode, one of `writer.DURABILITY_MODES` (default: 'none').
+            ops (collections.Counter, optional): Counts the metadata operations made, by name.
+
+        Returns:
+            int: The number of files written.
+        """
+        from pyscaffold.writer import BulkWriter
+
+        with BulkWriter(durability) as writer:
+            written = tree.materialize(project_path, store, writer, ops)
+            writer.commit(project_path)
+        if ops is not None:
+            ops.update(writer.ops)
+        return written
+
+    @staticmethod
+    def project_stages(project_name: str, python_version: str, destination: str, staging_path: Path = None, ops: collections.Counter = None, **options) -> list:
+        """
+        Declare the scaffold steps of a single project as a dependency graph.
+
+        The project files are rendered in memory and written to a staging directory in one
+        pass; once they and the virtual environment are ready, their manifest is recorded.
+        The project is only committed into place once every other stage has finished.
+        The virtual environment is built while the files are rendered and written.
+        New stages can be appended with their dependencies listed in `requires`.
+
+        Args:
+            project_name (str): The name of the project to create.
             python_version (str): The version of Python to use for the virtual environment.
-            **kwargs: Additional keyword arguments. The 'destination' key specifies where to create the projects.
+            destination (str): The path where the project folder should be created.
+            staging_path (Path, optional): The staging directory to render into. Defaults to a new unique one.
+            ops (collections.Counter, optional): Counts the metadata operations made to create, write and commit the
+                project's files, by name.
+            **options: Pipeline options. The 'venv_strategy' key selects how the virtual environment is created.
+                If the 'link_shared' key is True, files shared by every project are hardlinked from the blob store,
+                found through the 'config' key's settings when it is given.
+                The 'durability' key selects how durably the files are written; unless it is 'none', the manifest
+                and the rename committing the project are synced too.
 
         Returns:
-            bool: True if all projects were initialized and set up successfully.
+            list of Stage: The stages of the project's scaffold pipeline.
+        """
+        from pyscaffold import staging
+        from pyscaffold.stages import Stage
+
+        venv_strategy = options.get('venv_strategy', 'standard')
+        durability = options.get('durability', 'none')
+        store = Pyscaffold.blob_store(**options)
+        staging_path = staging_path or staging.staging_path(project_name, destination)
+        project_path = Path(destination) / project_name
+
+        def create_folder(results):
+            path = staging.create_staging_folder(project_name, destination, staging_path, ops)
+            print(f"Starting project: {project_name} at {project_path}")
+            return path
+
+        stages = [
+            Stage('folder', create_folder),
+            Stage('render', lambda results: Pyscaffold.render_project_tree(project_name)),
+            Stage('files', lambda results: Pyscaffold.materialize_project(results['render'], results['folder'], store, durability, ops), ('folder', 'render')),
+            Stage('venv', lambda results: Pyscaffold.deploy_virtual_environment(results['folder'], python_version, venv_strategy, destination), ('folder',)),
+            Stage('manifest', lambda results: Pyscaffold.write_project_manifest(results['folder'], results['render'], python_version, venv_strategy, durability), ('files', 'venv'))
+        ]
+        def commit_folder(results):
+            path = staging.commit_staging_folder(results['folder'], project_path, ops, durability != 'none')
+            print(f"Virtual environment created at {path / 'env'}")
+            return path
+
+        stages.append(Stage('commit', commit_folder, tuple(stage.name for stage in stages)))
+        return stages
+
+    @staticmethod
+    def start_project(project_name: str, python_version: str, destination: str, ops: collections.Counter = None, **options) -> Path:
+        """
+        Run the full scaffold pipeline for a single project.
+
+        If any stage fails, the staging directory is deleted in the background and nothing
+        is left at the project's final location.
+
+        Args:
+            project_name (str): The name of the project to create.
+            python_version (str): The version of Python to use for the virtual environment.
+            destination (str): The path where the project folder should be created.
+            ops (collections.Counter, optional): Counts the metadata operations made for the project's files, by name.
+            **options: Pipeline options passed on to `project_stages`.
+
+        Returns:
+            Path: The path to the newly created project.
 
         Raises:
-            RuntimeError: If the specified Python version is not installed or not found in PATH.
-            Exception: For other errors that occur during project setup.
+            Exception: If any stage of the pipeline fails.
         """
-        destination = kwargs.get('destination', None)
-        
-        for project_name in project_names:
-            try:
-                project_path = Pyscaffold.create_project_folder(project_name, destination)
+        from pyscaffold import staging
+        from pyscaffold.stages import run_stages
 
-                if project_path:
-                    print(f"Starting project: {project_name} at {project_path}")
-                else:
-                    print(f"Failed to create project folder for '{project_name}'.")
+        staging_path = staging.staging_path(project_name, destination)
+        try:
+            results = run_stages(Pyscaffold.project_stages(project_name, python_version, destination, staging_path, ops, **options))
+        except Exception:
+            staging.discard_staging_folder(staging_path)
+            raise
+        return results['commit']
 
-                Pyscaffold.deploy_basic_project_package(project_name, project_path)
+    @staticmethod
+    def run_project(project_name: str, python_version: str, destination: str, **options) -> ProjectResult:
+        """
+        Run the scaffold pipeline for a single project, isolating any failure.
 
-                Pyscaffold.deploy_basic_tests_package(project_name, project_path)
+        Args:
+            project_name (str): The name of the project to create.
+            python_version (str): The version of Python to use for the virtual environment.
+            destination (str): The path where the project folder should be created.
+            **options: Pipeline options passed on to `project_stages`.
 
-                Pyscaffold.inject_basic_project_contents(project_name, project_path)
+        Returns:
+            ProjectResult: The outcome of the pipeline for this project, with the number of metadata
+                operations made for its files.
+        """
+        started = time.perf_counter()
+        ops = collections.Counter()
+        try:
+            project_path = Pyscaffold.start_project(project_name, python_version, destination, ops, **options)
+        except Exception as e:
+            print(f"Error starting project '{project_name}': {e}")
+            return ProjectResult(project_name, 'failed', time.perf_counter() - started, Path(destination) / project_name, str(e), sum(ops.values()))
 
-                Pyscaffold.inject_gitignore(project_path)
+        return ProjectResult(project_name, 'ok', time.perf_counter() - started, project_path, None, sum(ops.values()))
 
-                Pyscaffold.deploy_virtual_environment(project_path, python_version)
+    @staticmethod
+    def run_projects_in_pool(project_names, python_version: str, destination: str, jobs: int, **options) -> list:
+        """
+        Run the scaffold pipeline for several projects in a bounded process pool.
+
+        Args:
+            project_names (list of str): The names of the projects to create.
+            python_version (str): The version of Python to use for the virtual environments.
+            destination (str): The path where the project folders should be created.
+            jobs (int): The maximum number of worker processes.
+            **options: Pipeline options passed on to `project_stages`.
+
+        Returns:
+            list of ProjectResult: The outcome for each project, in the order given.
+        """
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        results = {}
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {
+                executor.submit(Pyscaffold.run_project, project_name, python_version, destination, **options): project_name
+                for project_name in project_names
+            }
+            for future in as_completed(futures):
+                project_name = futures[future]
+                try:
+                    results[project_name] = future.result()
+                except Exception as e:
+                    # The worker itself died, e.g. it was killed or could not be pickled
+                    print(f"Error starting project '{project_name}': {e}")
+                    results[project_name] = ProjectResult(project_name, 'failed', 0.0, Path(destination) / project_name, str(e))
+
+        return [results[project_name] for project_name in project_names]
+
+    @staticmethod
+    def start(project_names, python_version, **kwargs) -> bool:
+        """
+        Initialize and set up projects with the specified names.
+
+        The staging directories left under the destination by runs that were killed are
+        removed first.
+
+        Args:
+            project_names (list of str): The names of the projects to be created.
+            python_version (str): The version of Python to use for the virtual environment.
+            **kwargs: Additional keyword arguments. The 'destination' key specifies where to create the projects,
+                the 'engine' key selects the 'process' or 'asyncio' engine, the 'jobs' key bounds how many
+                projects are scaffolded in parallel and the 'venv_strategy' key selects how virtual environments
+                are created, defaulting to the 'venv.STRATEGY' setting. If the 'dry_run' key is True, the files
+                of each project are rendered and listed without writing anything. If the 'compile' key is True,
+                the new projects are precompiled to bytecode with the 'invalidation_mode' key's mode. If the
+                'link_shared' key or the 'files.LINK_SHARED' setting is True, files shared by every project
+                are hardlinked from the blob store. The 'durability' key, defaulting to the 'files.DURABILITY'
+                setting, selects whether written files are synced to disk not at all, once per project, or one by one.
+
+        Returns:
+            bool: True if all projects were initialized and set up successfully.
+
+        Raises:
+            InterpreterNotFoundError: If the specified Python version is not installed or not found in PATH,
+                unless it is a dry run, which creates no virtual environment.
+        """
+        destination = kwargs.get('destination', None)
+        engine = kwargs.get('engine') or 'process'
+        jobs = kwargs.get('jobs')
+        config = Config()
+        options = {
+            'venv_strategy': kwargs.get('venv_strategy') or config.get('venv.STRATEGY', 'standard'),
+            'link_shared': kwargs.get('link_shared') or config.get('files.LINK_SHARED', False),
+            'durability': kwargs.get('durability') or config.get('files.DURABILITY', 'none'),
+            # Read once here and pickled to `--jobs` workers, so no project loads the configuration again
+            'config': config.snapshot()
+        }
+
+        if kwargs.get('dry_run'):
+            for project_name in project_names:
+                utils.print_project_tree(Path(destination) / project_name, Pyscaffold.render_project_tree(project_name))
+            return True
+
+        from pyscaffold import interpreters, staging
+
+        # Resolved once here, so every project and forked worker reuses the loaded registry
+        interpreters.find_interpreter(python_version)
+        staging.discard_stale_staging(destination)
+
+        from pyscaffold.templates import render_cache
+
+        # Counted in this process only, so a `--jobs` pool of worker processes reports nothing
+        cache_before = render_cache.stats()
+
+        if engine == 'asyncio':
+            import asyncio
+            from pyscaffold.async_engine import run_projects_async
+            jobs = max(1, jobs or os.cpu_count() or 1)
+            results = asyncio.run(run_projects_async(project_names, python_version, destination, jobs, **options))
+        elif (jobs or 1) > 1 and len(project_names) > 1:
+            results = Pyscaffold.run_projects_in_pool(project_names, python_version, destination, min(jobs, len(project_names)), **options)
+        else:
+            results = [Pyscaffold.run_project(project_name, python_version, destination, **options) for project_name in project_names]
+
+        if kwargs.get('compile'):
+            from pyscaffold import bytecode
+            invalidation_mode = kwargs.get('invalidation_mode') or 'timestamp'
+            compiled = bytecode.compile_projects([result.path for result in results if result.status == 'ok'], invalidation_mode, jobs)
+            print(f"Compiled {compiled} project(s) to bytecode ({invalidation_mode})")
+
+        utils.print_results_table(results)
+
+        cache_after = render_cache.stats()
+        hits, misses = cache_after['hits'] - cache_before['hits'], cache_after['misses'] - cache_before['misses']
+        if hits or misses:
+            print(f"Render cache: {hits} hit(s), {misses} miss(es)")
+
+        if len(project_names) == 1 and results[0].status == 'ok':
+            utils.activate_virtual_env(results[0].path)
 
-                if len(project_names) == 1:
-                    utils.activate_virtual_env(project_path)
-            
-            except Exception as e:
-                if isinstance(e, RuntimeError) and f'Python {python_version} is not installed or not found in PATH.' in str(e):
-                    raise
-                print(f"Error starting project '{project_name}': {e}")
-    
         return True
     
     @staticmethod
@@ -347,5 +686,156 @@ class Pyscaffold():
             raise ValueError(f"Directory '{project_name}' is not a valid project")
 
         return utils.activate_virtual_env(project_path)
-    
-    
\ No newline at end of file
+
+    @staticmethod
+    def sync_project(project_name: str, destination: str, store=None, link_shared: bool = False, dry_run: bool = False, shared: dict = None) -> dict:
+        """
+        Bring a single project up to date with the current templates.
+
+        The project is rendered again and the files it shares through the blob store are
+        checked first, so a shared file modified in place is either kept in a private copy
+        or restored. Then only its missing files and the files still as generated from
+        older templates are rewritten.
+
+        Args:
+            project_name (str): The name of the project.
+            destination (str): The projects directory.
+            store (BlobStore, optional): The blob store. Defaults to the store in the cache directory.
+            link_shared (bool): Whether rewritten shared files are hardlinked from the blob store (default: False).
+            dry_run (bool): Whether to only report what would be rewritten (default: False).
+            shared (dict, optional): The statuses of the project's shared files, if they were already checked.
+
+        Returns:
+            dict: The project's 'shared' files mapped to their `blobs.check_project` status and its
+                rendered 'files' mapped to their `sync.file_status` status.
+        """
+        from pyscaffold import blobs
+        from pyscaffold.sync import sync_project
+
+        store = store or blobs.BlobStore.default()
+        project_path = Path(destination) / project_name
+        tree = Pyscaffold.render_project_tree(project_name)
+        if shared is None:
+            shared = blobs.check_project(project_path, tree, store, repair=not dry_run)
+        files = sync_project(project_path, tree, store if link_shared else None, dry_run)
+        return {'shared': shared, 'files': files}
+
+    @staticmethod
+    def sync(project_names, destination, **kwargs) -> dict:
+        """
+        Bring projects up to date with the current templates, in parallel.
+
+        The files shared through the blob store are checked first, one project at a time in
+        name order, so a shared file edited in place is kept by the first project holding it
+        and restored in the others. The projects are then synced in parallel.
+
+        Args:
+            project_names (list of str): The names of the projects to sync. Defaults to every project under the destination.
+            destination (str): The projects directory.
+            **kwargs: Additional keyword arguments. The 'jobs' key bounds how many projects are synced at once,
+                defaulting to the CPU count. If the 'dry_run' key is True, nothing is written. If the 'link_shared'
+                key or the 'files.LINK_SHARED' setting is True, rewritten shared files are hardlinked from the blob store.
+
+        Returns:
+            dict: The name of each synced project mapped to its report, as returned by `sync_project`,
+                or to the error that stopped it.
+
+        Raises:
+            FileNotFoundError: If a named project does not exist at the destination.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        from pyscaffold import blobs
+
+        if project_names:
+            for project_name in project_names:
+                if not utils.project_exists(project_name, destination):
+                    raise FileNotFoundError(f"Project '{project_name}' does not exist at {destination}")
+        else:
+            project_names = utils.find_projects(destination)
+
+        store = blobs.BlobStore.default()
+        link_shared = kwargs.get('link_shared') or Config().get('files.LINK_SHARED', False)
+        dry_run = kwargs.get('dry_run', False)
+
+        shared = {}
+        for project_name in sorted(project_names):
+            try:
+                tree = Pyscaffold.render_project_tree(project_name)
+                shared[project_name] = blobs.check_project(Path(destination) / project_name, tree, store, repair=not dry_run)
+            except Exception:
+                # Checked again by `sync_project`, which reports the error
+                pass
+
+        def sync_one(project_name):
+            try:
+                return Pyscaffold.sync_project(project_name, destination, store, link_shared, dry_run, shared.get(project_name))
+            except Exception as e:
+                return {'error': str(e)}
+
+        jobs = max(1, kwargs.get('jobs') or os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            report = dict(zip(project_names, executor.map(sync_one, project_names)))
+
+        utils.print_sync_report(report, dry_run)
+        return report
+
+    @staticmethod
+    def pool(action, python_version, destination, **kwargs) -> int:
+        """
+        Manage the prewarmed virtual environment pool under the projects directory.
+
+        Args:
+            action (str): The pool action to perform. Only 'fill' is supported.
+            python_version (str): The version of Python of the pooled virtual environments.
+            destination (str): The projects directory holding the pool.
+            **kwargs: Additional keyword arguments. The 'size' key overrides the 'venv.POOL_SIZE' setting.
+
+        Returns:
+            int: The number of virtual environments built.
+
+        Raises:
+            InterpreterNotFoundError: If the specified Python version is not installed or not found in PATH.
+        """
+        from pyscaffold import interpreters, venvs
+
+        python_executable = interpreters.find_interpreter(python_version)
+
+        size = kwargs.get('size') or Config().get('venv.POOL_SIZE', 2)
+        built = venvs.fill_pool(destination, python_version, python_executable, size)
+        print(f"Built {built} virtual environment(s) in {venvs.pool_path(destination, python_version)}")
+        return built
+
+    @staticmethod
+    def list_projects(destination, **kwargs) -> int:
+        """
+        List the projects in the projects directory, printing each one as it is found.
+
+        The directory is scanned once, and each project's readiness is checked from a single
+        listing of its directory.
+
+        Args:
+            destination (str): The projects directory.
+            **kwargs: Additional keyword arguments (not used).
+
+        Returns:
+            int: The number of projects listed.
+        """
+        return utils.print_projects(utils.scan_projects(destination))
+
+    @staticmethod
+    def list_interpreters(**kwargs) -> dict:
+        """
+        List the Python interpreters found on PATH.
+
+        Args:
+            **kwargs: Additional keyword arguments. If the 'refresh' key is True, PATH is rescanned
+                even if the cached registry is current.
+
+        Returns:
+            dict: Each found version mapped to its 'path', 'realpath' and full 'version'.
+        """
+        from pyscaffold import interpreters
+
+        registry = interpreters.load_registry(refresh=kwargs.get('refresh', False))
+        utils.print_interpreters_table(registry)
+        return registry
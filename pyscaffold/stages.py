@@ -0,0 +1,114 @@
+"""
+Pyscaffold Stages
+
+This module contains the stage scheduler used to run a project's scaffold steps. Steps are
+declared as a dependency graph of stages, and the scheduler runs every stage whose
+dependencies have completed concurrently on a thread pool.
+
+Classes:
+    Stage: A named scaffold step and the stages it depends on.
+
+Functions:
+    order_stages: Validate a stage graph and return its stages in dependency order.
+    run_stages: Run a stage graph, executing independent stages concurrently.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, NamedTuple, Tuple
+
+class Stage(NamedTuple):
+    """
+    A named scaffold step and the stages it depends on.
+
+    The callable receives a dict mapping the name of every completed stage to its return value.
+    """
+    name: str
+    func: Callable[[dict], object]
+    requires: Tuple[str, ...] = ()
+
+def order_stages(stages) -> list:
+    """
+    Validate a stage graph and return its stages in dependency order.
+
+    Args:
+        stages (list of Stage): The stages making up the graph.
+
+    Returns:
+        list of Stage: The stages sorted so that every stage follows its dependencies.
+
+    Raises:
+        ValueError: If a stage name is duplicated, a dependency is unknown or the graph has a cycle.
+    """
+    by_name = {}
+    for stage in stages:
+        if stage.name in by_name:
+            raise ValueError(f"Duplicate stage '{stage.name}'.")
+        by_name[stage.name] = stage
+
+    for stage in stages:
+        for dependency in stage.requires:
+            if dependency not in by_name:
+                raise ValueError(f"Stage '{stage.name}' requires unknown stage '{dependency}'.")
+
+    ordered = []
+    done = set()
+    pending = list(stages)
+    while pending:
+        ready = [stage for stage in pending if done.issuperset(stage.requires)]
+        if not ready:
+            names = ', '.join(stage.name for stage in pending)
+            raise ValueError(f"Stages form a dependency cycle: {names}.")
+        for stage in ready:
+            ordered.append(stage)
+            done.add(stage.name)
+        pending = [stage for stage in pending if stage.name not in done]
+
+    return ordered
+
+def run_stages(stages, max_workers: int = None) -> dict:
+    """
+    Run a stage graph, executing every stage whose dependencies have completed concurrently.
+
+    When a stage fails no further stages are started; the stages already running are
+    allowed to finish and the first error is raised.
+
+    Args:
+        stages (list of Stage): The stages making up the graph.
+        max_workers (int, optional): The maximum number of stages running at once. Defaults to the number of stages.
+
+    Returns:
+        dict: The return value of every stage, keyed by stage name.
+
+    Raises:
+        ValueError: If the stage graph is invalid.
+        Exception: The first exception raised by a stage.
+    """
+    pending = order_stages(stages)
+    results = {}
+    error = None
+
+    with ThreadPoolExecutor(max_workers=max_workers or max(1, len(pending))) as executor:
+        running = {}
+        while pending or running:
+            if error is None:
+                ready = [stage for stage in pending if all(name in results for name in stage.requires)]
+                for stage in ready:
+                    running[executor.submit(stage.func, dict(results))] = stage
+                    pending.remove(stage)
+
+            if not running:
+                break
+
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                stage = running.pop(future)
+                try:
+                    results[stage.name] = future.result()
+                except Exception as e:
+                    if error is None:
+                        error = e
+
+    if error is not None:
+        raise error
+
+    return results
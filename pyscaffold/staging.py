@@ -0,0 +1,201 @@
+"""
+Pyscaffold Staging
+
+This module contains the staging area used to generate projects atomically. A project is
+rendered into a hidden directory under the projects root and moved into place with a
+single `os.rename` once every file and its virtual environment are ready, so a failed
+run never leaves a half-built project behind and concurrent runs can share one root.
+
+Each staging directory is named after its project and the pid of the process building it.
+A run that was killed leaves its staging directory behind, so every run first removes the
+staging directories of processes that are no longer alive.
+
+Functions:
+    staging_path: Choose a unique staging directory for a project.
+    create_staging_folder: Create a project's staging directory after checking its destination.
+    commit_staging_folder: Move a finished staging directory into place.
+    discard_staging_folder: Delete a staging directory in the background.
+    process_alive: Check whether a process is still running.
+    discard_stale_staging: Delete the staging directories left behind by processes that are no longer alive.
+"""
+
+import os
+import re
+import errno
+import uuid
+import shutil
+import threading
+import collections
+from pathlib import Path
+
+from pyscaffold import venvs
+
+STAGING_DIRECTORY = '.pyscaffold-staging'
+
+# A staging directory's name: the project's name, the owning process's pid and a random suffix
+STAGING_NAME_PATTERN = re.compile(r'^(?P<project>.+)-(?P<pid>\d+)-[0-9a-f]{8}$')
+
+def staging_path(project_name: str, destination: str) -> Path:
+    """
+    Choose a unique staging directory for a project.
+
+    The staging area lives under the projects root so that committing a project is a
+    rename on the same filesystem. The directory's name holds the pid of this process, so
+    it can be removed by a later run if this one is killed.
+
+    Args:
+        project_name (str): The name of the project.
+        destination (str): The projects root where the project will be created.
+
+    Returns:
+        Path: The path of the staging directory, which is not created yet.
+    """
+    return Path(destination) / STAGING_DIRECTORY / f'{project_name}-{os.getpid()}-{uuid.uuid4().hex[:8]}'
+
+def create_staging_folder(project_name: str, destination: str, path: Path, ops: collections.Counter = None) -> Path:
+    """
+    Create a project's staging directory after checking its destination.
+
+    The destination is not probed separately: creating the staging directory fails if it
+    is not a directory, and the staging area itself is only created when it is missing.
+
+    Args:
+        project_name (str): The name of the project.
+        destination (str): The projects root where the project will be created.
+        path (Path): The staging directory chosen by `staging_path`.
+        ops (collections.Counter, optional): Counts the metadata operations made, by name.
+
+    Returns:
+        Path: The path of the staging directory.
+
+    Raises:
+        FileExistsError: If a folder with the same name already exists at the destination.
+        OSError: If the destination path is not a valid directory.
+    """
+    ops = ops if ops is not None else collections.Counter()
+    project_path = Path(destination) / project_name
+
+    ops['stat'] += 1
+    if project_path.exists():
+        raise FileExistsError(f"The project folder '{project_path}' already exists.")
+
+    try:
+        ops['mkdir'] += 1
+        try:
+            os.mkdir(path)
+        except FileNotFoundError:
+            ops['mkdir'] += 2
+            try:
+                os.mkdir(path.parent)
+            except FileExistsError:
+                pass
+            os.mkdir(path)
+    except (FileNotFoundError, NotADirectoryError) as e:
+        raise OSError(f"The destination path '{destination}' is invalid.") from e
+    return path
+
+def commit_staging_folder(path: Path, project_path: Path, ops: collections.Counter = None, durable: bool = False) -> Path:
+    """
+    Move a finished staging directory into place with a single rename.
+
+    The paths baked into the project's virtual environment are rewritten to its final
+    location first. A project committed concurrently under the same name makes the
+    rename fail, and the staging directory is left for the caller to discard.
+
+    Args:
+        path (Path): The staging directory holding the finished project.
+        project_path (Path): The final location of the project.
+        ops (collections.Counter, optional): Counts the metadata operations made, by name.
+        durable (bool): Whether to sync the directories the rename changed, so the project survives
+            a crash once this returns (default: False).
+
+    Returns:
+        Path: The final location of the project.
+
+    Raises:
+        FileExistsError: If a folder with the same name already exists at the destination.
+    """
+    ops = ops if ops is not None else collections.Counter()
+
+    ops['stat'] += 2
+    if project_path.exists():
+        raise FileExistsError(f"The project folder '{project_path}' already exists.")
+
+    if (path / 'env' / 'pyvenv.cfg').exists():
+        venvs.relocate_virtual_environment(path / 'env', path / 'env', project_path / 'env')
+
+    ops['rename'] += 1
+    try:
+        os.rename(path, project_path)
+    except OSError as e:
+        if e.errno in (errno.EEXIST, errno.ENOTEMPTY):
+            raise FileExistsError(f"The project folder '{project_path}' already exists.") from e
+        raise
+
+    if durable:
+        from pyscaffold.writer import fsync_path
+
+        directories = {str(project_path.parent), str(path.parent)}
+        ops['fsync'] += len(directories)
+        for directory in sorted(directories, key=len, reverse=True):
+            fsync_path(directory)
+
+    return project_path
+
+def discard_staging_folder(path: Path) -> threading.Thread:
+    """
+    Delete a staging directory in the background.
+
+    The thread is not a daemon, so the deletion completes before the process exits.
+
+    Args:
+        path (Path): The staging directory to delete.
+
+    Returns:
+        threading.Thread: The thread deleting the directory.
+    """
+    thread = threading.Thread(target=shutil.rmtree, args=(path,), kwargs={'ignore_errors': True}, name=f'discard-{path.name}')
+    thread.start()
+    return thread
+
+def process_alive(pid: int) -> bool:
+    """
+    Check whether a process is still running.
+
+    Args:
+        pid (int): The process ID.
+
+    Returns:
+        bool: True if the process exists, even if it belongs to another user.
+    """
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def discard_stale_staging(destination: str) -> list:
+    """
+    Delete the staging directories left behind by processes that are no longer alive.
+
+    Directories whose name carries no pid are left alone, since their owner is unknown.
+
+    Args:
+        destination (str): The projects root holding the staging area.
+
+    Returns:
+        list of threading.Thread: The threads deleting each stale staging directory.
+    """
+    try:
+        entries = list(os.scandir(Path(destination) / STAGING_DIRECTORY))
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+    threads = []
+    for entry in entries:
+        match = STAGING_NAME_PATTERN.match(entry.name)
+        if match and int(match['pid']) != os.getpid() and not process_alive(int(match['pid'])):
+            threads.append(discard_staging_folder(Path(entry.path)))
+    return threads
@@ -0,0 +1,119 @@
+"""
+Pyscaffold Sync
+
+This module brings existing projects up to date with the current templates. A project is
+rendered again and each file is compared by hash with the file on disk and with the hash
+recorded in the project's manifest when it was generated; the hash of a file whose `stat`
+still matches its manifest entry is taken from the manifest. Only files that are missing, or
+that are still exactly as pyscaffold generated them from an older template, are rewritten;
+files edited by the user are left alone.
+
+Functions:
+    file_status: Classify a file on disk against its rendered and recorded contents.
+    write_synced_file: Replace a file with new content atomically.
+    sync_project: Rewrite the missing and pristine files of a project and update its manifest.
+"""
+
+import os
+from pathlib import Path
+
+from pyscaffold import blobs
+from pyscaffold.bytecode import invalidate_bytecode
+from pyscaffold.manifest import MANIFEST_VERSION, digest, file_entry, current_digest, read_manifest, write_manifest
+
+# Statuses of the files that are rewritten
+REWRITTEN = ('added', 'updated')
+
+def file_status(current: str, rendered: str, recorded: str) -> str:
+    """
+    Classify a file on disk against its rendered and recorded contents.
+
+    Args:
+        current (str): The hash of the file on disk, or None if it is missing.
+        rendered (str): The hash of the file rendered from the current templates.
+        recorded (str): The hash recorded in the manifest when the file was generated, or None.
+
+    Returns:
+        str: 'unchanged' if the file is up to date, 'added' if it is missing, 'updated' if it is
+            still as generated from an older template, or 'edited' if it was changed since.
+    """
+    if current == rendered:
+        return 'unchanged'
+    if current is None:
+        return 'added'
+    if current == recorded:
+        return 'updated'
+    return 'edited'
+
+def write_synced_file(path: Path, content: bytes, store: blobs.BlobStore = None) -> None:
+    """
+    Replace a file with new content atomically, linking it from a blob store if one is given.
+
+    The cached bytecode of a rewritten module is removed, so it is compiled again from the new source.
+
+    Args:
+        path (Path): The file to write.
+        content (bytes): The file's new content.
+        store (BlobStore, optional): The blob store to link the file from.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f'.{path.name}.{os.getpid()}.sync')
+    temporary.unlink(missing_ok=True)
+    if store is not None:
+        store.link(content, temporary)
+    else:
+        blobs.write_file(temporary, content, blobs.FILE_MODE)
+    os.replace(temporary, path)
+    invalidate_bytecode(path)
+
+def sync_project(project_path: Path, tree, store: blobs.BlobStore = None, dry_run: bool = False) -> dict:
+    """
+    Rewrite the missing and pristine files of a project and update its manifest.
+
+    Files whose size and modification time still match their manifest entry are not read
+    again. Without a manifest, nothing is known about older templates, so only missing
+    files are written; a manifest is then recorded for the files that match the current
+    templates.
+
+    Args:
+        project_path (Path): The path of the project.
+        tree (ProjectTree): The project rendered from the current templates.
+        store (BlobStore, optional): The blob store to link shared files from.
+        dry_run (bool): Whether to only classify the files without writing anything (default: False).
+
+    Returns:
+        dict: The path of each file of the tree mapped to its status, as given by `file_status`.
+    """
+    project_path = Path(project_path)
+    manifest = read_manifest(project_path)
+    recorded = manifest['files'] if manifest else {}
+    synced = {
+        'version': MANIFEST_VERSION,
+        'files': {},
+        'venv': manifest.get('venv') if manifest else None
+    }
+    statuses = {}
+
+    for path in tree:
+        key = str(path)
+        entry = recorded.get(key)
+        current, _ = current_digest(project_path / path, entry)
+        rendered = digest(tree[path])
+        status = statuses[key] = file_status(current, rendered, entry['sha256'] if entry else None)
+
+        if status == 'edited':
+            # Keep what was generated, so the file is recognised if the edit is reverted
+            if entry:
+                synced['files'][key] = entry
+            continue
+        if status in REWRITTEN and not dry_run:
+            write_synced_file(project_path / path, tree[path], store if path in tree.shared else None)
+        if status == 'unchanged' and entry and entry.get('sha256') == rendered and \
+                (entry.get('template'), entry.get('version')) == tree.sources.get(path, (None, None)):
+            synced['files'][key] = entry
+        elif not dry_run:
+            synced['files'][key] = file_entry(project_path / path, tree[path], tree.sources.get(path))
+
+    if not dry_run and synced != manifest:
+        write_manifest(project_path, synced)
+    return statuses
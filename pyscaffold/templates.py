@@ -0,0 +1,241 @@
+"""
+Pyscaffold Templates
+
+This module contains the template engine used to render the fragments of a new project.
+Placeholders are written `${name}`, so the braces of the Python code in the fragments need
+no escaping; `$${` renders a literal `${`. A template is parsed once into a list of literal
+and placeholder segments, and rendering it only fills the placeholders and joins the parts.
+Rendered outputs are kept in a bounded LRU cache, and templates without placeholders are
+rendered once per process. Fragments are read from the template pack the first time they
+are rendered.
+
+Classes:
+    Template: A template compiled into literal and placeholder segments.
+    FragmentTemplate: A template read from the template pack and compiled on first use.
+    RenderCache: A bounded LRU cache of rendered templates with hit and miss counters.
+
+Functions:
+    compile_template: Compile a template source, reusing earlier compilations of the same source.
+    compile_fragment: Retrieve one of the templates defined in `pyscaffold.fragments`, compiled on first use.
+
+Attributes:
+    render_cache (RenderCache): The render cache shared by the whole process.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+from pyscaffold import pack
+
+PLACEHOLDER_PATTERN = re.compile(r'\$(\$?)\{([A-Za-z_][A-Za-z0-9_]*)\}')
+
+class Template():
+    """
+    A template compiled into literal and placeholder segments.
+    """
+
+    __slots__ = ('source', 'name', 'version', 'names', '_parts', '_slots')
+
+    def __init__(self, source: str, name: str = None):
+        """
+        Parse a template source into its segments.
+
+        Args:
+            source (str): The template text, with placeholders written `${name}`.
+            name (str, optional): The identifier of the template, e.g. the name of its fragment.
+        """
+        import hashlib
+
+        self.source = source
+        self.name = name
+        self.version = hashlib.sha1(source.encode('utf-8')).hexdigest()[:12]
+        parts = []
+        slots = []
+        literal = ''
+        position = 0
+        for match in PLACEHOLDER_PATTERN.finditer(source):
+            escaped, placeholder = match.groups()
+            literal += source[position:match.start()]
+            position = match.end()
+            if escaped:
+                literal += match.group(0)[1:]
+                continue
+            parts.append(literal)
+            slots.append((len(parts), placeholder))
+            parts.append(None)
+            literal = ''
+        parts.append(literal + source[position:])
+
+        self._parts = tuple(parts)
+        self._slots = tuple(slots)
+        self.names = frozenset(name for _, name in slots)
+
+    def render(self, **values) -> str:
+        """
+        Render the template by filling its placeholders.
+
+        Args:
+            **values: The value of each placeholder, by name. Unused values are ignored.
+
+        Returns:
+            str: The rendered text.
+
+        Raises:
+            KeyError: If a placeholder has no value.
+        """
+        if not self._slots:
+            return self._parts[0]
+        parts = list(self._parts)
+        for index, name in self._slots:
+            parts[index] = values[name]
+        return ''.join(parts)
+
+    def __repr__(self) -> str:
+        return f'Template({self.name or self.source[:40]!r}, version={self.version!r})'
+
+@lru_cache(maxsize=None)
+def compile_template(source: str, name: str = None) -> Template:
+    """
+    Compile a template source, reusing earlier compilations of the same source.
+
+    Args:
+        source (str): The template text, with placeholders written `${name}`.
+        name (str, optional): The identifier of the template, e.g. the name of its fragment.
+
+    Returns:
+        Template: The compiled template.
+    """
+    return Template(source, name)
+
+class FragmentTemplate(Template):
+    """
+    A template read from the template pack and compiled the first time it is used.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, name: str):
+        """
+        Declare a fragment without reading it yet.
+
+        Args:
+            name (str): The name of the fragment, e.g. 'PKG_MAIN_PY'.
+        """
+        self.name = name
+
+    def __getattr__(self, attribute: str):
+        # Only called for slots that are not set yet, i.e. before the fragment is loaded
+        if attribute not in Template.__slots__:
+            raise AttributeError(attribute)
+        Template.__init__(self, pack.load_fragment(self.name), self.name)
+        return getattr(self, attribute)
+
+@lru_cache(maxsize=None)
+def compile_fragment(name: str) -> Template:
+    """
+    Retrieve one of the templates defined in `pyscaffold.fragments`.
+
+    The fragment is read from the template pack and compiled the first time it is used,
+    so declaring templates costs nothing until they are rendered.
+
+    Args:
+        name (str): The name of the fragment, e.g. 'PKG_MAIN_PY'.
+
+    Returns:
+        Template: The template, identified by the fragment's name.
+    """
+    return FragmentTemplate(name)
+
+class RenderCache():
+    """
+    A bounded LRU cache of rendered templates, encoded as UTF-8.
+
+    Entries are keyed by the template's name and version and by the values of the placeholders
+    it uses, so a template that only uses `packagename` is shared by projects with the same
+    package name. Templates without placeholders render the same for every project, so they
+    are kept apart from the LRU entries and rendered only once.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize (int): The maximum number of rendered outputs kept for templates with placeholders.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._constants = {}
+        self._lock = threading.Lock()
+
+    def render(self, template: Template, project_name: str, package_name: str) -> bytes:
+        """
+        Render a template for a project, reusing an earlier rendering if there is one.
+
+        Args:
+            template (Template): The template to render.
+            project_name (str): The value of the `ProjectName` placeholder.
+            package_name (str): The value of the `packagename` placeholder.
+
+        Returns:
+            bytes: The rendered template, encoded as UTF-8.
+        """
+        if not template.names:
+            key = (template.name, template.version)
+            with self._lock:
+                content = self._constants.get(key)
+                if content is not None:
+                    self.hits += 1
+                    return content
+                self.misses += 1
+                content = self._constants[key] = template.render().encode('utf-8')
+            return content
+
+        values = {'ProjectName': project_name, 'packagename': package_name}
+        key = (template.name, template.version, *(values[name] for name in sorted(template.names)))
+        with self._lock:
+            content = self._entries.get(key)
+            if content is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return content
+            self.misses += 1
+
+        content = template.render(**values).encode('utf-8')
+        with self._lock:
+            self._entries[key] = content
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return content
+
+    def stats(self) -> dict:
+        """
+        Report the cache's counters.
+
+        Returns:
+            dict: The 'hits', 'misses', current 'size', 'maxsize' and number of 'constants' rendered once.
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'constants': len(self._constants)
+            }
+
+    def clear(self) -> None:
+        """
+        Drop every rendered output and reset the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._constants.clear()
+            self.hits = 0
+            self.misses = 0
+
+render_cache = RenderCache()
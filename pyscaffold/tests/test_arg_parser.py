@@ -9,7 +9,16 @@ Tests:
 - test_list_command: Verifies that the `list` command parses and stores the destination directory argument correctly.
 - test_start_command: Validates that the `start` command correctly parses multiple project names, the destination directory, 
   and the Python version.
+- test_start_command_jobs: Validates that the `--jobs` option of the `start` command is parsed as an integer.
+- test_start_command_engine: Validates that the `--engine` option of the `start` command accepts only known engines.
+- test_start_command_dry_run: Validates that the `--dry-run` flag of the `start` command defaults to False.
+- test_start_command_compile: Validates that the `--compile` flag and its `--invalidation-mode` option are parsed.
+- test_start_command_link_shared: Validates that the `--link-shared` flag of the `start` command defaults to False.
+- test_start_command_durability: Validates that the `--durability` option of the `start` command accepts only known modes.
 - test_resume_command: Tests that the `resume` command correctly parses the project name and destination directory arguments.
+- test_sync_command: Verifies that the `sync` command accepts zero or more project names and its options.
+- test_pool_command: Ensures that the `pool` command parses its action and options.
+- test_interpreters_command: Ensures that the `interpreters` command parses its `--refresh` flag.
 - test_no_command: Checks that no command raises a `SystemExit` exception when no arguments are provided.
 - test_help_option: Ensures that the `--help` option prints the help message and exits.
 """
@@ -62,6 +71,101 @@ def test_start_command():
     assert args.python_version == '3.10'
     assert args.destination == 'some/other/directory'
 
+def test_start_command_jobs():
+    """
+    Test the `--jobs` option of the `start` command.
+
+    Validates that `--jobs` is parsed as an integer and is left unset by default so each engine picks its own bound.
+
+    Args:
+        None
+    """
+    parser = create_parser()
+    args = parser.parse_args(['start', 'ProjectA', 'ProjectB', '--jobs', '4'])
+    assert args.jobs == 4
+    args = parser.parse_args(['start', 'ProjectA'])
+    assert args.jobs is None
+
+def test_start_command_engine():
+    """
+    Test the `--engine` option of the `start` command.
+
+    Validates that the engine defaults to 'process', accepts 'asyncio' and rejects anything else.
+
+    Args:
+        None
+    """
+    parser = create_parser()
+    assert parser.parse_args(['start', 'ProjectA']).engine == 'process'
+    assert parser.parse_args(['start', 'ProjectA', '--engine', 'asyncio']).engine == 'asyncio'
+    with pytest.raises(SystemExit):
+        parser.parse_args(['start', 'ProjectA', '--engine', 'threads'])
+
+def test_start_command_dry_run():
+    """
+    Test the `--dry-run` flag of the `start` command.
+
+    Validates that the flag defaults to False and is set by both its long and short forms.
+
+    Args:
+        None
+    """
+    parser = create_parser()
+    assert parser.parse_args(['start', 'ProjectA']).dry_run is False
+    assert parser.parse_args(['start', 'ProjectA', '--dry-run']).dry_run is True
+    assert parser.parse_args(['start', 'ProjectA', '-n']).dry_run is True
+
+def test_start_command_compile():
+    """
+    Test the `--compile` flag of the `start` command.
+
+    Validates that the flag defaults to False, that the invalidation mode defaults to 'timestamp',
+    and that unknown invalidation modes are rejected.
+
+    Args:
+        None
+    """
+    parser = create_parser()
+    args = parser.parse_args(['start', 'ProjectA'])
+    assert args.compile is False
+    assert args.invalidation_mode == 'timestamp'
+
+    args = parser.parse_args(['start', 'ProjectA', '--compile', '--invalidation-mode', 'unchecked-hash'])
+    assert args.compile is True
+    assert args.invalidation_mode == 'unchecked-hash'
+
+    with pytest.raises(SystemExit):
+        parser.parse_args(['start', 'ProjectA', '--compile', '--invalidation-mode', 'never'])
+
+def test_start_command_link_shared():
+    """
+    Test the `--link-shared` flag of the `start` command.
+
+    Validates that the flag defaults to False, so the 'files.LINK_SHARED' setting applies, and is set when given.
+
+    Args:
+        None
+    """
+    parser = create_parser()
+    assert parser.parse_args(['start', 'ProjectA']).link_shared is False
+    assert parser.parse_args(['start', 'ProjectA', '--link-shared']).link_shared is True
+
+def test_start_command_durability():
+    """
+    Test the `--durability` option of the `start` command.
+
+    Validates that the option defaults to None, so the 'files.DURABILITY' setting applies, and rejects unknown modes.
+
+    Args:
+        None
+    """
+    parser = create_parser()
+    assert parser.parse_args(['start', 'ProjectA']).durability is None
+    assert parser.parse_args(['start', 'ProjectA', '--durability', 'batch']).durability == 'batch'
+
+    with pytest.raises(SystemExit):
+        parser.parse_args(['start', 'ProjectA', '--durability', 'always'])
+
 def test_resume_command():
     """
     Test the `resume` command of the argument parser.
@@ -77,6 +181,64 @@ def test_resume_command():
     assert args.project_name == 'ProjectA'
     assert args.destination == 'yet/another/directory'
 
+def test_sync_command():
+    """
+    Test the `sync` command of the argument parser.
+
+    Ensures that the `sync` command parses any number of project names, the destination directory,
+    the number of parallel jobs and its `--dry-run` and `--link-shared` flags.
+
+    Args:
+        None
+    """
+    parser = create_parser()
+    args = parser.parse_args(['sync', 'ProjectA', 'ProjectB', '--destination', '/path/to/destination'])
+    assert args.command == 'sync'
+    assert args.project_names == ['ProjectA', 'ProjectB']
+    assert args.destination == '/path/to/destination'
+
+    args = parser.parse_args(['sync'])
+    assert args.project_names == []
+    assert args.jobs is None and args.dry_run is False and args.link_shared is False
+
+    args = parser.parse_args(['sync', '-j', '8', '--dry-run', '--link-shared'])
+    assert args.jobs == 8 and args.dry_run is True and args.link_shared is True
+
+def test_pool_command():
+    """
+    Test the `pool` command of the argument parser.
+
+    Ensures that the `pool` command parses the action, Python version, pool size and destination directory.
+
+    Args:
+        None
+    """
+    parser = create_parser()
+    args = parser.parse_args(['pool', 'fill', '--python-version', '3.12', '--size', '3', '--destination', 'some/directory'])
+    assert args.command == 'pool'
+    assert args.action == 'fill'
+    assert args.python_version == '3.12'
+    assert args.size == 3
+    assert args.destination == 'some/directory'
+
+def test_interpreters_command():
+    """
+    Test the `interpreters` command of the argument parser.
+
+    Ensures that the `interpreters` command takes no destination and parses the `--refresh` flag.
+
+    Args:
+        None
+    """
+    parser = create_parser()
+    args = parser.parse_args(['interpreters'])
+    assert args.command == 'interpreters'
+    assert args.refresh is False
+    assert not hasattr(args, 'destination')
+
+    args = parser.parse_args(['interpreters', '--refresh'])
+    assert args.refresh is True
+
 def test_no_command():
     """
     Test the absence of a command.
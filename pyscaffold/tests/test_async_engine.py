@@ -0,0 +1,131 @@
+"""
+Pyscaffold Test Async Engine
+
+This module contains tests for the asyncio-based engine behind `Pyscaffold.start`. It verifies that
+virtual environments are launched as subprocesses, that several projects are scaffolded on one event
+loop, and that the failure of one project does not affect the others.
+
+Tests:
+- test_deploy_virtual_environment_async: Verifies that a virtual environment is created by the async subprocess.
+- test_deploy_virtual_environment_async_invalid_python: Ensures a missing interpreter raises a `RuntimeError`.
+- test_run_projects_async: Validates that several projects are created and their results returned in order.
+- test_run_projects_async_isolates_failure: Ensures a failing project is reported without affecting the others.
+- test_start_with_asyncio_engine: Checks that `Pyscaffold.start` dispatches to the asyncio engine.
+"""
+
+import asyncio
+import shutil
+from unittest import mock
+
+import pytest
+
+from pyscaffold.config import Config, ConfigSnapshot
+from pyscaffold.pyscaffold import Pyscaffold
+from pyscaffold.async_engine import (
+    deploy_virtual_environment_async,
+    wait_for_virtual_environment,
+    run_projects_async
+)
+
+@pytest.fixture(scope="function")
+def setup_and_teardown():
+    """
+    Fixture to set up and tear down the dummy projects directory.
+
+    Teardown:
+        - Cleans up the dummy projects directory after the test completes.
+    """
+    dummy_projects_dir = Config().get_tests_directory_path()
+
+    yield dummy_projects_dir
+
+    for item in dummy_projects_dir.iterdir():
+        if item.is_dir():
+            shutil.rmtree(item)
+        else:
+            item.unlink()
+
+def test_deploy_virtual_environment_async(setup_and_teardown):
+    """
+    Test creating a virtual environment with the async subprocess.
+
+    Validates that:
+        - The virtual environment exists once the subprocess has been awaited.
+    """
+    project_path = setup_and_teardown / 'AsyncVenvProject'
+    project_path.mkdir()
+
+    async def deploy():
+        process = await deploy_virtual_environment_async(project_path, '3.11')
+        return await wait_for_virtual_environment(process, project_path)
+
+    assert asyncio.run(deploy()) is True
+    assert (project_path / 'env' / 'bin' / 'python').exists()
+
+def test_deploy_virtual_environment_async_invalid_python(setup_and_teardown):
+    """
+    Test launching a virtual environment with a missing interpreter.
+
+    Validates that:
+        - A `RuntimeError` is raised before any subprocess is spawned.
+    """
+    project_path = setup_and_teardown
+
+    with mock.patch('shutil.which', return_value=None):
+        with pytest.raises(RuntimeError, match='Python 9.9 is not installed or not found in PATH.'):
+            asyncio.run(deploy_virtual_environment_async(project_path, '9.9'))
+
+def test_run_projects_async(setup_and_teardown):
+    """
+    Test scaffolding several projects on one event loop.
+
+    Validates that:
+        - Every project gets its files and virtual environment.
+        - Results are returned in the order the projects were given.
+    """
+    dummy_projects_dir = setup_and_teardown
+    project_names = ['AsyncProjectA', 'AsyncProjectB']
+
+    results = asyncio.run(run_projects_async(project_names, '3.11', str(dummy_projects_dir), jobs=2))
+
+    assert [result.name for result in results] == project_names
+    assert all(result.status == 'ok' for result in results)
+    for project_name in project_names:
+        assert (dummy_projects_dir / project_name / 'setup.py').exists()
+        assert (dummy_projects_dir / project_name / 'tests' / 'test_cli.py').exists()
+        assert (dummy_projects_dir / project_name / 'env' / 'bin' / 'python').exists()
+
+def test_run_projects_async_isolates_failure(setup_and_teardown):
+    """
+    Test that a failing project does not affect the others.
+
+    Validates that:
+        - A project whose folder already exists is reported as failed.
+        - The other project is still created.
+    """
+    dummy_projects_dir = setup_and_teardown
+    (dummy_projects_dir / 'AsyncExisting').mkdir()
+
+    results = asyncio.run(run_projects_async(['AsyncExisting', 'AsyncFresh'], '3.11', str(dummy_projects_dir), jobs=2))
+
+    assert [result.status for result in results] == ['failed', 'ok']
+    assert 'already exists' in results[0].error
+    assert (dummy_projects_dir / 'AsyncFresh' / 'env').exists()
+
+def test_start_with_asyncio_engine(setup_and_teardown):
+    """
+    Test that `Pyscaffold.start` dispatches to the asyncio engine.
+
+    Validates that:
+        - The asyncio engine runs every project and `start` returns True.
+        - The projects are given a snapshot of the configuration read by `start`.
+    """
+    dummy_projects_dir = setup_and_teardown
+
+    with mock.patch('pyscaffold.async_engine.run_projects_async', wraps=run_projects_async) as mock_run:
+        result = Pyscaffold.start(['AsyncStartA', 'AsyncStartB'], '3.11', destination=str(dummy_projects_dir), engine='asyncio', jobs=2)
+
+    assert result is True
+    mock_run.assert_called_once_with(['AsyncStartA', 'AsyncStartB'], '3.11', str(dummy_projects_dir), 2, venv_strategy='standard', link_shared=False, durability='none', config=mock.ANY)
+    assert isinstance(mock_run.call_args.kwargs['config'], ConfigSnapshot)
+    assert (dummy_projects_dir / 'AsyncStartB' / 'env').exists()
@@ -0,0 +1,229 @@
+"""
+Pyscaffold Test Blobs
+
+This module contains tests for the content-addressed blob store. It verifies that identical contents
+are stored once as read-only blobs and hardlinked into projects, that files fall back to copies when they
+cannot be linked, and that shared files modified in place are given a private copy.
+
+Fixtures:
+- store: Creates an empty blob store in a temporary directory.
+
+Tests:
+- test_put: Verifies that a blob is named after its content, read-only, and stored only once.
+- test_link: Validates that files with the same content are hardlinks of a single blob.
+- test_link_falls_back_to_copy: Ensures a file is written as a writable copy when it cannot be linked.
+- test_unshare: Checks that an unshared file keeps its content in a private, writable copy.
+- test_check_project: Verifies that intact links are reported and modified ones are unshared and evicted.
+- test_check_project_shared_edit: Ensures only the first project sharing an altered blob keeps the edit and the others are restored.
+- test_check_project_ignores_other_links: Ensures hardlinks that are not shared files from the store are left alone.
+- test_find: Checks that the store is scanned once to find the blobs files are linked to.
+"""
+
+import os
+import errno
+import stat
+from unittest import mock
+
+import pytest
+
+from pyscaffold.blobs import BlobStore, unshare, check_project
+from pyscaffold.tree import ProjectTree
+
+@pytest.fixture(scope="function")
+def store(tmp_path):
+    """
+    Fixture to create an empty blob store.
+
+    Returns:
+        BlobStore: A blob store in a temporary directory.
+    """
+    yield BlobStore(tmp_path / 'blobs')
+
+def test_put(store):
+    """
+    Test storing blobs.
+
+    Validates that:
+        - A blob is named after the SHA-256 of its content and holds that content.
+        - Blobs are read-only.
+        - Storing the same content twice returns the existing blob.
+    """
+    path = store.put(b'MIT License\n')
+
+    assert path == store.path(BlobStore.digest(b'MIT License\n'))
+    assert path.read_bytes() == b'MIT License\n'
+    assert stat.S_IMODE(path.stat().st_mode) == 0o444
+
+    with mock.patch('pyscaffold.blobs.write_file') as mock_write:
+        assert store.put(b'MIT License\n') == path
+    mock_write.assert_not_called()
+
+def test_link(store, tmp_path):
+    """
+    Test linking files from the store.
+
+    Validates that:
+        - Two files with the same content share the inode of one blob.
+    """
+    (tmp_path / 'a').mkdir()
+    (tmp_path / 'b').mkdir()
+
+    assert store.link(b'', tmp_path / 'a' / '__init__.py') is True
+    assert store.link(b'', tmp_path / 'b' / '__init__.py') is True
+
+    blob = store.path(BlobStore.digest(b''))
+    assert os.path.samefile(tmp_path / 'a' / '__init__.py', blob)
+    assert os.path.samefile(tmp_path / 'b' / '__init__.py', blob)
+    assert blob.stat().st_nlink == 3
+
+def test_link_falls_back_to_copy(store, tmp_path):
+    """
+    Test linking a file across filesystems.
+
+    Validates that:
+        - The file is written as a regular, writable copy with the same content.
+    """
+    target = tmp_path / 'LICENSE'
+
+    with mock.patch('pyscaffold.blobs.os.link', side_effect=OSError(errno.EXDEV, 'Invalid cross-device link')):
+        assert store.link(b'MIT License\n', target) is False
+
+    assert target.read_bytes() == b'MIT License\n'
+    assert target.stat().st_nlink == 1
+    assert stat.S_IMODE(target.stat().st_mode) == 0o644
+
+def test_unshare(store, tmp_path):
+    """
+    Test unsharing a linked file.
+
+    Validates that:
+        - The file keeps its content but no longer shares the blob's inode.
+        - The copy is writable and the blob is untouched.
+    """
+    target = tmp_path / 'LICENSE'
+    store.link(b'MIT License\n', target)
+
+    unshare(target)
+    target.write_bytes(b'Edited\n')
+
+    blob = store.path(BlobStore.digest(b'MIT License\n'))
+    assert not os.path.samefile(target, blob)
+    assert blob.read_bytes() == b'MIT License\n'
+    assert blob.stat().st_nlink == 1
+
+def shared_tree(**files) -> ProjectTree:
+    """
+    Build a tree whose files are all shared.
+
+    Args:
+        **files: The content of each file, by name.
+
+    Returns:
+        ProjectTree: The tree.
+    """
+    tree = ProjectTree()
+    for name, content in files.items():
+        tree.add(name, content, shared=True)
+    return tree
+
+def test_check_project(store, tmp_path):
+    """
+    Test checking the shared files of a project.
+
+    Validates that:
+        - Files linked to an intact blob are 'linked'.
+        - A shared file written to in place is 'modified', gets a private copy and its blob is removed.
+        - Files the tree does not mark as shared are not checked.
+    """
+    project_path = tmp_path / 'MyProject'
+    (project_path / 'env').mkdir(parents=True)
+    store.link(b'', project_path / '__init__.py')
+    store.link(b'MIT License\n', project_path / 'LICENSE')
+    store.link(b'', project_path / 'env' / '__init__.py')
+    altered = store.path(BlobStore.digest(b'MIT License\n'))
+    os.chmod(project_path / 'LICENSE', 0o644)
+    (project_path / 'LICENSE').write_bytes(b'Edited in place\n')
+    tree = shared_tree(**{'__init__.py': b'', 'LICENSE': b'MIT License\n'})
+
+    assert check_project(project_path, tree, BlobStore(store.root), repair=False) == {'LICENSE': 'modified', '__init__.py': 'linked'}
+    assert check_project(project_path, tree, store) == {'LICENSE': 'modified', '__init__.py': 'linked'}
+
+    assert (project_path / 'LICENSE').read_bytes() == b'Edited in place\n'
+    assert (project_path / 'LICENSE').stat().st_nlink == 1
+    assert not altered.exists()
+    assert not any((store.root / 'altered').iterdir())
+    assert check_project(project_path, tree, store) == {'__init__.py': 'linked'}
+
+def test_check_project_shared_edit(store, tmp_path):
+    """
+    Test checking projects that share a blob modified in place.
+
+    Validates that:
+        - The first project checked keeps the edit in a private copy and the altered blob is evicted.
+        - The other project sharing it is restored from its rendered content and linked again.
+        - The altered blob is deleted once no project file shares it.
+    """
+    tree = shared_tree(LICENSE=b'MIT License\n')
+    for name in ('Alpha', 'Beta'):
+        (tmp_path / name).mkdir()
+        store.link(b'MIT License\n', tmp_path / name / 'LICENSE')
+    os.chmod(tmp_path / 'Alpha' / 'LICENSE', 0o644)
+    (tmp_path / 'Alpha' / 'LICENSE').write_bytes(b'ALPHA EDIT\n')
+    assert (tmp_path / 'Beta' / 'LICENSE').read_bytes() == b'ALPHA EDIT\n'
+
+    assert check_project(tmp_path / 'Alpha', tree, store) == {'LICENSE': 'modified'}
+    assert len(list((store.root / 'altered').iterdir())) == 1
+
+    assert check_project(tmp_path / 'Beta', tree, store) == {'LICENSE': 'restored'}
+    assert (tmp_path / 'Alpha' / 'LICENSE').read_bytes() == b'ALPHA EDIT\n'
+    assert (tmp_path / 'Beta' / 'LICENSE').read_bytes() == b'MIT License\n'
+    assert os.path.samefile(tmp_path / 'Beta' / 'LICENSE', store.path(BlobStore.digest(b'MIT License\n')))
+    assert not any((store.root / 'altered').iterdir())
+
+    # A later run, with a fresh store, finds nothing left to repair
+    assert check_project(tmp_path / 'Beta', tree, BlobStore(store.root)) == {'LICENSE': 'linked'}
+    assert check_project(tmp_path / 'Alpha', tree, BlobStore(store.root)) == {}
+
+def test_check_project_ignores_other_links(store, tmp_path):
+    """
+    Test checking a project holding hardlinks of its own.
+
+    Validates that:
+        - Shared files linked to each other but not to the store are not reported.
+        - Hardlinked files the tree does not mark as shared, such as git objects, are not read,
+          and the store is not scanned for them.
+    """
+    project_path = tmp_path / 'MyProject'
+    (project_path / '.git' / 'objects').mkdir(parents=True)
+    (project_path / 'data.txt').write_bytes(b'data\n')
+    os.link(project_path / 'data.txt', project_path / 'copy.txt')
+    (project_path / '.git' / 'objects' / 'pack').write_bytes(b'objects\n')
+    os.link(project_path / '.git' / 'objects' / 'pack', tmp_path / 'clone-pack')
+    store.put(b'other\n')
+
+    assert check_project(project_path, shared_tree(**{'copy.txt': b'data\n'}), store) == {}
+    assert (project_path / 'copy.txt').stat().st_nlink == 2
+
+    with mock.patch.object(BlobStore, 'find') as mock_find:
+        assert check_project(project_path, shared_tree(LICENSE=b'MIT License\n'), store) == {}
+    mock_find.assert_not_called()
+
+def test_find(store, tmp_path):
+    """
+    Test finding the blob a file is linked to.
+
+    Validates that:
+        - The store is scanned once, however many files are looked up.
+        - An evicted blob is found under its new name.
+    """
+    store.link(b'MIT License\n', tmp_path / 'LICENSE')
+    blob = store.path(BlobStore.digest(b'MIT License\n'))
+
+    with mock.patch('pyscaffold.blobs.os.scandir', wraps=os.scandir) as mock_scandir:
+        assert store.find((tmp_path / 'LICENSE').stat()) == blob
+        scans = mock_scandir.call_count
+        assert store.find(os.stat(tmp_path)) is None
+        assert mock_scandir.call_count == scans
+
+    evicted = store.evict(blob)
+    assert store.find((tmp_path / 'LICENSE').stat()) == evicted
@@ -0,0 +1,151 @@
+"""
+Pyscaffold Test Bytecode
+
+This module contains tests for the precompilation of new projects. It verifies that a project's
+package and tests are compiled into `__pycache__` by the interpreter of its virtual environment, with
+the requested invalidation mode, and that projects are compiled in a batch.
+
+Fixtures:
+- project: Creates a project with a package, tests and a virtual environment without pip.
+
+Tests:
+- test_compile_project: Verifies that every module is compiled with the environment's magic number.
+- test_compile_project_unchecked_hash: Ensures 'unchecked-hash' bytecode is flagged as hash-based and unchecked.
+- test_compile_project_without_environment: Ensures a project without a virtual environment raises a `FileNotFoundError`.
+- test_compile_projects: Validates that a batch compiles each project and skips failing ones.
+- test_compile_projects_unknown_mode: Ensures an unknown invalidation mode raises a `ValueError`.
+- test_invalidate_bytecode: Checks that only the bytecode of the rewritten module is removed.
+"""
+
+import sys
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from pyscaffold import bytecode, venvs
+
+PYTHON_VERSION = f'{sys.version_info.major}.{sys.version_info.minor}'
+
+def create_project(root: Path, project_name: str, package_name: str) -> Path:
+    """
+    Create a project with a package, tests and a virtual environment without pip.
+
+    Returns:
+        Path: The path of the project.
+    """
+    project_path = root / project_name
+    (project_path / package_name).mkdir(parents=True)
+    (project_path / package_name / '__init__.py').write_text('')
+    (project_path / package_name / 'utils.py').write_text('def double(x):\n    return 2 * x\n')
+    (project_path / 'tests').mkdir()
+    (project_path / 'tests' / 'test_utils.py').write_text(f'from {package_name}.utils import double\n')
+    (project_path / 'setup.py').write_text('from setuptools import setup\n')
+    venvs.create_environment(project_path / 'env', PYTHON_VERSION, sys.executable, with_pip=False)
+    return project_path
+
+def pyc_flags(source: Path) -> int:
+    """
+    Read the flags of the bytecode compiled for a source file.
+
+    Returns:
+        int: The flags word of the `.pyc` header.
+    """
+    data = Path(importlib.util.cache_from_source(str(source))).read_bytes()
+    return int.from_bytes(data[4:8], 'little')
+
+@pytest.fixture(scope="function")
+def project(tmp_path):
+    """
+    Fixture to create a project ready to be compiled.
+
+    Returns:
+        Path: The path of the project.
+    """
+    yield create_project(tmp_path, 'MyProject', 'my_project')
+
+def test_compile_project(project):
+    """
+    Test compiling a project.
+
+    Validates that:
+        - Every module of the package and the tests has bytecode with the environment's magic number.
+        - Files outside the package and the tests are not compiled.
+    """
+    bytecode.compile_project(project)
+
+    for source in ('my_project/__init__.py', 'my_project/utils.py', 'tests/test_utils.py'):
+        cached = Path(importlib.util.cache_from_source(str(project / source)))
+        assert cached.read_bytes()[:4] == importlib.util.MAGIC_NUMBER
+        assert pyc_flags(project / source) == 0
+    assert not (project / '__pycache__').exists()
+
+def test_compile_project_unchecked_hash(project):
+    """
+    Test compiling a project for a read-only deployment.
+
+    Validates that:
+        - The bytecode is hash-based and is not checked against its source.
+    """
+    bytecode.compile_project(project, 'unchecked-hash')
+
+    assert pyc_flags(project / 'my_project' / 'utils.py') == 0b01
+
+def test_compile_project_without_environment(tmp_path):
+    """
+    Test compiling a project without a virtual environment.
+
+    Validates that:
+        - A `FileNotFoundError` is raised.
+    """
+    (tmp_path / 'MyProject' / 'my_project').mkdir(parents=True)
+
+    with pytest.raises(FileNotFoundError):
+        bytecode.compile_project(tmp_path / 'MyProject')
+
+def test_compile_projects(project, tmp_path, capsys):
+    """
+    Test compiling a batch of projects.
+
+    Validates that:
+        - Each project with a virtual environment is compiled and counted.
+        - A project that cannot be compiled is reported and does not stop the batch.
+    """
+    other = create_project(tmp_path, 'OtherProject', 'other_project')
+    broken = tmp_path / 'BrokenProject'
+    (broken / 'broken_project').mkdir(parents=True)
+
+    assert bytecode.compile_projects([project, broken, other], 'checked-hash', jobs=2) == 2
+
+    assert pyc_flags(project / 'my_project' / 'utils.py') == 0b11
+    assert pyc_flags(other / 'other_project' / 'utils.py') == 0b11
+    assert "Error compiling project 'BrokenProject'" in capsys.readouterr().out
+
+def test_compile_projects_unknown_mode(project):
+    """
+    Test compiling with an unknown invalidation mode.
+
+    Validates that:
+        - A `ValueError` is raised before anything is compiled.
+    """
+    with pytest.raises(ValueError, match='Unknown invalidation mode'):
+        bytecode.compile_projects([project], 'never')
+
+    assert not (project / 'my_project' / '__pycache__').exists()
+
+def test_invalidate_bytecode(project):
+    """
+    Test removing the bytecode of a rewritten module.
+
+    Validates that:
+        - The module's bytecode is removed for every interpreter and optimization level.
+        - The bytecode of other modules is kept, and files that are not modules are ignored.
+    """
+    bytecode.compile_project(project, 'unchecked-hash')
+    cache = project / 'my_project' / '__pycache__'
+    (cache / 'utils.cpython-399.opt-1.pyc').write_bytes(b'')
+
+    assert bytecode.invalidate_bytecode(project / 'my_project' / 'utils.py') == 2
+    assert not list(cache.glob('utils.*.pyc'))
+    assert list(cache.glob('__init__.*.pyc'))
+    assert bytecode.invalidate_bytecode(project / 'setup.cfg') == 0
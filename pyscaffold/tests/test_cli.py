@@ -10,6 +10,7 @@ Tests:
 - test_start_command_two_projects: Tests the `start` command with two project names and verifies that both projects are started correctly in the specified destination.
 - test_start_command_with_good_explicit_destination: Validates that the `start` command works correctly with an explicitly specified destination directory.
 - test_start_command_with_bad_explicit_destination: Ensures that the `start` command fails with an invalid explicitly specified destination directory.
+- test_list_command: Verifies that the `list` command prints each project in the specified destination with its readiness.
 - test_resume_existing_project: Tests the `resume` command for an existing project. It sets up a dummy project, initializes a virtual environment, and verifies that the project is resumed correctly. It also checks for the presence of a marker file to indicate successful resume.
 
 """
@@ -136,6 +137,26 @@ def test_start_command_with_bad_explicit_destination(script_runner):
     assert not ret.success
     assert "The provided destination directory is not valid." in ret.stderr
 
+@pytest.mark.script_launch_mode('subprocess')
+def test_list_command(script_runner, setup_and_teardown):
+    """
+    Test the `list` command.
+
+    Ensures that each project in the destination is listed with its readiness, followed by a summary.
+
+    Args:
+        script_runner (pytest.ScriptRunner): The pytest fixture to run CLI commands.
+        setup_and_teardown (Path): The test projects directory.
+    """
+    project_path = Path(setup_and_teardown) / 'ListedProject'
+    (project_path / 'env').mkdir(parents=True)
+    (project_path / 'setup.py').touch()
+
+    ret = script_runner.run(['pyscaffold', 'list', '--destination', str(setup_and_teardown)])
+    assert ret.success
+    assert 'ListedProject' in ret.stdout
+    assert '1 project(s), 1 ready' in ret.stdout
+
 @pytest.mark.script_launch_mode('subprocess')
 def test_resume_existing_project(script_runner, monkeypatch):
     """
@@ -7,6 +7,8 @@ tests the retrieval of project and test directory paths from the configuration a
 
 Fixtures:
 - config_file: Provides a temporary configuration file for the tests.
+- fresh_config_file: Provides a configuration file no process has parsed yet, with an empty parse cache.
+- layers: Provides isolated default, user and projects root configuration files, with empty layer caches.
 
 Tests:
 - test_load_from_file: Verifies that configuration values can be correctly loaded from the file.
@@ -18,10 +20,33 @@ Tests:
 - test_get_tests_directory_path: Validates that the tests directory path is retrieved correctly.
 - test_invalid_get_projects_directory_path: Tests the handling of an invalid projects directory path.
 - test_invalid_get_tests_directory_path: Ensures proper error handling for an invalid tests directory path.
+- test_get_cache_directory_path: Checks that the cache directory path is resolved and created.
+- test_parse_cache: Verifies that a file is parsed once per process while each instance gets its own settings.
+- test_parse_cache_invalidated: Ensures a file is parsed again once it changed.
+- test_sidecar: Validates that settings parsed by another process are read from the sidecar without parsing.
+- test_sidecar_stale: Ensures a stale or corrupt sidecar is ignored and rewritten.
+- test_settings_without_sidecar: Checks that settings marshal cannot represent are parsed every time.
+- test_backends: Verifies that YAML, TOML and JSON files holding the same settings load identically.
+- test_yaml_backend_uses_libyaml: Ensures YAML is parsed with libyaml's `CSafeLoader` when it is available.
+- test_unsupported_backend: Checks that a file with an unknown extension raises a `ValueError`.
+- test_index: Verifies that settings and sections are indexed by dotted key when loaded.
+- test_index_in_sync: Ensures adding, replacing and updating settings keeps the index in sync.
+- test_snapshot: Validates that a snapshot answers like the configuration and cannot be changed.
+- test_snapshot_pickle: Checks that a snapshot survives pickling for a worker process.
+- test_environment_settings: Verifies that 'PYSCAFFOLD_*' variables are read as settings with their types.
+- test_layers: Validates that each layer overrides the ones before it.
+- test_layers_read_when_changed: Ensures only a changed layer is read again, and unchanged layers are not merged again.
+- test_layers_not_used_with_file: Checks that an explicit configuration file is read on its own.
+- test_get_projects_directory_path_unset: Ensures an unset projects directory raises a `ValueError`.
 """
 
+import os
+import pickle
+import datetime
 import pytest
 from pathlib import Path
+from unittest import mock
+from pyscaffold import config as config_module
 from pyscaffold.config import Config
 
 PROJECTS = "/home/engineer/source/python/projects"
@@ -170,5 +195,378 @@ def test_invalid_get_tests_directory_path(config_file):
     with pytest.raises(ValueError, match="Tests directory does not exist."):
         config.get_tests_directory_path()
 
+def test_get_cache_directory_path(config_file, tmp_path, monkeypatch):
+    """
+    Test retrieving the cache directory path.
+
+    Ensures that the cache directory defaults to 'pyscaffold' under $XDG_CACHE_HOME, that the `CACHE`
+    setting takes precedence, and that the directory is created.
+
+    Args:
+        config_file (Path): Path to the temporary configuration file.
+        tmp_path (Path): A temporary directory.
+        monkeypatch (MonkeyPatch): Pytest monkeypatch fixture.
+    """
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'xdg'))
+    config = Config(config_file)
+    assert config.get_cache_directory_path() == tmp_path / 'xdg' / 'pyscaffold'
+    assert (tmp_path / 'xdg' / 'pyscaffold').is_dir()
+
+    config.update_setting("locations", CACHE=str(tmp_path / 'custom'))
+    assert config.get_cache_directory_path() == tmp_path / 'custom'
+    assert (tmp_path / 'custom').is_dir()
+
+@pytest.fixture(scope="function")
+def fresh_config_file(tmp_path, monkeypatch):
+    """
+    Fixture to create a configuration file no process has parsed yet, with an empty parse cache.
+
+    Returns:
+        Path: The path to the configuration file.
+    """
+    monkeypatch.setattr(config_module, '_parse_cache', {})
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(sample_config)
+    return config_path
+
+def test_parse_cache(fresh_config_file):
+    """
+    Test the process-wide parse cache.
+
+    Validates that a file is parsed only once however many instances read it, and that changing
+    the settings of one instance does not affect the others.
+
+    Args:
+        fresh_config_file (Path): Path to a configuration file that was not parsed yet.
+    """
+    with mock.patch('pyscaffold.config.parse_file', wraps=config_module.parse_file) as mock_load:
+        first = Config(fresh_config_file)
+        second = Config(fresh_config_file)
+    assert mock_load.call_count == 1
+
+    first.update_setting("locations", PROJECTS="/changed")
+    assert second.get("locations.PROJECTS") == PROJECTS
+    assert Config(fresh_config_file).get("locations.PROJECTS") == PROJECTS
+
+def test_parse_cache_invalidated(fresh_config_file):
+    """
+    Test reading a configuration file that changed.
+
+    Validates that the new settings are parsed instead of served from the cache or the sidecar.
+
+    Args:
+        fresh_config_file (Path): Path to a configuration file that was not parsed yet.
+    """
+    Config(fresh_config_file)
+    fresh_config_file.write_text(sample_config.replace(PROJECTS, "/srv/projects"))
+    stat = fresh_config_file.stat()
+    os.utime(fresh_config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert Config(fresh_config_file).get("locations.PROJECTS") == "/srv/projects"
+
+def test_sidecar(fresh_config_file, monkeypatch):
+    """
+    Test reading settings from the sidecar of a configuration file.
+
+    Validates that the sidecar is written next to the file, and that a process with an empty
+    cache reads the settings from it without parsing the file.
+
+    Args:
+        fresh_config_file (Path): Path to a configuration file that was not parsed yet.
+        monkeypatch (MonkeyPatch): Pytest monkeypatch fixture.
+    """
+    Config(fresh_config_file)
+    assert config_module.sidecar_path(fresh_config_file) == fresh_config_file.parent / ".config.yaml.marshal"
+    assert config_module.sidecar_path(fresh_config_file).is_file()
+
+    monkeypatch.setattr(config_module, '_parse_cache', {})
+    with mock.patch('pyscaffold.config.parse_file', side_effect=AssertionError("parsed")):
+        assert Config(fresh_config_file).get("locations.TEST_PROJECTS") == "tests/dummyprojects"
+
+def test_sidecar_stale(fresh_config_file, monkeypatch):
+    """
+    Test ignoring a sidecar that cannot be used.
+
+    Validates that a corrupt sidecar and one recorded for another stamp are ignored, and that
+    the file is parsed and its sidecar rewritten.
+
+    Args:
+        fresh_config_file (Path): Path to a configuration file that was not parsed yet.
+        monkeypatch (MonkeyPatch): Pytest monkeypatch fixture.
+    """
+    sidecar = config_module.sidecar_path(fresh_config_file)
+    sidecar.write_bytes(b"not marshal data")
+    assert Config(fresh_config_file).get("locations.PROJECTS") == PROJECTS
+
+    stamp = config_module.file_stamp(fresh_config_file)
+    config_module.write_sidecar((stamp[0], stamp[1] - 1, stamp[2]), b"stale")
+    monkeypatch.setattr(config_module, '_parse_cache', {})
+    assert Config(fresh_config_file).get("locations.PROJECTS") == PROJECTS
+    assert config_module.read_sidecar(stamp) is not None
+
+def test_settings_without_sidecar(tmp_path, monkeypatch):
+    """
+    Test a configuration file holding values marshal cannot represent.
+
+    Validates that the settings are loaded, and parsed again rather than cached.
+
+    Args:
+        tmp_path (Path): A temporary directory.
+        monkeypatch (MonkeyPatch): Pytest monkeypatch fixture.
+    """
+    monkeypatch.setattr(config_module, '_parse_cache', {})
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("release:\n  DATE: 2024-01-31\n")
+
+    assert Config(config_path).get("release.DATE") == datetime.date(2024, 1, 31)
+    assert not config_module.sidecar_path(config_path).exists()
+    assert config_module._parse_cache == {}
+
+def test_backends(tmp_path, monkeypatch):
+    """
+    Test loading configuration files in each supported format.
+
+    Validates that the parser is chosen from the extension and that each format yields the same settings.
+
+    Args:
+        tmp_path (Path): A temporary directory.
+        monkeypatch (MonkeyPatch): Pytest monkeypatch fixture.
+    """
+    monkeypatch.setattr(config_module, '_parse_cache', {})
+    (tmp_path / "config.yaml").write_text(sample_config)
+    (tmp_path / "config.yml").write_text(sample_config)
+    (tmp_path / "config.toml").write_text('[locations]\nPROJECTS = "{}"\nTEST_PROJECTS = "tests/dummyprojects"\n'.format(PROJECTS))
+    (tmp_path / "config.json").write_text('{{"locations": {{"PROJECTS": "{}", "TEST_PROJECTS": "tests/dummyprojects"}}}}'.format(PROJECTS))
+
+    expected = {"locations": {"PROJECTS": PROJECTS, "TEST_PROJECTS": "tests/dummyprojects"}}
+    for name in ("config.yaml", "config.yml", "config.toml", "config.json"):
+        config = Config(tmp_path / name)
+        assert config.settings == expected
+        assert config.get("locations.PROJECTS") == PROJECTS
+
+def test_yaml_backend_uses_libyaml(config_file, monkeypatch):
+    """
+    Test the YAML backend's parser.
+
+    Validates that libyaml's `CSafeLoader` is used when PyYAML was built with it, and the
+    pure-Python `SafeLoader` otherwise.
+
+    Args:
+        config_file (Path): Path to the temporary configuration file.
+        monkeypatch (MonkeyPatch): Pytest monkeypatch fixture.
+    """
+    import yaml
+
+    with mock.patch('yaml.load', wraps=yaml.load) as mock_load:
+        config_module.parse_file(config_file)
+    assert mock_load.call_args.kwargs['Loader'] is getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+    monkeypatch.delattr(yaml, 'CSafeLoader', raising=False)
+    with mock.patch('yaml.load', wraps=yaml.load) as mock_load:
+        assert config_module.parse_file(config_file)["locations"]["PROJECTS"] == PROJECTS
+    assert mock_load.call_args.kwargs['Loader'] is yaml.SafeLoader
+
+def test_unsupported_backend(tmp_path):
+    """
+    Test loading a configuration file in an unsupported format.
+
+    Validates that a `ValueError` naming the supported extensions is raised.
+
+    Args:
+        tmp_path (Path): A temporary directory.
+    """
+    config_path = tmp_path / "config.ini"
+    config_path.write_text("[locations]\n")
+
+    with pytest.raises(ValueError, match="Unsupported configuration file"):
+        Config(config_path)
+
 if __name__ == "__main__":
     pytest.main()
+
+def test_index(config_file):
+    """
+    Test the dotted-key index of the settings.
+
+    Validates that:
+        - Every setting and every section is indexed under its dotted key.
+        - Nested settings are indexed under their full path.
+    """
+    config = Config(config_file)
+
+    assert config.index['locations.PROJECTS'] == PROJECTS
+    assert config.index['locations'] is config.settings['locations']
+    assert dict(config_module.flatten({'a': {'b': {'c': 1}}})) == {'a': {'b': {'c': 1}}, 'a.b': {'c': 1}, 'a.b.c': 1}
+
+def test_index_in_sync(config_file):
+    """
+    Test changing settings after they were indexed.
+
+    Validates that:
+        - A replaced section no longer answers for the settings it dropped.
+        - Updating a setting with a nested value indexes it, and replacing it drops the old keys.
+    """
+    config = Config(config_file)
+
+    config.add_setting("locations", PROJECTS="/srv/projects")
+    assert config.get("locations.PROJECTS") == "/srv/projects"
+    assert config.get("locations.TEST_PROJECTS") is None
+
+    config.update_setting("locations", CACHE={"DIR": "/tmp/cache"})
+    assert config.get("locations.CACHE.DIR") == "/tmp/cache"
+    config.update_setting("locations", CACHE="/var/cache")
+    assert config.get("locations.CACHE") == "/var/cache"
+    assert config.get("locations.CACHE.DIR") is None
+    assert config.index == dict(config_module.flatten(config.settings))
+
+def test_snapshot(config_file):
+    """
+    Test taking a snapshot of the configuration.
+
+    Validates that:
+        - The snapshot answers settings and sections like the configuration did when it was taken.
+        - Later changes to the configuration do not reach it, and it cannot be changed itself.
+    """
+    config = Config(config_file)
+    snapshot = config.snapshot()
+    config.update_setting("locations", PROJECTS="/srv/projects")
+
+    assert snapshot.get("locations.PROJECTS") == PROJECTS
+    assert snapshot.get("non.existing.key", "default_value") == "default_value"
+    assert dict(snapshot.get("locations")) == {"PROJECTS": PROJECTS, "TEST_PROJECTS": "tests/dummyprojects"}
+    with pytest.raises(TypeError):
+        snapshot.get("locations")["PROJECTS"] = "/srv/projects"
+    with pytest.raises(AttributeError):
+        snapshot.extra = True
+
+def test_snapshot_pickle(config_file, tmp_path):
+    """
+    Test pickling a snapshot, as when it is sent to a worker process.
+
+    Validates that:
+        - The unpickled snapshot answers like the original.
+        - It resolves the cache directory from its own settings.
+    """
+    config = Config(config_file)
+    config.update_setting("locations", CACHE=str(tmp_path / 'cache'))
+    snapshot = config.snapshot()
+
+    restored = pickle.loads(pickle.dumps(snapshot))
+
+    assert restored.get("locations.PROJECTS") == PROJECTS
+    assert dict(restored.get("locations")) == dict(snapshot.get("locations"))
+    assert restored.get_cache_directory_path() == tmp_path / 'cache'
+
+@pytest.fixture(scope="function")
+def layers(tmp_path, monkeypatch):
+    """
+    Fixture to create isolated default, user and projects root configuration files, with empty layer caches.
+
+    Returns:
+        dict: The path of each layer's file, by layer name.
+    """
+    monkeypatch.setattr(config_module, '_layer_cache', {})
+    monkeypatch.setattr(config_module, '_merged_cache', {})
+    for name in list(os.environ):
+        if name.startswith('PYSCAFFOLD_'):
+            monkeypatch.delenv(name)
+    monkeypatch.setenv('XDG_CONFIG_HOME', str(tmp_path / 'xdg'))
+    paths = {
+        'default': tmp_path / 'config.yaml',
+        'user': tmp_path / 'xdg' / 'pyscaffold' / 'config.yaml',
+        'projects': tmp_path / 'projects' / '.pyscaffold.yaml'
+    }
+    paths['user'].parent.mkdir(parents=True)
+    paths['projects'].parent.mkdir()
+    paths['default'].write_text(f"locations:\n  PROJECTS: {tmp_path / 'projects'}\nvenv:\n  STRATEGY: standard\n  POOL_SIZE: 2\n")
+    paths['user'].write_text("venv:\n  STRATEGY: pool\n")
+    paths['projects'].write_text("venv:\n  POOL_SIZE: 4\nfiles:\n  DURABILITY: batch\n")
+    monkeypatch.setattr(config_module, 'default_config_path', lambda: paths['default'])
+    return paths
+
+def test_environment_settings():
+    """
+    Test reading settings from the environment.
+
+    Validates that:
+        - 'PYSCAFFOLD_<SECTION>_<KEY>' sets '<section>.<KEY>', with numbers and booleans converted.
+        - Other variables, and prefixed ones without a key, are ignored.
+    """
+    environ = {
+        'PYSCAFFOLD_VENV_POOL_SIZE': '8',
+        'PYSCAFFOLD_FILES_LINK_SHARED': 'true',
+        'PYSCAFFOLD_FILES_DURABILITY': 'none',
+        'PYSCAFFOLD_VENV': 'pool',
+        'HOME': '/root'
+    }
+
+    assert config_module.environment_settings(environ) == {
+        'venv': {'POOL_SIZE': 8},
+        'files': {'LINK_SHARED': True, 'DURABILITY': 'none'}
+    }
+
+def test_layers(layers, monkeypatch):
+    """
+    Test loading the layered configuration.
+
+    Validates that:
+        - The user's file overrides the defaults, the projects root file overrides the user's, and the
+          environment overrides them all, setting by setting.
+    """
+    monkeypatch.setenv('PYSCAFFOLD_FILES_DURABILITY', 'full')
+
+    config = Config()
+
+    assert config.get('locations.PROJECTS') == str(layers['projects'].parent)
+    assert config.get('venv.STRATEGY') == 'pool'
+    assert config.get('venv.POOL_SIZE') == 4
+    assert config.get('files.DURABILITY') == 'full'
+
+def test_layers_read_when_changed(layers):
+    """
+    Test loading the layered configuration again.
+
+    Validates that:
+        - Unchanged layers are neither read nor merged again, and each instance gets its own settings.
+        - Once a layer changed, only its file is read again.
+    """
+    first = Config()
+    first.update_setting('venv', STRATEGY='changed')
+
+    with mock.patch('pyscaffold.config.merge_settings', wraps=config_module.merge_settings) as mock_merge:
+        second = Config()
+    mock_merge.assert_not_called()
+    assert second.get('venv.STRATEGY') == 'pool'
+
+    layers['user'].write_text("venv:\n  STRATEGY: standard-pool\n")
+    with mock.patch('pyscaffold.config.Config.read_settings', wraps=Config.read_settings) as mock_read:
+        third = Config()
+    assert [call.args[0] for call in mock_read.call_args_list] == [layers['user']]
+    assert third.get('venv.STRATEGY') == 'standard-pool'
+    assert third.get('venv.POOL_SIZE') == 4
+
+def test_layers_not_used_with_file(layers, config_file, monkeypatch):
+    """
+    Test loading an explicit configuration file.
+
+    Validates that:
+        - Neither the other layers nor the environment are applied.
+    """
+    monkeypatch.setenv('PYSCAFFOLD_LOCATIONS_PROJECTS', '/srv/projects')
+
+    config = Config(config_file)
+
+    assert config.get('locations.PROJECTS') == PROJECTS
+    assert config.get('venv.STRATEGY') is None
+
+def test_get_projects_directory_path_unset(layers):
+    """
+    Test retrieving the projects directory when it is not set.
+
+    Validates that:
+        - A `ValueError` is raised rather than a `TypeError`.
+    """
+    layers['default'].write_text("venv:\n  STRATEGY: standard\n")
+
+    with pytest.raises(ValueError, match="Projects directory has not been set."):
+        Config().get_projects_directory_path()
@@ -1,11 +1,12 @@
 """
 Test Fragments
 
-This module contains tests for the format strings used by the Pyscaffold program.
+This module contains tests for the templates used by the Pyscaffold program.
 
 """
 import pytest
 from pyscaffold import fragments
+from pyscaffold.templates import compile_template
 
 @pytest.fixture(scope='function')
 def setup():
@@ -144,7 +145,7 @@ def test_pkg_config_py(setup):
         "        return path\n"
     )
 
-    result = fragments.PKG_CONFIG_PY.format(
+    result = compile_template(fragments.PKG_CONFIG_PY).render(
         packagename = package_name,
         ProjectName = project_name
     )
@@ -165,7 +166,7 @@ def test_pkg_helpers_py(setup):
         "\"\"\"\n"
     )
 
-    result = fragments.PKG_HELPERS_PY.format(
+    result = compile_template(fragments.PKG_HELPERS_PY).render(
         packagename = package_name,
         ProjectName = project_name
     )
@@ -203,7 +204,7 @@ def test_pkg_utils_py(setup):
         "\n"
     )
 
-    result = fragments.PKG_UTILS_PY.format(
+    result = compile_template(fragments.PKG_UTILS_PY).render(
         packagename = package_name,
         ProjectName = project_name
     )
@@ -244,7 +245,7 @@ def test_pkg_module_py(setup):
         "\n"
     )
 
-    result = fragments.PKG_MODULE_PY.format(
+    result = compile_template(fragments.PKG_MODULE_PY).render(
         packagename = package_name,
         ProjectName = project_name
     )
@@ -299,7 +300,7 @@ def test_pkg_arg_parser_py(setup):
         "    return parser\n"
     )
 
-    result = fragments.PKG_ARG_PARSER_PY.format(
+    result = compile_template(fragments.PKG_ARG_PARSER_PY).render(
         packagename = package_name,
         ProjectName = project_name
     )
@@ -362,7 +363,7 @@ def test_pkg_main_py(setup):
         "\n"
     )
 
-    result = fragments.PKG_MAIN_PY.format(
+    result = compile_template(fragments.PKG_MAIN_PY).render(
         packagename = package_name,
         ProjectName = project_name
     )
@@ -427,7 +428,7 @@ def test_test_config_py(setup):
         "    assert config.get('update_setting.key2') == 'value2'\n"
     )
 
-    result = fragments.TEST_CONFIG_PY.format(
+    result = compile_template(fragments.TEST_CONFIG_PY).render(
         ProjectName=project_name,
         packagename=package_name
     )
@@ -451,7 +452,7 @@ def test_test_helpers_py(setup):
         "from test_project.helpers import * # Use explicit imports\n"
     )
 
-    result = fragments.TEST_HELPERS_PY.format(
+    result = compile_template(fragments.TEST_HELPERS_PY).render(
         ProjectName=project_name,
         packagename=package_name
     )
@@ -507,7 +508,7 @@ def test_test_utils_py(setup):
         "    pass\n"
     )
 
-    result = fragments.TEST_UTILS_PY.format(
+    result = compile_template(fragments.TEST_UTILS_PY).render(
         ProjectName=project_name,
         packagename=package_name
     )
@@ -561,7 +562,7 @@ def test_test_package_module_py(setup):
         "\n"
     )
 
-    result = fragments.TEST_PACKAGE_MODULE_PY.format(
+    result = compile_template(fragments.TEST_PACKAGE_MODULE_PY).render(
         ProjectName=project_name,
         packagename=package_name
     )
@@ -612,7 +613,7 @@ def test_arg_parser_py(setup):
         "    assert args.opt == 'optval'\n"
     )
 
-    result = fragments.TEST_PKG_ARG_PARSER_PY.format(
+    result = compile_template(fragments.TEST_PKG_ARG_PARSER_PY).render(
         ProjectName=project_name,
         packagename=package_name
     )
@@ -681,7 +682,7 @@ def test_test_cli_py(setup):
         "    assert ret.success\n"
     )
 
-    result = fragments.TEST_CLI_PY.format(
+    result = compile_template(fragments.TEST_CLI_PY).render(
         ProjectName=project_name,
         packagename=package_name
     )
@@ -741,7 +742,7 @@ def test_project_setup_py(setup):
         ")\n"
     )
 
-    result = fragments.PROJECT_SETUP_PY.format(
+    result = compile_template(fragments.PROJECT_SETUP_PY).render(
         ProjectName=project_name,
         packagename=package_name
     )
@@ -758,7 +759,7 @@ def test_project_readme_md(setup):
         "# TestProject"
     )
 
-    result = fragments.PROJECT_README_PY.format(
+    result = compile_template(fragments.PROJECT_README_PY).render(
         ProjectName=project_name,
     )
 
@@ -776,7 +777,7 @@ def test_project_manifest_in(setup):
         "include test_project/data/LICENSE"
     )
 
-    result = fragments.PROJECT_MANIFEST_IN.format(
+    result = compile_template(fragments.PROJECT_MANIFEST_IN).render(
         packagename=package_name,
     )
 
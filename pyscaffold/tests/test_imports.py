@@ -0,0 +1,124 @@
+"""
+Pyscaffold Test Imports
+
+This module contains tests for the import graph of the Pyscaffold application. It verifies that the
+package exports its main classes as lazy attributes, and uses `python -X importtime` to check that a
+command only imports the modules it needs.
+
+Tests:
+- test_lazy_attributes: Verifies that the package's exports are imported on first access and then kept.
+- test_unknown_attribute: Ensures accessing an attribute the package does not export raises an `AttributeError`.
+- test_resume_import_budget: Checks that `pyscaffold resume` imports neither the engines, the virtual environment
+  and staging modules, nor the fragments, and stays within its import time budget.
+- test_resume_reads_config_sidecar: Ensures `pyscaffold resume` reads its settings without importing the YAML parser.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import pyscaffold
+
+# Modules that only `start`, `pool` or `interpreters` need
+RESUME_EXCLUDED_MODULES = {
+    'asyncio',
+    'multiprocessing',
+    'concurrent.futures.process',
+    'uuid',
+    'hashlib',
+    'venv',
+    'pyscaffold.async_engine',
+    'pyscaffold.fragments',
+    'pyscaffold.interpreters',
+    'pyscaffold.stages',
+    'pyscaffold.staging',
+    'pyscaffold.tree',
+    'pyscaffold.venvs'
+}
+
+# Cumulative import time of the pyscaffold modules, in microseconds. Generous, as the
+# modules may be compiled from source when bytecode is not written
+RESUME_IMPORT_BUDGET = 200_000
+
+def import_times(*args) -> dict:
+    """
+    Run the Pyscaffold CLI with `-X importtime` in a test environment.
+
+    The interpreter runs with `-P`, so `-m pyscaffold` resolves to the installed package
+    rather than to `pyscaffold/pyscaffold.py` when the tests are run from the package directory.
+
+    Args:
+        *args: The command-line arguments passed on to `python -m pyscaffold`.
+
+    Returns:
+        dict: The name of every imported module mapped to its cumulative import time in microseconds.
+    """
+    env = dict(os.environ, ON_TEST='1')
+    result = subprocess.run(
+        [sys.executable, '-P', '-X', 'importtime', '-m', 'pyscaffold', *args],
+        capture_output=True, text=True, env=env, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+def test_lazy_attributes(monkeypatch):
+    """
+    Test accessing the package's lazy attributes.
+
+    Validates that:
+        - Each export is the object defined by its module.
+        - It is kept in the package's namespace after the first access.
+        - It is listed by `dir()` before it is accessed.
+    """
+    from pyscaffold.pyscaffold import Pyscaffold
+    from pyscaffold.tree import ProjectTree
+
+    monkeypatch.delitem(vars(pyscaffold), 'ProjectTree', raising=False)
+    assert 'ProjectTree' in dir(pyscaffold)
+
+    assert pyscaffold.Pyscaffold is Pyscaffold
+    assert pyscaffold.ProjectTree is ProjectTree
+    assert vars(pyscaffold)['ProjectTree'] is ProjectTree
+
+def test_unknown_attribute():
+    """
+    Test accessing an attribute the package does not export.
+
+    Validates that:
+        - An `AttributeError` is raised.
+    """
+    with pytest.raises(AttributeError, match='no attribute'):
+        pyscaffold.NotAnExport
+
+def test_resume_import_budget():
+    """
+    Test the imports of `pyscaffold resume`.
+
+    Validates that:
+        - The command runs without importing the modules only needed to create projects.
+        - The pyscaffold modules it imports stay within the import time budget.
+    """
+    times = import_times('resume', 'missing_project')
+
+    assert 'pyscaffold.pyscaffold' in times
+    assert RESUME_EXCLUDED_MODULES.isdisjoint(times)
+    pyscaffold_time = sum(time for name, time in times.items() if name.startswith('pyscaffold.'))
+    assert pyscaffold_time < RESUME_IMPORT_BUDGET
+
+def test_resume_reads_config_sidecar():
+    """
+    Test the configuration of `pyscaffold resume` once its sidecar was written.
+
+    Validates that:
+        - The YAML parser is not imported when the configuration file did not change.
+    """
+    import_times('resume', 'missing_project')
+
+    assert 'yaml' not in import_times('resume', 'missing_project')
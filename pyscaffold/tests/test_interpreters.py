@@ -0,0 +1,183 @@
+"""
+Pyscaffold Test Interpreters
+
+This module contains tests for the interpreter registry of the Pyscaffold application. It verifies that
+PATH is scanned for `pythonX.Y` executables, that the registry is persisted and reused while PATH is
+unchanged, and that missing interpreters are reported with a typed error.
+
+Fixtures:
+- fake_path: Points PATH and the pyscaffold cache directory at temporary directories holding fake interpreters.
+
+Tests:
+- test_scan_interpreters: Verifies that each version is recorded with its path, real path and full version.
+- test_scan_interpreters_path_order: Ensures that the first interpreter along PATH wins, as with `shutil.which`.
+- test_load_registry_uses_cache: Validates that an unchanged PATH is served from the cache file without probing.
+- test_load_registry_invalidated_by_mtime: Checks that installing an interpreter invalidates the cache file.
+- test_is_running_interpreter: Validates that only the running installation of the exact release is reported as the running interpreter.
+- test_find_interpreter_not_found: Ensures a missing version raises `InterpreterNotFoundError`, a `RuntimeError`.
+"""
+
+import os
+import sys
+import json
+from unittest import mock
+
+import pytest
+
+from pyscaffold import interpreters
+from pyscaffold.interpreters import InterpreterNotFoundError
+
+def make_interpreter(directory, name, version):
+    """
+    Create a fake interpreter script that prints a full version.
+
+    Args:
+        directory (Path): The directory to create the script in.
+        name (str): The executable name, e.g. 'python9.8'.
+        version (str): The full version the script reports.
+
+    Returns:
+        Path: The path to the script.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    script = directory / name
+    script.write_text(f'#!/bin/sh\necho {version}\n')
+    script.chmod(0o755)
+    return script
+
+@pytest.fixture(scope="function")
+def fake_path(tmp_path, monkeypatch):
+    """
+    Fixture to point PATH and the pyscaffold cache directory at temporary directories.
+
+    Teardown:
+        - Forgets the registry loaded for the temporary PATH.
+
+    Returns:
+        tuple: The first and second directories on PATH.
+    """
+    first, second = tmp_path / 'first', tmp_path / 'second'
+    first.mkdir()
+    second.mkdir()
+    monkeypatch.setenv('PATH', os.pathsep.join([str(first), str(second)]))
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    monkeypatch.setattr(interpreters, '_registry', (None, None))
+
+    yield first, second
+
+def test_scan_interpreters(fake_path):
+    """
+    Test scanning PATH for interpreters.
+
+    Validates that:
+        - Only `pythonX.Y` executables are registered, keyed by their short version.
+        - An executable reporting another version than its name is skipped.
+        - Each entry records the path, the resolved real path and the full version.
+    """
+    first, _ = fake_path
+    target = make_interpreter(first / 'versions', 'python9.8', '9.8.1')
+    (first / 'python9.8').symlink_to(target)
+    make_interpreter(first, 'python9', '9.0.0')
+    make_interpreter(first, 'python9.8-config', '9.8.1')
+    make_interpreter(first, 'python9.1', '9.13.0')
+
+    registry = interpreters.scan_interpreters(os.environ['PATH'])
+
+    assert registry == {'9.8': {'path': str(first / 'python9.8'), 'realpath': str(target), 'version': '9.8.1'}}
+
+def test_scan_interpreters_path_order(fake_path):
+    """
+    Test that the first interpreter along PATH wins.
+
+    Validates that:
+        - A version found in an earlier PATH directory shadows the same version later on.
+        - Versions only found later on are still registered.
+    """
+    first, second = fake_path
+    make_interpreter(first, 'python9.8', '9.8.1')
+    make_interpreter(second, 'python9.8', '9.8.0')
+    make_interpreter(second, 'python9.7', '9.7.3')
+
+    registry = interpreters.scan_interpreters(os.environ['PATH'])
+
+    assert registry['9.8']['path'] == str(first / 'python9.8')
+    assert registry['9.7']['version'] == '9.7.3'
+
+def test_load_registry_uses_cache(fake_path, monkeypatch):
+    """
+    Test that an unchanged PATH is served from the cache file.
+
+    Validates that:
+        - The first load persists the registry to the cache directory.
+        - A later process (simulated by forgetting the in-memory registry) loads it without probing.
+    """
+    first, _ = fake_path
+    make_interpreter(first, 'python9.8', '9.8.1')
+
+    registry = interpreters.load_registry()
+    cached = json.loads(interpreters.registry_path().read_text())
+    assert cached['interpreters'] == registry
+
+    monkeypatch.setattr(interpreters, '_registry', (None, None))
+    with mock.patch('pyscaffold.interpreters.probe_version') as mock_probe:
+        assert interpreters.load_registry() == registry
+        assert interpreters.find_interpreter('9.8') == str(first / 'python9.8')
+
+    mock_probe.assert_not_called()
+
+def test_load_registry_invalidated_by_mtime(fake_path, monkeypatch):
+    """
+    Test that installing an interpreter invalidates the cache file.
+
+    Validates that:
+        - A new interpreter in a PATH directory changes its mtime and triggers a rescan.
+    """
+    first, second = fake_path
+    make_interpreter(first, 'python9.8', '9.8.1')
+    assert '9.7' not in interpreters.load_registry()
+
+    make_interpreter(second, 'python9.7', '9.7.3')
+    os.utime(second, ns=(0, os.stat(second).st_mtime_ns + 1_000_000_000))
+    monkeypatch.setattr(interpreters, '_registry', (None, None))
+
+    assert interpreters.load_registry()['9.7']['version'] == '9.7.3'
+
+def test_is_running_interpreter(fake_path):
+    """
+    Test detecting that a Python version resolves to the running interpreter.
+
+    Validates that:
+        - The running version matches when its registered interpreter is the running installation.
+        - Another installation of the same release, another patch release of the same version, or
+          another version, does not match.
+    """
+    first, _ = fake_path
+    python_version = f'{sys.version_info[0]}.{sys.version_info[1]}'
+    script = make_interpreter(first, f'python{python_version}', sys.version.split()[0])
+    make_interpreter(first, 'python9.8', '9.8.1')
+
+    with mock.patch.object(interpreters.sys, '_base_executable', str(script), create=True):
+        assert interpreters.is_running_interpreter(python_version) is True
+        assert interpreters.is_running_interpreter('9.8') is False
+
+    assert interpreters.is_running_interpreter(python_version) is False
+
+    make_interpreter(first, f'python{python_version}', f'{python_version}.999')
+    interpreters.load_registry(refresh=True)
+
+    with mock.patch.object(interpreters.sys, '_base_executable', str(script), create=True):
+        assert interpreters.is_running_interpreter(python_version) is False
+
+def test_find_interpreter_not_found(fake_path):
+    """
+    Test resolving a version that is not installed.
+
+    Validates that:
+        - `InterpreterNotFoundError` is raised with the usual message.
+        - It can still be caught as a `RuntimeError`.
+    """
+    with pytest.raises(InterpreterNotFoundError, match='Python 9.9 is not installed or not found in PATH.') as error:
+        interpreters.find_interpreter('9.9')
+
+    assert isinstance(error.value, RuntimeError)
+    assert error.value.python_version == '9.9'
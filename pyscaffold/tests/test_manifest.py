@@ -0,0 +1,211 @@
+"""
+Pyscaffold Test Manifest
+
+This module contains tests for the manifest of a generated project. It verifies that the manifest records
+the template, size, modification time and hash of every rendered file along with the virtual environment,
+that it is written atomically and read back, or ignored when unusable, and that drift and readiness are
+answered from it without hashing unchanged files.
+
+Fixtures:
+- project: Writes a small project with its virtual environment and manifest.
+
+Tests:
+- test_file_entry: Verifies that a file is recorded with its template, size, modification time and hash.
+- test_read_environment: Validates that the interpreter details are read from `pyvenv.cfg`.
+- test_build_manifest: Verifies that every file of a tree and the virtual environment are recorded.
+- test_write_and_read_manifest: Validates that a written manifest is read back identically.
+- test_read_manifest_first_version: Ensures a manifest of the first format is converted when read.
+- test_read_manifest_unusable: Ensures a missing, corrupt or outdated manifest reads as None.
+- test_current_digest: Checks that a file whose `stat` is unchanged is not read again.
+- test_drifted_files: Verifies that missing and modified files are reported.
+- test_project_ready: Validates that readiness is answered from the manifest.
+"""
+
+import os
+import hashlib
+from unittest import mock
+
+import pytest
+
+from pyscaffold import manifest
+from pyscaffold.tree import ProjectTree
+
+@pytest.fixture(scope="function")
+def project(tmp_path):
+    """
+    Fixture to write a small project with its virtual environment and manifest.
+
+    Returns:
+        Path: The path of the project.
+    """
+    project_path = tmp_path / 'MyProject'
+    project_path.mkdir()
+    tree = ProjectTree()
+    tree.add('setup.py', 'setup()\n', source=('setup.py', 'abc123'))
+    tree.add('pkg/__init__.py', '')
+    tree.materialize(project_path)
+    (project_path / 'env').mkdir()
+    (project_path / 'env' / 'pyvenv.cfg').write_text('home = /usr/bin\nversion = 3.11.4\n')
+    environment = manifest.read_environment(project_path / 'env', '3.11', 'standard')
+    manifest.write_manifest(project_path, manifest.build_manifest(tree, project_path, environment))
+    yield project_path
+
+def test_file_entry(tmp_path):
+    """
+    Test recording a file.
+
+    Validates that:
+        - The entry holds the template and its version, the file's size and modification time, and its SHA-256.
+        - A file not rendered from a template has no template or version.
+    """
+    path = tmp_path / 'setup.py'
+    path.write_bytes(b'setup()\n')
+    stat = os.stat(path)
+
+    assert manifest.file_entry(path, b'setup()\n', ('setup.py', 'abc123')) == {
+        'template': 'setup.py',
+        'version': 'abc123',
+        'size': 8,
+        'mtime_ns': stat.st_mtime_ns,
+        'sha256': hashlib.sha256(b'setup()\n').hexdigest()
+    }
+    assert manifest.file_entry(path, b'setup()\n')['template'] is None
+
+def test_read_environment(tmp_path):
+    """
+    Test reading the details of a virtual environment.
+
+    Validates that:
+        - The base interpreter's home and full version are read from `pyvenv.cfg`.
+        - A directory without `pyvenv.cfg` is not an environment.
+    """
+    (tmp_path / 'env').mkdir()
+    (tmp_path / 'env' / 'pyvenv.cfg').write_text('home = /usr/bin\ninclude-system-site-packages = false\nversion = 3.11.4\n')
+
+    assert manifest.read_environment(tmp_path / 'env', '3.11', 'standard') == {
+        'directory': 'env',
+        'python_version': '3.11',
+        'version': '3.11.4',
+        'home': '/usr/bin',
+        'executable': None,
+        'strategy': 'standard'
+    }
+    assert manifest.read_environment(tmp_path / 'venv') is None
+
+def test_build_manifest(tmp_path):
+    """
+    Test building the manifest of a tree.
+
+    Validates that:
+        - Each file's path is mapped to its entry, with the template it was rendered from.
+        - The virtual environment is recorded under 'venv'.
+    """
+    tree = ProjectTree()
+    tree.add('setup.py', 'setup()\n', source=('setup.py', 'abc123'))
+    tree.add('pkg/__init__.py', '')
+    tree.materialize(tmp_path)
+
+    built = manifest.build_manifest(tree, tmp_path, {'directory': 'env'})
+
+    assert built['version'] == manifest.MANIFEST_VERSION
+    assert built['venv'] == {'directory': 'env'}
+    assert built['files']['setup.py'] == manifest.file_entry(tmp_path / 'setup.py', b'setup()\n', ('setup.py', 'abc123'))
+    assert built['files']['pkg/__init__.py']['sha256'] == hashlib.sha256(b'').hexdigest()
+
+def test_write_and_read_manifest(project):
+    """
+    Test writing and reading a manifest.
+
+    Validates that:
+        - The manifest is written to `.pyscaffold-manifest` and read back identically.
+        - No temporary file is left behind.
+    """
+    built = manifest.read_manifest(project)
+
+    path = manifest.write_manifest(project, built)
+
+    assert path == project / '.pyscaffold-manifest'
+    assert manifest.read_manifest(project) == built
+    assert not [entry for entry in project.iterdir() if entry.name.startswith('.pyscaffold-manifest.')]
+
+def test_read_manifest_first_version(tmp_path):
+    """
+    Test reading a manifest written before template and environment details were recorded.
+
+    Validates that:
+        - Its hashes are converted to entries of the current format, without a virtual environment.
+    """
+    (tmp_path / '.pyscaffold-manifest').write_text('{"version": 1, "files": {"setup.py": "abc"}}')
+
+    assert manifest.read_manifest(tmp_path) == {
+        'version': manifest.MANIFEST_VERSION,
+        'files': {'setup.py': {'sha256': 'abc'}},
+        'venv': None
+    }
+
+def test_read_manifest_unusable(tmp_path):
+    """
+    Test reading a manifest that cannot be used.
+
+    Validates that:
+        - A missing manifest, a corrupt one and one of another format version all read as None.
+    """
+    assert manifest.read_manifest(tmp_path) is None
+
+    (tmp_path / '.pyscaffold-manifest').write_text('{"files": ')
+    assert manifest.read_manifest(tmp_path) is None
+
+    (tmp_path / '.pyscaffold-manifest').write_text('{"version": 0, "files": {}}')
+    assert manifest.read_manifest(tmp_path) is None
+
+def test_current_digest(project):
+    """
+    Test computing the hash of a generated file.
+
+    Validates that:
+        - The recorded hash is returned without reading a file whose size and modification time are unchanged.
+        - A file whose `stat` changed is read and hashed again.
+        - A missing file has no hash.
+    """
+    entry = manifest.read_manifest(project)['files']['setup.py']
+
+    with mock.patch('builtins.open') as mock_open:
+        assert manifest.current_digest(project / 'setup.py', entry)[0] == entry['sha256']
+    mock_open.assert_not_called()
+
+    (project / 'setup.py').write_text('setup(name="x")\n')
+    assert manifest.current_digest(project / 'setup.py', entry)[0] == hashlib.sha256(b'setup(name="x")\n').hexdigest()
+    assert manifest.current_digest(project / 'missing.py', entry) == (None, None)
+
+def test_drifted_files(project):
+    """
+    Test detecting drift from the manifest.
+
+    Validates that:
+        - An intact project has no drifted files.
+        - Modified and missing files are reported.
+        - A project without a manifest cannot be checked.
+    """
+    assert manifest.drifted_files(project) == {}
+
+    (project / 'setup.py').write_text('setup(name="x")\n')
+    (project / 'pkg' / '__init__.py').unlink()
+
+    assert manifest.drifted_files(project) == {'setup.py': 'modified', 'pkg/__init__.py': 'missing'}
+    assert manifest.drifted_files(project.parent) is None
+
+def test_project_ready(project):
+    """
+    Test checking readiness from the manifest.
+
+    Validates that:
+        - A project whose manifest records its virtual environment is ready.
+        - Without a manifest, or without a recorded environment, the manifest does not answer.
+    """
+    assert manifest.project_ready(project) is True
+    assert manifest.project_ready(project.parent) is None
+
+    recorded = manifest.read_manifest(project)
+    recorded['venv'] = None
+    manifest.write_manifest(project, recorded)
+    assert manifest.project_ready(project) is None
@@ -0,0 +1,161 @@
+"""
+Pyscaffold Test Pack
+
+This module contains tests for the template pack of the Pyscaffold application. It verifies that
+templates are written to a single file with a binary index, read back lazily through `mmap`, and that
+the pack of an installation is rebuilt from `pyscaffold.fragments` only when it is stale.
+
+Fixtures:
+- cache_dir: Points the pyscaffold cache directory at a temporary directory and forgets the opened pack.
+
+Tests:
+- test_build_pack: Verifies that every template is read back with its exact content.
+- test_template_pack_rejects_other_files: Ensures a file that is not a pack raises a `ValueError`.
+- test_load_pack_builds_from_fragments: Validates that the pack holds every fragment and replaces stale packs.
+- test_pack_path: Ensures the pack is keyed on this installation and the stamp of the fragments.
+- test_load_pack_reuses_existing: Checks that an up-to-date pack is opened without importing the fragments.
+- test_compile_fragment_is_lazy: Ensures declaring a fragment does not read the pack until it is rendered.
+"""
+
+import os
+from unittest import mock
+
+import pytest
+
+from pyscaffold import fragments, pack
+from pyscaffold.templates import FragmentTemplate
+
+@pytest.fixture(scope="function")
+def cache_dir(tmp_path, monkeypatch):
+    """
+    Fixture to point the pyscaffold cache directory at a temporary directory.
+
+    Returns:
+        Path: The temporary pyscaffold cache directory.
+    """
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    monkeypatch.setattr(pack, '_pack', None)
+    yield tmp_path / 'pyscaffold'
+
+def test_build_pack(tmp_path):
+    """
+    Test writing and reading a template pack.
+
+    Validates that:
+        - Every template, including empty and non-ASCII ones, is read back exactly.
+        - The index lists the templates in the order they were given.
+        - An unknown name raises a `KeyError`.
+    """
+    templates = {'FIRST': 'def main():\n    return {}\n', 'EMPTY': '', 'CAFE': 'café ${ProjectName}\n'}
+    path = pack.build_pack(tmp_path / 'test.pack', templates)
+
+    template_pack = pack.TemplatePack(path)
+
+    assert template_pack.names() == ['FIRST', 'EMPTY', 'CAFE']
+    assert {name: template_pack.get(name) for name in templates} == templates
+    with pytest.raises(KeyError):
+        template_pack.get('MISSING')
+    template_pack.close()
+
+def test_template_pack_rejects_other_files(tmp_path):
+    """
+    Test opening a file that is not a template pack.
+
+    Validates that:
+        - A `ValueError` is raised.
+    """
+    path = tmp_path / 'other.pack'
+    path.write_bytes(b'not a pack at all')
+
+    with pytest.raises(ValueError, match='is not a template pack'):
+        pack.TemplatePack(path)
+
+def test_load_pack_builds_from_fragments(cache_dir):
+    """
+    Test building the pack of the installation.
+
+    Validates that:
+        - The pack holds every template of `pyscaffold.fragments` with identical content.
+        - Packs this installation built for older fragments are removed, and other installations' packs are kept.
+    """
+    cache_dir.mkdir(parents=True)
+    stale = cache_dir / f'templates-{pack.installation_id()}-0.pack'
+    stale.write_bytes(b'')
+    other = cache_dir / 'templates-000000000000-0.pack'
+    other.write_bytes(b'')
+
+    template_pack = pack.load_pack()
+
+    assert template_pack.path == pack.pack_path()
+    assert template_pack.get('PKG_MAIN_PY') == fragments.PKG_MAIN_PY
+    assert template_pack.get('pyscaffold_ascii') == fragments.pyscaffold_ascii
+    assert set(template_pack.names()) == set(pack.fragment_templates())
+    assert not stale.exists()
+    assert other.exists()
+    assert pack.load_pack() is template_pack
+
+def test_pack_path(cache_dir, tmp_path, monkeypatch):
+    """
+    Test naming the pack of the installation.
+
+    Validates that:
+        - The same fragments keep their pack, and are not read to name it.
+        - Fragments replaced by a file with the same size and modification time get a different pack.
+        - Another installation of the same fragments gets a different pack.
+    """
+    source = tmp_path / 'fragments.py'
+    source.write_text('A = "a"\n')
+    monkeypatch.setattr(pack, 'FRAGMENTS_SOURCE', source)
+    with mock.patch('builtins.open') as mock_open:
+        first = pack.pack_path()
+        assert pack.pack_path() == first
+    mock_open.assert_not_called()
+
+    stat = source.stat()
+    replacement = tmp_path / 'fragments.new'
+    replacement.write_text('A = "b"\n')
+    os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    os.replace(replacement, source)
+    changed = pack.pack_path()
+    assert changed != first
+
+    copy = tmp_path / 'other' / 'fragments.py'
+    copy.parent.mkdir()
+    copy.write_text('A = "b"\n')
+    monkeypatch.setattr(pack, 'FRAGMENTS_SOURCE', copy)
+    assert pack.installation_id() not in changed.name
+    assert pack.pack_path() != changed
+
+def test_load_pack_reuses_existing(cache_dir, monkeypatch):
+    """
+    Test opening an up-to-date pack.
+
+    Validates that:
+        - A later process (simulated by forgetting the opened pack) does not rebuild it.
+    """
+    pack.load_pack()
+    monkeypatch.setattr(pack, '_pack', None)
+
+    with mock.patch('pyscaffold.pack.fragment_templates') as mock_fragments:
+        assert pack.load_fragment('PROJECT_LICENSE') == fragments.PROJECT_LICENSE
+
+    mock_fragments.assert_not_called()
+
+def test_compile_fragment_is_lazy(cache_dir):
+    """
+    Test that fragments are only read when they are used.
+
+    Validates that:
+        - Declaring a fragment template does not open the pack.
+        - Rendering it reads and compiles the fragment.
+    """
+    with mock.patch('pyscaffold.pack.load_fragment', wraps=pack.load_fragment) as mock_load:
+        template = FragmentTemplate('PROJECT_README_PY')
+        mock_load.assert_not_called()
+
+        assert template.render(ProjectName='MyProject', packagename='my_project') == (
+            fragments.PROJECT_README_PY.replace('${ProjectName}', 'MyProject')
+        )
+        assert template.names == {'ProjectName'}
+
+    mock_load.assert_called_once_with('PROJECT_README_PY')
@@ -6,16 +6,21 @@ The tests cover functionality related to project folder creation, package and te
 and error handling scenarios. The goal is to ensure the correct operation of `Pyscaffold` methods and to handle various edge cases.
 """
 
+import os
+import time
 import pytest
 import shutil
+import collections
 import subprocess
 from unittest import mock
 from pathlib import Path
 
 
-from pyscaffold.config import Config
-from pyscaffold.pyscaffold import Pyscaffold
+from pyscaffold.config import Config, ConfigSnapshot
+from pyscaffold.pyscaffold import Pyscaffold, ProjectResult
 from pyscaffold import helpers
+from pyscaffold import manifest
+from pyscaffold.templates import compile_template, render_cache
 from pyscaffold import utils
 
 REASON="Time consuming test. Skipping for now"
@@ -131,7 +136,7 @@ def test_inject_basic_package_contents(setup_and_teardown):
     Pyscaffold.inject_basic_package_contents("TestProject", package_name, package_path)
     
     for filename_template in Pyscaffold.basic_package_content_map:
-        filename = filename_template.format(packagename=package_name)
+        filename = compile_template(filename_template).render(packagename=package_name)
         assert (package_path / filename).exists(), f"{filename} was not created in the package directory"
 
 def test_deploy_basic_project_package(setup_and_teardown):
@@ -151,7 +156,7 @@ def test_deploy_basic_project_package(setup_and_teardown):
     assert (package_path / "__init__.py").exists(), "__init__.py was not created in the package directory"
 
     for filename_template in Pyscaffold.basic_package_content_map:
-        filename = filename_template.format(packagename=package_name)
+        filename = compile_template(filename_template).render(packagename=package_name)
         assert (package_path / filename).exists(), f"{filename} was not created in the package directory"
 
 def test_deploy_basic_project_package_error_handling(setup_and_teardown):
@@ -186,7 +191,7 @@ def test_inject_basic_test_package_contents(setup_and_teardown):
     Pyscaffold.inject_basic_test_package_contents("TestProject", test_package_name, test_package_path)
     
     for filename_template in Pyscaffold.basic_test_package_content_map:
-        filename = filename_template.format(packagename=test_package_name)
+        filename = compile_template(filename_template).render(packagename=test_package_name)
         assert (test_package_path / filename).exists(), f"{filename} was not created in the test package directory"
 
 def test_deploy_basic_tests_package(setup_and_teardown):
@@ -207,7 +212,7 @@ def test_deploy_basic_tests_package(setup_and_teardown):
     assert (test_package_path / "__init__.py").exists(), "__init__.py was not created in the test package directory"
 
     for filename_template in Pyscaffold.basic_test_package_content_map:
-        filename = filename_template.format(packagename=package_name)
+        filename = compile_template(filename_template).render(packagename=package_name)
         assert (test_package_path / filename).exists(), f"{filename} was not created in the test package directory"
 
 def test_deploy_basic_tests_package_error_handling(setup_and_teardown):
@@ -243,7 +248,7 @@ def test_inject_basic_project_contents(setup_and_teardown):
         assert (project_path / filename).exists(), f"{filename} was not created in the project directory"
         with open(project_path / filename, "r", encoding="utf-8") as f:
             content = f.read()
-            expected_content = Pyscaffold.basic_project_content_map[filename].format(ProjectName=project_name, packagename=project_name)
+            expected_content = Pyscaffold.basic_project_content_map[filename].render(ProjectName=project_name, packagename=project_name)
             assert content == expected_content, f"Content of {filename} does not match expected content"
 
 def test_inject_basic_project_contents_error_handling(setup_and_teardown):
@@ -389,12 +394,405 @@ def test_start_handles_exception(setup_and_teardown, monkeypatch):
     monkeypatch.setenv('ON_TEST', '1')
 
     # Mocking methods to raise an exception
-    with mock.patch('pyscaffold.pyscaffold.Pyscaffold.create_project_folder', side_effect=Exception("Mocked exception")):
+    with mock.patch('pyscaffold.staging.create_staging_folder', side_effect=Exception("Mocked exception")):
         result = Pyscaffold.start([project_name], python_version, destination=str(dummy_projects_dir))
     
     assert result is True  # Method returns True despite the error
     monkeypatch.delenv('ON_TEST', raising=False)
 
+def test_render_project_tree(setup_and_teardown):
+    """
+    Test rendering a project's files in memory.
+
+    Validates that:
+        - The `deploy_*` and `inject_*` methods write exactly the tree's files, with the same contents.
+        - Rendering does not touch the disk.
+    """
+    dummy_projects_dir, _ = setup_and_teardown
+    project_name = 'RenderedProject'
+    project_path = dummy_projects_dir / project_name
+    project_path.mkdir()
+
+    Pyscaffold.deploy_basic_project_package(project_name, project_path)
+    Pyscaffold.deploy_basic_tests_package(project_name, project_path)
+    Pyscaffold.inject_basic_project_contents(project_name, project_path)
+    Pyscaffold.inject_gitignore(project_path)
+
+    tree = Pyscaffold.render_project_tree(project_name)
+
+    on_disk = {path.relative_to(project_path).as_posix() for path in project_path.rglob('*') if path.is_file()}
+    assert {str(path) for path in tree} == on_disk
+    assert set(tree.diff(project_path).values()) == {'unchanged'}
+    assert not (dummy_projects_dir / 'RenderedProject' / 'env').exists()
+    assert {'.gitignore', 'LICENSE', 'rendered_project/__init__.py', 'tests/__init__.py'} <= {str(path) for path in tree.shared}
+    assert 'setup.py' not in tree.shared and 'README.md' not in tree.shared
+
+def test_start_dry_run(setup_and_teardown, capsys):
+    """
+    Test a dry run of the `start` method.
+
+    Validates that:
+        - The files of every project are listed.
+        - Nothing is written to the projects directory.
+        - No interpreter is looked up, so a dry run works for a Python version that is not installed.
+    """
+    dummy_projects_dir, _ = setup_and_teardown
+
+    with mock.patch('pyscaffold.interpreters.find_interpreter') as mock_find:
+        assert Pyscaffold.start(['DryRunA', 'DryRunB'], '3.11', destination=str(dummy_projects_dir), dry_run=True) is True
+    mock_find.assert_not_called()
+
+    output = capsys.readouterr().out
+    assert f"Would create project at {dummy_projects_dir / 'DryRunA'}" in output
+    assert 'dry_run_a/__main__.py' in output and 'tests/test_cli.py' in output and '.gitignore' in output
+    assert f"Would create project at {dummy_projects_dir / 'DryRunB'}" in output
+    assert not (dummy_projects_dir / 'DryRunA').exists()
+    assert not (dummy_projects_dir / '.pyscaffold-staging').exists()
+
+def test_start_compile(setup_and_teardown, capsys):
+    """
+    Test the `start` method with bytecode precompilation.
+
+    Validates that:
+        - Only the projects that were created are compiled, in one batch with the requested mode.
+    """
+    dummy_projects_dir, _ = setup_and_teardown
+    results = [
+        ProjectResult('CompiledA', 'ok', 0.1, dummy_projects_dir / 'CompiledA'),
+        ProjectResult('CompiledB', 'failed', 0.1, dummy_projects_dir / 'CompiledB', 'Mocked failure')
+    ]
+
+    with mock.patch('pyscaffold.pyscaffold.Pyscaffold.run_project', side_effect=results):
+        with mock.patch('pyscaffold.bytecode.compile_projects', return_value=1) as mock_compile:
+            Pyscaffold.start(['CompiledA', 'CompiledB'], '3.11', destination=str(dummy_projects_dir), compile=True, invalidation_mode='unchecked-hash')
+
+    mock_compile.assert_called_once_with([dummy_projects_dir / 'CompiledA'], 'unchecked-hash', None)
+    assert 'Compiled 1 project(s) to bytecode (unchecked-hash)' in capsys.readouterr().out
+
+def test_start_reports_render_cache(setup_and_teardown, capsys):
+    """
+    Test the render cache summary of the `start` method.
+
+    Validates that:
+        - The hits and misses of the run's renderings are printed after the results table.
+        - Rendering a project a second time is served from the cache.
+    """
+    dummy_projects_dir, _ = setup_and_teardown
+
+    def run_project(project_name, python_version, destination, **options):
+        Pyscaffold.render_project_tree(project_name)
+        Pyscaffold.render_project_tree(project_name)
+        return ProjectResult(project_name, 'ok', 0.1, dummy_projects_dir / project_name)
+
+    render_cache.clear()
+    with mock.patch('pyscaffold.pyscaffold.Pyscaffold.run_project', side_effect=run_project):
+        with mock.patch('pyscaffold.utils.activate_virtual_env'):
+            Pyscaffold.start(['CachedProject'], '3.11', destination=str(dummy_projects_dir))
+
+    output = capsys.readouterr().out
+    summary = output.splitlines()[-1]
+    assert summary == f"Render cache: {render_cache.hits} hit(s), {render_cache.misses} miss(es)"
+    assert render_cache.hits == render_cache.misses > 0
+    assert output.index('CachedProject') < output.index('Render cache:')
+
+def test_blob_store_from_snapshot(tmp_path):
+    """
+    Test retrieving the blob store of a worker from a configuration snapshot.
+
+    Validates that:
+        - The store is under the snapshot's cache directory, without loading the configuration.
+        - No store is used unless shared files are linked.
+    """
+    snapshot = ConfigSnapshot([('locations.CACHE', str(tmp_path))])
+
+    with mock.patch('pyscaffold.blobs.Config') as mock_config:
+        assert Pyscaffold.blob_store(link_shared=True, config=snapshot).root == tmp_path / 'blobs'
+        assert Pyscaffold.blob_store(config=snapshot) is None
+    mock_config.assert_not_called()
+
+def test_project_stages():
+    """
+    Test the stage graph of a single project.
+
+    Validates that:
+        - The folder and render stages have no dependencies.
+        - The files are written once both the folder and the rendered tree are ready.
+        - The virtual environment depends only on the folder.
+        - The manifest is recorded once the files and the virtual environment are ready.
+        - The commit stage runs last, after every other stage.
+    """
+    stages = {stage.name: stage for stage in Pyscaffold.project_stages('TestProject', '3.11', '/tmp')}
+
+    assert set(stages) == {'folder', 'render', 'files', 'manifest', 'venv', 'commit'}
+    assert stages['folder'].requires == ()
+    assert stages['render'].requires == ()
+    assert stages['files'].requires == ('folder', 'render')
+    assert stages['manifest'].requires == ('files', 'venv')
+    assert stages['venv'].requires == ('folder',)
+    assert set(stages['commit'].requires) == set(stages) - {'commit'}
+
+def test_materialize_project(tmp_path):
+    """
+    Test writing a rendered project with a bulk writer.
+
+    Validates that:
+        - Every file of the tree is written.
+        - The writer commits the project directory with the requested durability.
+    """
+    tree = Pyscaffold.render_project_tree('DurableProject')
+
+    with mock.patch('pyscaffold.writer.BulkWriter.commit') as mock_commit:
+        assert Pyscaffold.materialize_project(tree, tmp_path, durability='batch') == len(tree)
+
+    mock_commit.assert_called_once_with(tmp_path)
+    assert (tmp_path / 'README.md').read_bytes() == tree['README.md']
+
+def test_write_project_manifest_durable(tmp_path):
+    """
+    Test recording the manifest of a project written with durability.
+
+    Validates that:
+        - The manifest and the project directory are synced unless the durability is 'none'.
+    """
+    tree = Pyscaffold.render_project_tree('DurableProject')
+    tree.materialize(tmp_path)
+
+    with mock.patch('pyscaffold.writer.fsync_path') as mock_fsync_path:
+        Pyscaffold.write_project_manifest(tmp_path, tree, '3.11', 'standard')
+        mock_fsync_path.assert_not_called()
+        path = Pyscaffold.write_project_manifest(tmp_path, tree, '3.11', 'standard', 'batch')
+
+    assert [call.args[0] for call in mock_fsync_path.call_args_list] == [path, tmp_path]
+
+def test_run_project_isolates_failure(setup_and_teardown):
+    """
+    Test that `run_project` reports a failure instead of raising.
+
+    Validates that:
+        - A project whose folder already exists yields a 'failed' result carrying the error.
+    """
+    dummy_projects_dir, project_path = setup_and_teardown
+
+    result = Pyscaffold.run_project(project_path.name, '3.11', str(dummy_projects_dir))
+
+    assert result.status == 'failed'
+    assert result.path == project_path
+    assert 'already exists' in result.error
+
+def test_run_project_metadata_ops(setup_and_teardown):
+    """
+    Test the metadata operations reported for a project.
+
+    Validates that:
+        - Each file costs a single open, and each directory a single mkdir, relative to the project directory.
+        - The staging directory and the final location are not probed more than once each.
+        - The result carries the total.
+    """
+    dummy_projects_dir, _ = setup_and_teardown
+    tree = Pyscaffold.render_project_tree('CountedProject')
+    ops = collections.Counter()
+
+    with mock.patch('pyscaffold.pyscaffold.Pyscaffold.deploy_virtual_environment', return_value=True):
+        Pyscaffold.start_project('CountedProject', '3.11', str(dummy_projects_dir), ops)
+        result = Pyscaffold.run_project('CountedProjectB', '3.11', str(dummy_projects_dir))
+
+    assert ops['open'] == len(tree) + 1
+    assert ops['mkdir'] <= len(tree.directories()) + 3
+    assert ops['stat'] == 3 and ops['rename'] == 1
+    assert result.metadata_ops == len(tree) + 1 + len(tree.directories()) + 1 + 3 + 1
+
+def test_start_project_reports_final_venv_path(setup_and_teardown, capsys):
+    """
+    Test reporting the virtual environment of a started project.
+
+    Validates that:
+        - The virtual environment is reported at the project's final location, not in the staging directory.
+    """
+    dummy_projects_dir, _ = setup_and_teardown
+
+    with mock.patch('pyscaffold.pyscaffold.Pyscaffold.deploy_virtual_environment', return_value=True):
+        project_path = Pyscaffold.start_project('ReportedProject', '3.11', str(dummy_projects_dir))
+
+    output = capsys.readouterr().out
+    assert f"Virtual environment created at {project_path / 'env'}" in output
+    assert '.pyscaffold-staging' not in output
+
+def test_start_project_failure_is_discarded(setup_and_teardown):
+    """
+    Test that a failed project leaves nothing behind.
+
+    Validates that:
+        - Nothing is created at the project's final location when a stage fails.
+        - The staging directory is deleted in the background.
+        - A second attempt at the same project succeeds.
+    """
+    dummy_projects_dir, _ = setup_and_teardown
+    project_name = 'HalfBuiltProject'
+    staging_root = dummy_projects_dir / '.pyscaffold-staging'
+
+    with mock.patch('pyscaffold.pyscaffold.Pyscaffold.deploy_virtual_environment', return_value=True):
+        with mock.patch('pyscaffold.tree.ProjectTree.materialize', side_effect=RuntimeError('Mocked failure')):
+            with pytest.raises(RuntimeError, match='Mocked failure'):
+                Pyscaffold.start_project(project_name, '3.11', str(dummy_projects_dir))
+
+        assert not (dummy_projects_dir / project_name).exists()
+        deadline = time.monotonic() + 10
+        while any(staging_root.iterdir()) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert not any(staging_root.iterdir())
+
+        project_path = Pyscaffold.start_project(project_name, '3.11', str(dummy_projects_dir))
+
+    assert project_path == dummy_projects_dir / project_name
+    assert (project_path / 'setup.py').exists()
+    assert (project_path / '.gitignore').exists()
+
+def test_start_project_link_shared(setup_and_teardown, tmp_path, monkeypatch, capsys):
+    """
+    Test creating projects that share files through the blob store, then syncing them.
+
+    Validates that:
+        - Files shared by every project are hardlinks of the same blob, while rendered files are not.
+        - `sync` keeps a shared file that was modified in place in the first project holding it, as a private
+          copy, and restores it in the other project sharing it, which stays restored on later syncs.
+    """
+    dummy_projects_dir, _ = setup_and_teardown
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+
+    with mock.patch('pyscaffold.pyscaffold.Pyscaffold.deploy_virtual_environment', return_value=True):
+        project_a = Pyscaffold.start_project('LinkedA', '3.11', str(dummy_projects_dir), link_shared=True)
+        project_b = Pyscaffold.start_project('LinkedB', '3.11', str(dummy_projects_dir), link_shared=True)
+
+    assert (project_a / '.gitignore').samefile(project_b / '.gitignore')
+    assert (project_a / 'LICENSE').samefile(project_b / 'LICENSE')
+    assert (project_a / 'linked_a' / '__init__.py').samefile(project_b / 'tests' / '__init__.py')
+    assert (project_a / 'setup.py').stat().st_nlink == 1
+    license_text = (project_b / 'LICENSE').read_text()
+
+    os.chmod(project_a / 'LICENSE', 0o644)
+    (project_a / 'LICENSE').write_text('ALPHA EDIT\n')
+
+    report = Pyscaffold.sync(['LinkedB', 'LinkedA'], str(dummy_projects_dir), jobs=2)
+
+    assert report['LinkedA']['shared']['LICENSE'] == 'modified'
+    assert report['LinkedB']['shared']['LICENSE'] == 'restored'
+    assert report['LinkedA']['shared']['.gitignore'] == 'linked'
+    assert report['LinkedA']['files']['LICENSE'] == 'edited'
+    assert report['LinkedB']['files']['LICENSE'] == 'unchanged'
+    assert (project_a / 'LICENSE').read_text() == 'ALPHA EDIT\n'
+    assert (project_b / 'LICENSE').read_text() == license_text
+    assert 'LinkedA: 1 edited, 1 unshared' in capsys.readouterr().out
+
+    report = Pyscaffold.sync(['LinkedA', 'LinkedB'], str(dummy_projects_dir))
+
+    assert (project_a / 'LICENSE').read_text() == 'ALPHA EDIT\n'
+    assert (project_b / 'LICENSE').read_text() == license_text
+    assert report['LinkedB']['shared']['LICENSE'] == 'linked'
+
+def test_sync(setup_and_teardown, tmp_path, monkeypatch, capsys):
+    """
+    Test syncing every project under the projects directory.
+
+    Validates that:
+        - Projects are found without being named, and directories that are not projects are skipped.
+        - Files still as generated are rewritten from the current templates and missing files are added.
+        - Edited files are left alone and unchanged projects are only counted.
+    """
+    dummy_projects_dir, _ = setup_and_teardown
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+
+    with mock.patch('pyscaffold.pyscaffold.Pyscaffold.deploy_virtual_environment', return_value=True):
+        for project_name in ('SyncA', 'SyncB', 'SyncC'):
+            Pyscaffold.start_project(project_name, '3.11', str(dummy_projects_dir))
+            (dummy_projects_dir / project_name / 'env').mkdir()
+
+    # SyncA was generated from an older README template, SyncB's README was edited
+    project_a = dummy_projects_dir / 'SyncA'
+    recorded = manifest.read_manifest(project_a)
+    (project_a / 'README.md').write_text('# Old template\n')
+    recorded['files']['README.md'] = manifest.file_entry(project_a / 'README.md', b'# Old template\n')
+    manifest.write_manifest(project_a, recorded)
+    (project_a / 'pytest.ini').unlink()
+    (dummy_projects_dir / 'SyncB' / 'README.md').write_text('# My notes\n')
+    capsys.readouterr()
+
+    report = Pyscaffold.sync([], str(dummy_projects_dir))
+
+    assert set(report) == {'SyncA', 'SyncB', 'SyncC', 'TestProject'}
+    assert report['SyncA']['files']['README.md'] == 'updated'
+    assert report['SyncA']['files']['pytest.ini'] == 'added'
+    assert report['SyncB']['files']['README.md'] == 'edited'
+    assert set(report['SyncC']['files'].values()) == {'unchanged'}
+    assert (project_a / 'README.md').read_bytes() == Pyscaffold.render_project_tree('SyncA')['README.md']
+    assert (dummy_projects_dir / 'SyncB' / 'README.md').read_text() == '# My notes\n'
+
+    output = capsys.readouterr().out
+    assert 'SyncA: 1 added, 1 updated' in output
+    assert 'SyncC' not in output
+
+def test_sync_restores_setup(setup_and_teardown, tmp_path, monkeypatch, capsys):
+    """
+    Test syncing every project when a project lost its 'setup.py'.
+
+    Validates that:
+        - A project whose manifest records its virtual environment is found without its 'setup.py'.
+        - The missing 'setup.py' is restored.
+    """
+    dummy_projects_dir, _ = setup_and_teardown
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+
+    with mock.patch('pyscaffold.pyscaffold.Pyscaffold.deploy_virtual_environment', return_value=True):
+        project_path = Pyscaffold.start_project('SyncSetup', '3.11', str(dummy_projects_dir))
+    (project_path / 'env').mkdir()
+    recorded = manifest.read_manifest(project_path)
+    recorded['venv'] = {'directory': 'env'}
+    manifest.write_manifest(project_path, recorded)
+    (project_path / 'setup.py').unlink()
+    capsys.readouterr()
+
+    report = Pyscaffold.sync([], str(dummy_projects_dir))
+
+    assert report['SyncSetup']['files']['setup.py'] == 'added'
+    assert (project_path / 'setup.py').read_bytes() == Pyscaffold.render_project_tree('SyncSetup')['setup.py']
+
+def test_list_projects(setup_and_teardown, capsys):
+    """
+    Test listing the projects under the projects directory.
+
+    Validates that:
+        - Each project directory is printed with its readiness, hidden entries and files are skipped.
+        - The number of projects listed is returned.
+    """
+    dummy_projects_dir, _ = setup_and_teardown
+    (dummy_projects_dir / 'Unfinished').mkdir()
+    (dummy_projects_dir / '.pyscaffold-staging').mkdir()
+    (dummy_projects_dir / 'notes.txt').touch()
+
+    assert Pyscaffold.list_projects(str(dummy_projects_dir)) == 2
+
+    lines = capsys.readouterr().out.splitlines()
+    assert sorted(line.split()[-1] for line in lines[:-1]) == ['TestProject', 'Unfinished']
+    assert any('not ready' in line and line.endswith('Unfinished') for line in lines)
+    assert lines[-1] == '2 project(s), 1 ready'
+
+def test_run_projects_in_pool(setup_and_teardown):
+    """
+    Test scaffolding several projects in a process pool.
+
+    Validates that:
+        - Results are returned in the order the projects were given.
+        - A failing project does not prevent the others from being created.
+    """
+    dummy_projects_dir, project_path = setup_and_teardown
+    project_names = ['PoolProjectA', project_path.name, 'PoolProjectB']
+
+    results = Pyscaffold.run_projects_in_pool(project_names, '3.11', str(dummy_projects_dir), jobs=3)
+
+    assert [result.name for result in results] == project_names
+    assert [result.status for result in results] == ['ok', 'failed', 'ok']
+    assert (dummy_projects_dir / 'PoolProjectA' / 'env').exists()
+    assert (dummy_projects_dir / 'PoolProjectB' / 'setup.py').exists()
+
 @pytest.mark.script_launch_mode('subprocess')
 def test_resume_existing_project(setup_and_teardown, monkeypatch):
     """
@@ -0,0 +1,117 @@
+"""
+Pyscaffold Test Stages
+
+This module contains tests for the stage scheduler used to run a project's scaffold steps. It verifies
+that stage graphs are validated, that dependencies are honoured, that independent stages run
+concurrently and that a failing stage stops its dependents.
+
+Tests:
+- test_order_stages: Verifies that stages are ordered after their dependencies.
+- test_order_stages_unknown_dependency: Ensures an unknown dependency raises a `ValueError`.
+- test_order_stages_cycle: Ensures a dependency cycle raises a `ValueError`.
+- test_run_stages_passes_results: Checks that each stage receives the results of its dependencies.
+- test_run_stages_concurrent: Validates that independent stages run at the same time.
+- test_run_stages_failure_stops_dependents: Ensures stages depending on a failed stage are not run.
+"""
+
+import threading
+
+import pytest
+
+from pyscaffold.stages import Stage, order_stages, run_stages
+
+def test_order_stages():
+    """
+    Test ordering a stage graph.
+
+    Validates that:
+        - Every stage comes after the stages it requires.
+    """
+    stages = [
+        Stage('c', lambda results: None, ('b',)),
+        Stage('b', lambda results: None, ('a',)),
+        Stage('a', lambda results: None)
+    ]
+
+    assert [stage.name for stage in order_stages(stages)] == ['a', 'b', 'c']
+
+def test_order_stages_unknown_dependency():
+    """
+    Test ordering a stage graph with an unknown dependency.
+
+    Validates that:
+        - A `ValueError` naming the missing stage is raised.
+    """
+    with pytest.raises(ValueError, match="requires unknown stage 'missing'"):
+        order_stages([Stage('a', lambda results: None, ('missing',))])
+
+def test_order_stages_cycle():
+    """
+    Test ordering a stage graph with a cycle.
+
+    Validates that:
+        - A `ValueError` is raised instead of looping forever.
+    """
+    stages = [
+        Stage('a', lambda results: None, ('b',)),
+        Stage('b', lambda results: None, ('a',))
+    ]
+
+    with pytest.raises(ValueError, match='dependency cycle'):
+        order_stages(stages)
+
+def test_run_stages_passes_results():
+    """
+    Test that stages receive the results of completed stages.
+
+    Validates that:
+        - A dependent stage can read its dependency's return value.
+        - Every stage's return value is returned by name.
+    """
+    stages = [
+        Stage('base', lambda results: 2),
+        Stage('double', lambda results: results['base'] * 2, ('base',))
+    ]
+
+    assert run_stages(stages) == {'base': 2, 'double': 4}
+
+def test_run_stages_concurrent():
+    """
+    Test that independent stages run concurrently.
+
+    Validates that:
+        - Two stages sharing only a common dependency can meet at a barrier, which would time out if they ran serially.
+    """
+    barrier = threading.Barrier(2, timeout=5)
+    stages = [
+        Stage('root', lambda results: None),
+        Stage('left', lambda results: barrier.wait(), ('root',)),
+        Stage('right', lambda results: barrier.wait(), ('root',))
+    ]
+
+    results = run_stages(stages)
+
+    assert sorted([results['left'], results['right']]) == [0, 1]
+
+def test_run_stages_failure_stops_dependents():
+    """
+    Test that a failing stage stops the stages depending on it.
+
+    Validates that:
+        - The stage's exception is raised.
+        - No stage depending on the failed stage is run.
+    """
+    ran = []
+
+    def fail(results):
+        raise RuntimeError('stage failed')
+
+    stages = [
+        Stage('fail', fail),
+        Stage('after', lambda results: ran.append('after'), ('fail',))
+    ]
+
+    with pytest.raises(RuntimeError, match='stage failed'):
+        run_stages(stages)
+
+    assert ran == []
@@ -0,0 +1,200 @@
+"""
+Pyscaffold Test Staging
+
+This module contains tests for the staging area used to generate projects atomically. It verifies that
+projects are rendered under a hidden directory of the projects root, committed into place with a single
+rename, and discarded in the background on failure.
+
+Tests:
+- test_create_staging_folder: Verifies that the staging directory is created under the projects root.
+- test_create_staging_folder_metadata_ops: Checks that the destination and staging area are not probed separately.
+- test_create_staging_folder_errors: Ensures an existing project or an invalid destination is rejected up front.
+- test_commit_staging_folder: Validates that a project is moved into place with its virtual environment relocated.
+- test_commit_staging_folder_durable: Ensures a durable commit syncs the directories the rename changed.
+- test_commit_staging_folder_conflict: Checks that a concurrently committed project raises `FileExistsError`.
+- test_discard_staging_folder: Ensures a staging directory is deleted by a background thread.
+- test_process_alive: Verifies that running and missing processes are told apart.
+- test_discard_stale_staging: Checks that only the staging directories of dead processes are deleted.
+"""
+
+import os
+import errno
+import collections
+from unittest import mock
+
+import pytest
+
+from pyscaffold import staging, writer
+
+def test_create_staging_folder(tmp_path):
+    """
+    Test creating a project's staging directory.
+
+    Validates that:
+        - The directory is created under the hidden staging area of the projects root.
+        - Its name holds the project's name and the pid of this process.
+        - Nothing is created at the project's final location.
+        - Two staging directories for the same project do not collide.
+    """
+    path = staging.staging_path('MyProject', str(tmp_path))
+
+    assert staging.create_staging_folder('MyProject', str(tmp_path), path) == path
+    assert path.is_dir()
+    assert path.parent == tmp_path / staging.STAGING_DIRECTORY
+    assert path.name.startswith(f'MyProject-{os.getpid()}-')
+    assert not (tmp_path / 'MyProject').exists()
+    assert staging.staging_path('MyProject', str(tmp_path)) != path
+
+def test_create_staging_folder_metadata_ops(tmp_path):
+    """
+    Test counting the metadata operations of creating staging directories.
+
+    Validates that:
+        - The first project also creates the staging area.
+        - Later projects only check their final location and create their staging directory.
+    """
+    first, second = collections.Counter(), collections.Counter()
+
+    staging.create_staging_folder('ProjectA', str(tmp_path), staging.staging_path('ProjectA', str(tmp_path)), first)
+    staging.create_staging_folder('ProjectB', str(tmp_path), staging.staging_path('ProjectB', str(tmp_path)), second)
+
+    assert first == {'stat': 1, 'mkdir': 3}
+    assert second == {'stat': 1, 'mkdir': 1}
+
+def test_create_staging_folder_errors(tmp_path):
+    """
+    Test the checks made before creating a staging directory.
+
+    Validates that:
+        - A `FileExistsError` is raised if the project already exists.
+        - An `OSError` is raised if the destination is not a directory.
+    """
+    (tmp_path / 'MyProject').mkdir()
+    with pytest.raises(FileExistsError, match='already exists'):
+        staging.create_staging_folder('MyProject', str(tmp_path), staging.staging_path('MyProject', str(tmp_path)))
+
+    destination = str(tmp_path / 'missing')
+    with pytest.raises(OSError, match='is invalid'):
+        staging.create_staging_folder('MyProject', destination, staging.staging_path('MyProject', destination))
+
+def test_commit_staging_folder(tmp_path):
+    """
+    Test committing a finished project.
+
+    Validates that:
+        - The staging directory is renamed to the project's final location.
+        - The paths baked into the virtual environment point at the final location.
+    """
+    path = staging.create_staging_folder('MyProject', str(tmp_path), staging.staging_path('MyProject', str(tmp_path)))
+    (path / 'env' / 'bin').mkdir(parents=True)
+    (path / 'env' / 'pyvenv.cfg').write_text(f'command = python3.11 -m venv {path / "env"}\n')
+    (path / 'env' / 'bin' / 'activate').write_text(f'VIRTUAL_ENV="{path / "env"}"\n')
+    (path / 'setup.py').write_text('')
+    project_path = tmp_path / 'MyProject'
+
+    assert staging.commit_staging_folder(path, project_path) == project_path
+
+    assert not path.exists()
+    assert (project_path / 'setup.py').exists()
+    assert (project_path / 'env' / 'pyvenv.cfg').read_text() == f'command = python3.11 -m venv {project_path / "env"}\n'
+    assert (project_path / 'env' / 'bin' / 'activate').read_text() == f'VIRTUAL_ENV="{project_path / "env"}"\n'
+
+def test_commit_staging_folder_durable(tmp_path):
+    """
+    Test committing a finished project durably.
+
+    Validates that:
+        - After the rename, the projects root and the staging area are synced, once each.
+        - Nothing is synced when the commit is not durable.
+    """
+    path = staging.create_staging_folder('MyProject', str(tmp_path), staging.staging_path('MyProject', str(tmp_path)))
+    ops = collections.Counter()
+
+    with mock.patch('pyscaffold.writer.os.fsync') as mock_fsync:
+        with mock.patch('pyscaffold.writer.fsync_path', wraps=writer.fsync_path) as mock_fsync_path:
+            staging.commit_staging_folder(path, tmp_path / 'MyProject', ops, durable=True)
+            other = staging.create_staging_folder('Other', str(tmp_path), staging.staging_path('Other', str(tmp_path)))
+            staging.commit_staging_folder(other, tmp_path / 'Other')
+
+    assert (tmp_path / 'MyProject').is_dir()
+    assert [call.args[0] for call in mock_fsync_path.call_args_list] == [str(path.parent), str(tmp_path)]
+    assert mock_fsync.call_count == 2
+    assert ops['fsync'] == 2
+
+def test_commit_staging_folder_conflict(tmp_path):
+    """
+    Test committing a project that another run committed first.
+
+    Validates that:
+        - A `FileExistsError` is raised whether the conflict is seen before or during the rename.
+        - The staging directory is left in place for the caller to discard.
+    """
+    path = staging.create_staging_folder('MyProject', str(tmp_path), staging.staging_path('MyProject', str(tmp_path)))
+    project_path = tmp_path / 'MyProject'
+
+    with mock.patch('pyscaffold.staging.os.rename', side_effect=OSError(errno.ENOTEMPTY, 'Directory not empty')):
+        with pytest.raises(FileExistsError, match='already exists'):
+            staging.commit_staging_folder(path, project_path)
+
+    project_path.mkdir()
+    with pytest.raises(FileExistsError, match='already exists'):
+        staging.commit_staging_folder(path, project_path)
+
+    assert path.is_dir()
+
+def test_discard_staging_folder(tmp_path):
+    """
+    Test discarding a staging directory.
+
+    Validates that:
+        - The directory and its contents are deleted by a non-daemon background thread.
+    """
+    path = tmp_path / 'MyProject-staging'
+    (path / 'package').mkdir(parents=True)
+    (path / 'package' / 'module.py').write_text('')
+
+    thread = staging.discard_staging_folder(path)
+    thread.join()
+
+    assert not thread.daemon
+    assert not path.exists()
+
+def test_process_alive():
+    """
+    Test checking whether a process is running.
+
+    Validates that:
+        - This process is alive, and a process that cannot be found is not.
+        - A process owned by another user counts as alive.
+    """
+    assert staging.process_alive(os.getpid())
+
+    with mock.patch('os.kill', side_effect=ProcessLookupError):
+        assert not staging.process_alive(12345)
+    with mock.patch('os.kill', side_effect=PermissionError):
+        assert staging.process_alive(1)
+
+def test_discard_stale_staging(tmp_path):
+    """
+    Test deleting the staging directories of killed runs.
+
+    Validates that:
+        - A staging directory whose process is no longer alive is deleted.
+        - The staging directories of this process and of other live processes are kept.
+        - Directories whose name carries no pid are left alone.
+        - A projects root without a staging area is accepted.
+    """
+    assert staging.discard_stale_staging(str(tmp_path)) == []
+
+    root = tmp_path / staging.STAGING_DIRECTORY
+    names = ['Dead-12345-0123abcd', f'Mine-{os.getpid()}-0123abcd', 'Live-23456-0123abcd', 'Legacy-0123abcd']
+    for name in names:
+        (root / name / 'env').mkdir(parents=True)
+
+    with mock.patch('pyscaffold.staging.process_alive', side_effect=lambda pid: pid != 12345):
+        threads = staging.discard_stale_staging(str(tmp_path))
+    for thread in threads:
+        thread.join()
+
+    assert len(threads) == 1
+    assert sorted(path.name for path in root.iterdir()) == sorted(names[1:])
@@ -0,0 +1,175 @@
+"""
+Pyscaffold Test Sync
+
+This module contains tests for bringing existing projects up to date with the current templates. It verifies
+that only missing files and files still as generated from an older template are rewritten, that files edited
+by the user are left alone, and that the project's manifest follows the files it describes.
+
+Fixtures:
+- project: Generates a project from an older version of its templates, with its manifest.
+
+Tests:
+- test_file_status: Verifies how a file is classified from its current, rendered and recorded hashes.
+- test_sync_project: Validates that missing and pristine files are rewritten while edited files are kept.
+- test_sync_project_is_idempotent: Ensures a second sync finds every file unchanged or edited and writes nothing.
+- test_sync_project_dry_run: Ensures a dry run classifies the files without writing anything.
+- test_sync_project_without_manifest: Checks that a project without a manifest only gets its missing files.
+- test_sync_project_invalidates_bytecode: Ensures the cached bytecode of rewritten modules is removed.
+- test_sync_project_links_shared_files: Verifies that rewritten shared files are linked from the blob store.
+"""
+
+from unittest import mock
+
+import pytest
+
+from pyscaffold import manifest
+from pyscaffold.blobs import BlobStore
+from pyscaffold.sync import file_status, sync_project
+from pyscaffold.tree import ProjectTree
+
+OLD_TREE = {'setup.py': 'setup(version="1")\n', 'README.md': '# Old\n', 'LICENSE': 'MIT\n', 'pkg/__init__.py': ''}
+NEW_TREE = {'setup.py': 'setup(version="2")\n', 'README.md': '# New\n', 'LICENSE': 'MIT\n', 'pkg/__init__.py': '', 'pkg/cli.py': 'main()\n'}
+
+@pytest.fixture(scope="function")
+def project(tmp_path):
+    """
+    Fixture to generate a project from an older version of its templates.
+
+    Returns:
+        Path: The path of the project, whose README.md was edited by the user.
+    """
+    project_path = tmp_path / 'MyProject'
+    project_path.mkdir()
+    old = ProjectTree(OLD_TREE)
+    old.materialize(project_path)
+    manifest.write_manifest(project_path, manifest.build_manifest(old, project_path))
+    (project_path / 'README.md').write_text('# Old, with my notes\n')
+    yield project_path
+
+def test_file_status():
+    """
+    Test classifying files.
+
+    Validates that:
+        - A file matching the current templates is 'unchanged', even if it was edited to match.
+        - A missing file is 'added'.
+        - A file matching the recorded hash of an older template is 'updated'.
+        - Any other file is 'edited'.
+    """
+    assert file_status('new', 'new', 'old') == 'unchanged'
+    assert file_status(None, 'new', 'old') == 'added'
+    assert file_status('old', 'new', 'old') == 'updated'
+    assert file_status('mine', 'new', 'old') == 'edited'
+    assert file_status('old', 'new', None) == 'edited'
+
+def test_sync_project(project):
+    """
+    Test syncing a project generated from older templates.
+
+    Validates that:
+        - Pristine files are rewritten and missing files are added.
+        - Edited files are left alone.
+        - The manifest records the new files as written and keeps the generated entry of edited files.
+    """
+    statuses = sync_project(project, ProjectTree(NEW_TREE))
+
+    assert statuses == {
+        'LICENSE': 'unchanged',
+        'README.md': 'edited',
+        'pkg/__init__.py': 'unchanged',
+        'pkg/cli.py': 'added',
+        'setup.py': 'updated'
+    }
+    assert (project / 'setup.py').read_text() == 'setup(version="2")\n'
+    assert (project / 'pkg' / 'cli.py').read_text() == 'main()\n'
+    assert (project / 'README.md').read_text() == '# Old, with my notes\n'
+
+    recorded = manifest.read_manifest(project)['files']
+    assert recorded['setup.py'] == manifest.file_entry(project / 'setup.py', b'setup(version="2")\n')
+    assert recorded['pkg/cli.py']['sha256'] == manifest.digest(b'main()\n')
+    assert recorded['README.md']['sha256'] == manifest.digest(b'# Old\n')
+
+def test_sync_project_is_idempotent(project):
+    """
+    Test syncing a project twice.
+
+    Validates that:
+        - The second sync rewrites nothing, not even the manifest.
+    """
+    sync_project(project, ProjectTree(NEW_TREE))
+
+    with mock.patch('pyscaffold.sync.write_synced_file') as mock_write:
+        with mock.patch('pyscaffold.sync.write_manifest') as mock_manifest:
+            statuses = sync_project(project, ProjectTree(NEW_TREE))
+
+    assert set(statuses.values()) == {'unchanged', 'edited'}
+    mock_write.assert_not_called()
+    mock_manifest.assert_not_called()
+
+def test_sync_project_dry_run(project):
+    """
+    Test a dry run of a sync.
+
+    Validates that:
+        - The files are classified as they would be by a real sync.
+        - No file and no manifest is written.
+    """
+    before = manifest.read_manifest(project)
+
+    statuses = sync_project(project, ProjectTree(NEW_TREE), dry_run=True)
+
+    assert statuses['setup.py'] == 'updated' and statuses['pkg/cli.py'] == 'added'
+    assert (project / 'setup.py').read_text() == 'setup(version="1")\n'
+    assert not (project / 'pkg' / 'cli.py').exists()
+    assert manifest.read_manifest(project) == before
+
+def test_sync_project_invalidates_bytecode(project):
+    """
+    Test syncing a project whose modules were precompiled.
+
+    Validates that:
+        - The bytecode of a rewritten module is removed, so its new source is compiled again.
+        - The bytecode of an unchanged module is kept.
+    """
+    cache = project / 'pkg' / '__pycache__'
+    cache.mkdir()
+    for name in ('cli.cpython-311.pyc', 'cli.cpython-312.pyc', '__init__.cpython-311.pyc'):
+        (cache / name).write_bytes(b'stale')
+
+    sync_project(project, ProjectTree(NEW_TREE))
+
+    assert sorted(path.name for path in cache.iterdir()) == ['__init__.cpython-311.pyc']
+
+def test_sync_project_without_manifest(project):
+    """
+    Test syncing a project generated before manifests were recorded.
+
+    Validates that:
+        - Files that differ from the current templates are treated as edited, as nothing tells them apart.
+        - Missing files are added and a manifest is recorded for the files matching the templates.
+    """
+    (project / '.pyscaffold-manifest').unlink()
+
+    statuses = sync_project(project, ProjectTree(NEW_TREE))
+
+    assert statuses['setup.py'] == 'edited' and statuses['pkg/cli.py'] == 'added'
+    assert (project / 'setup.py').read_text() == 'setup(version="1")\n'
+    assert set(manifest.read_manifest(project)['files']) == {'LICENSE', 'pkg/__init__.py', 'pkg/cli.py'}
+
+def test_sync_project_links_shared_files(project, tmp_path):
+    """
+    Test syncing shared files with a blob store.
+
+    Validates that:
+        - A rewritten shared file is a hardlink of the blob holding its new content.
+        - A rewritten file that is not shared is a regular file.
+    """
+    store = BlobStore(tmp_path / 'blobs')
+    tree = ProjectTree()
+    for path, content in NEW_TREE.items():
+        tree.add(path, content, shared=path == 'pkg/cli.py')
+
+    sync_project(project, tree, store)
+
+    assert (project / 'pkg' / 'cli.py').samefile(store.path(BlobStore.digest(b'main()\n')))
+    assert (project / 'setup.py').stat().st_nlink == 1
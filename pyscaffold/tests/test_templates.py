@@ -0,0 +1,181 @@
+"""
+Pyscaffold Test Templates
+
+This module contains tests for the template engine used to render the fragments of a new project. It
+verifies that templates are parsed once into segments, that Python braces need no escaping, and that
+compiled templates are shared between identical sources.
+
+Tests:
+- test_render: Verifies that placeholders are filled and literal braces are kept as they are.
+- test_render_without_placeholders: Ensures a template without placeholders renders to its source.
+- test_render_escaped_placeholder: Validates that `$${name}` renders a literal `${name}`.
+- test_render_missing_value: Ensures a placeholder without a value raises a `KeyError`.
+- test_compile_template_is_cached: Checks that compiling the same source twice returns the same template.
+- test_compile_fragment: Validates that fragments are compiled under their name with a version of their source.
+- test_render_cache: Verifies that repeated renderings are served from the cache and counted as hits.
+- test_render_cache_constant_template: Ensures a template without placeholders is rendered once for every project.
+- test_render_cache_used_values: Ensures renderings are keyed only by the placeholders a template uses.
+- test_render_cache_eviction: Checks that the least recently used output is evicted once the cache is full.
+"""
+
+from unittest import mock
+
+import pytest
+
+from pyscaffold import fragments
+from pyscaffold.templates import Template, RenderCache, compile_template, compile_fragment
+
+def test_render():
+    """
+    Test rendering a template.
+
+    Validates that:
+        - Every occurrence of each placeholder is filled, including adjacent ones.
+        - Braces of the surrounding code are rendered as they are.
+        - Extra values are ignored.
+    """
+    template = Template("SUBCOMMANDS = {'${ProjectName}': ${packagename}.main}  # ${ProjectName}${packagename}\n")
+
+    assert template.names == {'ProjectName', 'packagename'}
+    assert template.render(ProjectName='MyProject', packagename='my_project', unused='x') == (
+        "SUBCOMMANDS = {'MyProject': my_project.main}  # MyProjectmy_project\n"
+    )
+
+def test_render_without_placeholders():
+    """
+    Test rendering a template without placeholders.
+
+    Validates that:
+        - The template has no placeholder names and renders to its source.
+    """
+    template = Template("settings = {}\nprint(f'{value}')\n")
+
+    assert template.names == frozenset()
+    assert template.render() == "settings = {}\nprint(f'{value}')\n"
+
+def test_render_escaped_placeholder():
+    """
+    Test rendering an escaped placeholder.
+
+    Validates that:
+        - `$${name}` renders as a literal `${name}` and is not a placeholder.
+        - A lone `$` is kept as it is.
+    """
+    template = Template('echo "$${HOME}" costs $5 for ${ProjectName}')
+
+    assert template.names == {'ProjectName'}
+    assert template.render(ProjectName='MyProject') == 'echo "${HOME}" costs $5 for MyProject'
+
+def test_render_missing_value():
+    """
+    Test rendering a template without all of its values.
+
+    Validates that:
+        - A `KeyError` naming the placeholder is raised.
+    """
+    with pytest.raises(KeyError, match='packagename'):
+        Template('import ${packagename}\n').render(ProjectName='MyProject')
+
+def test_compile_template_is_cached():
+    """
+    Test compiling the same source twice.
+
+    Validates that:
+        - The same compiled template is returned, so its source is parsed only once.
+    """
+    source = 'name = "${ProjectName}"\n'
+
+    assert compile_template(source) is compile_template(source)
+    assert compile_template(source).render(ProjectName='MyProject') == 'name = "MyProject"\n'
+
+def test_compile_fragment():
+    """
+    Test compiling a fragment.
+
+    Validates that:
+        - The template is named after its fragment and shared between calls.
+        - Its version changes with its source.
+    """
+    template = compile_fragment('PKG_MAIN_PY')
+
+    assert template.name == 'PKG_MAIN_PY'
+    assert template.source == fragments.PKG_MAIN_PY
+    assert compile_fragment('PKG_MAIN_PY') is template
+    assert Template(fragments.PKG_MAIN_PY + '\n', 'PKG_MAIN_PY').version != template.version
+
+def test_render_cache():
+    """
+    Test rendering through the render cache.
+
+    Validates that:
+        - Outputs are encoded as UTF-8 and keyed by the values of the placeholders used.
+        - A repeated rendering is a hit that does not render the template again.
+    """
+    cache = RenderCache()
+    template = Template('# ${ProjectName} (${packagename})\n', 'HEADER')
+
+    assert cache.render(template, 'MyProject', 'my_project') == b'# MyProject (my_project)\n'
+    assert cache.render(template, 'Other', 'other') == b'# Other (other)\n'
+
+    with mock.patch.object(Template, 'render') as mock_render:
+        assert cache.render(template, 'MyProject', 'my_project') == b'# MyProject (my_project)\n'
+    mock_render.assert_not_called()
+
+    assert cache.stats() == {'hits': 1, 'misses': 2, 'size': 2, 'maxsize': 1024, 'constants': 0}
+
+def test_render_cache_constant_template():
+    """
+    Test rendering a template without placeholders through the render cache.
+
+    Validates that:
+        - It is rendered once and then served for every project.
+        - It does not take up room in the LRU entries.
+    """
+    cache = RenderCache()
+    template = compile_fragment('PROJECT_LICENSE')
+
+    first = cache.render(template, 'ProjectA', 'project_a')
+    assert cache.render(template, 'ProjectB', 'project_b') is first
+    assert first == fragments.PROJECT_LICENSE.encode('utf-8')
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'size': 0, 'maxsize': 1024, 'constants': 1}
+
+def test_render_cache_used_values():
+    """
+    Test the key of a template using only some of the placeholders.
+
+    Validates that:
+        - Projects with different names but the same package name share the rendering.
+    """
+    cache = RenderCache()
+    template = Template('import ${packagename}\n', 'IMPORT')
+
+    assert cache.render(template, 'MyProject', 'my_project') == b'import my_project\n'
+    assert cache.render(template, 'my_project', 'my_project') == b'import my_project\n'
+    assert cache.render(template, 'Other', 'other') == b'import other\n'
+    assert cache.stats() == {'hits': 1, 'misses': 2, 'size': 2, 'maxsize': 1024, 'constants': 0}
+
+def test_render_cache_eviction():
+    """
+    Test evicting outputs from a full render cache.
+
+    Validates that:
+        - The least recently used output is evicted, while a recently used one is kept.
+        - Clearing the cache resets its counters.
+    """
+    cache = RenderCache(maxsize=2)
+    template = Template('${ProjectName}', 'NAME')
+
+    cache.render(template, 'A', 'a')
+    cache.render(template, 'B', 'b')
+    cache.render(template, 'A', 'a')
+    cache.render(template, 'C', 'c')
+
+    assert cache.stats()['size'] == 2
+    cache.render(template, 'A', 'a')
+    assert cache.stats()['hits'] == 2
+    cache.render(template, 'B', 'b')
+    assert cache.stats()['misses'] == 4
+
+    cache.clear()
+    assert cache.stats() == {'hits': 0, 'misses': 0, 'size': 0, 'maxsize': 2, 'constants': 0}
+
@@ -0,0 +1,202 @@
+"""
+Pyscaffold Test Tree
+
+This module contains tests for the in-memory project model. It verifies that a `ProjectTree` holds
+rendered files as bytes, writes them to disk in one pass, and compares itself with a project on disk.
+
+Tests:
+- test_add: Verifies that text is encoded and paths are normalized relative to the project root.
+- test_add_rejects_escaping_paths: Ensures absolute paths and paths leaving the project root are rejected.
+- test_subtree: Checks that the files below a directory are taken relative to it, with their flags.
+- test_directories: Validates that each directory is listed once, parents first.
+- test_materialize: Checks that every file is written with its exact content.
+- test_materialize_with_blob_store: Validates that shared files are hardlinked from a blob store and others are written.
+- test_materialize_with_writer: Checks that the files that are not linked are handed to a bulk writer.
+- test_materialize_metadata_ops: Verifies that the project directory is opened once and nothing is probed.
+- test_materialize_file_in_the_way: Ensures a file where a directory is needed raises an `OSError`.
+- test_diff: Validates that files are reported as added, modified or unchanged.
+"""
+
+import os
+import collections
+from pathlib import PurePosixPath
+from unittest import mock
+
+import pytest
+
+from pyscaffold.blobs import BlobStore
+from pyscaffold.tree import ProjectTree
+from pyscaffold.writer import BulkWriter
+
+def test_add():
+    """
+    Test adding files to a tree.
+
+    Validates that:
+        - Text content is stored as UTF-8 bytes and bytes are stored as they are.
+        - Paths given as strings and as `PurePosixPath` refer to the same file.
+    """
+    tree = ProjectTree({'README.md': '# Café\n'})
+    tree.add(PurePosixPath('pkg/data.bin'), b'\x00\x01')
+
+    assert tree['README.md'] == '# Café\n'.encode('utf-8')
+    assert tree[PurePosixPath('pkg') / 'data.bin'] == b'\x00\x01'
+    assert 'pkg/data.bin' in tree
+    assert list(tree) == [PurePosixPath('README.md'), PurePosixPath('pkg/data.bin')]
+    assert len(tree) == 2
+    assert tree.size() == len('# Café\n'.encode('utf-8')) + 2
+
+def test_add_rejects_escaping_paths():
+    """
+    Test adding files outside the project root.
+
+    Validates that:
+        - A `ValueError` is raised for absolute paths and for paths containing '..'.
+    """
+    tree = ProjectTree()
+
+    with pytest.raises(ValueError):
+        tree.add('/etc/passwd', '')
+    with pytest.raises(ValueError):
+        tree.add('pkg/../../outside.py', '')
+
+def test_subtree():
+    """
+    Test taking the files below a directory.
+
+    Validates that:
+        - Only the files below the directory are taken, relative to it.
+        - Their shared flags and sources are kept.
+    """
+    tree = ProjectTree({'setup.py': '', 'pkg/mod.py': 'x = 1\n', 'pkgs/other.py': ''})
+    tree.add('pkg/__init__.py', '', shared=True)
+    tree.add('pkg/sub/cli.py', 'main()\n', source=('CLI', 'abc'))
+
+    subtree = tree.subtree('pkg')
+
+    assert sorted(str(path) for path in subtree) == ['__init__.py', 'mod.py', 'sub/cli.py']
+    assert subtree['mod.py'] == b'x = 1\n'
+    assert subtree.shared == {PurePosixPath('__init__.py')}
+    assert subtree.sources == {PurePosixPath('sub/cli.py'): ('CLI', 'abc')}
+
+def test_directories():
+    """
+    Test listing the directories of a tree.
+
+    Validates that:
+        - Every directory holding a file is listed once, after its parent.
+    """
+    tree = ProjectTree({'setup.py': '', 'pkg/__init__.py': '', 'pkg/sub/mod.py': '', 'tests/test_pkg.py': ''})
+
+    assert tree.directories() == [PurePosixPath('pkg'), PurePosixPath('tests'), PurePosixPath('pkg/sub')]
+
+def test_materialize(tmp_path):
+    """
+    Test writing a tree to disk.
+
+    Validates that:
+        - Every file is written with its exact content and the count is returned.
+        - An existing directory in the tree's path is reused.
+    """
+    (tmp_path / 'pkg').mkdir()
+    tree = ProjectTree({'setup.py': 'setup()\n', 'pkg/__init__.py': '', 'pkg/sub/mod.py': b'x = 1\n'})
+
+    assert tree.materialize(tmp_path) == 3
+
+    assert (tmp_path / 'setup.py').read_bytes() == b'setup()\n'
+    assert (tmp_path / 'pkg' / '__init__.py').read_bytes() == b''
+    assert (tmp_path / 'pkg' / 'sub' / 'mod.py').read_bytes() == b'x = 1\n'
+
+def test_materialize_with_blob_store(tmp_path):
+    """
+    Test writing a tree with shared files to disk.
+
+    Validates that:
+        - Shared files are hardlinks of the blob holding their content.
+        - Files that are not shared are written as regular files.
+        - Adding a file again without `shared` clears the mark.
+    """
+    store = BlobStore(tmp_path / 'blobs')
+    project_path = tmp_path / 'project'
+    project_path.mkdir()
+    tree = ProjectTree()
+    tree.add('LICENSE', 'MIT\n', shared=True)
+    tree.add('pkg/__init__.py', '', shared=True)
+    tree.add('setup.py', 'setup()\n', shared=True)
+    tree.add('setup.py', 'setup(name="project")\n')
+
+    assert tree.materialize(project_path, store) == 3
+
+    assert (project_path / 'LICENSE').samefile(store.path(BlobStore.digest(b'MIT\n')))
+    assert (project_path / 'pkg' / '__init__.py').samefile(store.path(BlobStore.digest(b'')))
+    assert (project_path / 'setup.py').stat().st_nlink == 1
+    assert (project_path / 'setup.py').read_bytes() == b'setup(name="project")\n'
+
+def test_materialize_with_writer(tmp_path):
+    """
+    Test writing a tree to disk with a bulk writer.
+
+    Validates that:
+        - Every file is written by the writer in a single batch.
+    """
+    tree = ProjectTree({'setup.py': 'setup()\n', 'pkg/__init__.py': '', 'pkg/cli.py': 'main()\n'})
+
+    with BulkWriter(workers=2) as writer:
+        with mock.patch.object(writer, 'write_all', wraps=writer.write_all) as mock_write_all:
+            assert tree.materialize(tmp_path, writer=writer) == 3
+
+    mock_write_all.assert_called_once()
+    assert (tmp_path / 'pkg' / 'cli.py').read_bytes() == b'main()\n'
+    assert sorted(writer.written) == ['pkg/__init__.py', 'pkg/cli.py', 'setup.py']
+
+def test_materialize_metadata_ops(tmp_path):
+    """
+    Test counting the metadata operations of writing a tree.
+
+    Validates that:
+        - The project directory is opened once and each directory and file is created relative to it.
+        - Directories are created without probing them first; only one in the way is checked.
+    """
+    tree = ProjectTree({'setup.py': 'setup()\n', 'pkg/__init__.py': '', 'pkg/sub/mod.py': b'x = 1\n'})
+    ops = collections.Counter()
+
+    with mock.patch('pyscaffold.tree.os.open', wraps=os.open) as mock_open:
+        tree.materialize(tmp_path, ops=ops)
+
+    assert ops == {'open': 4, 'mkdir': 2}
+    assert mock_open.call_args_list[0].args[0] == tmp_path
+    assert all(call.kwargs.get('dir_fd') is not None for call in mock_open.call_args_list[1:])
+
+    ops.clear()
+    tree.materialize(tmp_path, ops=ops)
+    assert ops == {'open': 4, 'mkdir': 2, 'stat': 2}
+
+def test_materialize_file_in_the_way(tmp_path):
+    """
+    Test writing a tree where a file occupies a directory's path.
+
+    Validates that:
+        - An `OSError` is raised.
+    """
+    (tmp_path / 'pkg').touch()
+
+    with pytest.raises(OSError):
+        ProjectTree({'pkg/__init__.py': ''}).materialize(tmp_path)
+
+def test_diff(tmp_path):
+    """
+    Test comparing a tree with a project on disk.
+
+    Validates that:
+        - Missing files are 'added', differing files are 'modified' and identical files are 'unchanged'.
+    """
+    tree = ProjectTree({'setup.py': 'setup()\n', 'README.md': '# Project\n', 'LICENSE': 'MIT\n'})
+    tree.materialize(tmp_path)
+    (tmp_path / 'README.md').write_text('# Edited\n')
+    (tmp_path / 'LICENSE').unlink()
+
+    assert tree.diff(tmp_path) == {
+        PurePosixPath('setup.py'): 'unchanged',
+        PurePosixPath('README.md'): 'modified',
+        PurePosixPath('LICENSE'): 'added'
+    }
@@ -21,8 +21,16 @@ from pyscaffold.utils import (
     change_directory,
     set_destination, 
     apply_naming_conventions,
-    preprocess_arguments
+    preprocess_arguments,
+    print_results_table,
+    print_interpreters_table,
+    print_sync_report,
+    print_projects,
+    find_projects,
+    listing_ready,
+    scan_projects
 )
+from pyscaffold.pyscaffold import ProjectResult
 
 @pytest.fixture(scope="function")
 def setup_and_teardown():
@@ -89,6 +97,24 @@ def test_project_ready(setup_and_teardown):
     (project_path / 'setup.py').unlink()
     assert project_ready(project_path) == False
 
+def test_project_ready_from_manifest(setup_and_teardown):
+    """
+    Test the project_ready function on a project with a manifest.
+
+    This test checks that a project whose manifest records its virtual environment
+    is ready without checking its files on disk.
+
+    Args:
+        setup_and_teardown (tuple): The fixture providing paths and config.
+    """
+    _, project_path, _ = setup_and_teardown
+    (project_path / 'setup.py').unlink()
+    (project_path / '.pyscaffold-manifest').write_text('{"version": 2, "files": {}, "venv": {"directory": "venv"}}')
+
+    with mock.patch('pathlib.Path.is_file') as mock_is_file:
+        assert project_ready(project_path) == True
+    mock_is_file.assert_not_called()
+
 def test_change_directory(setup_and_teardown):
     """
     Test the change_directory function.
@@ -400,5 +426,153 @@ def test_activate_virtual_env_non_test(mock_execute_command, setup_and_teardown)
                 # Check the function result
                 assert result == True
 
+def test_print_results_table(capsys):
+    """
+    Test the print_results_table function.
+
+    This test verifies that every project is listed with its status, duration,
+    metadata operation count and path.
+
+    Args:
+        capsys (pytest.Capsys): The pytest fixture to capture output to sys.stdout.
+    """
+    results = [
+        ProjectResult('ProjectA', 'ok', 1.234, Path('/tmp/ProjectA'), None, 27),
+        ProjectResult('ProjectB', 'failed', 0.5, Path('/tmp/ProjectB'), 'boom')
+    ]
+    print_results_table(results)
+    lines = capsys.readouterr().out.splitlines()
+
+    assert lines[0].split() == ['PROJECT', 'STATUS', 'DURATION', 'OPS', 'PATH']
+    assert 'ProjectA' in lines[1] and 'ok' in lines[1] and '1.23s' in lines[1] and ' 27 ' in lines[1] and '/tmp/ProjectA' in lines[1]
+    assert 'ProjectB' in lines[2] and 'failed' in lines[2] and ' - ' in lines[2] and '/tmp/ProjectB' in lines[2]
+
+def test_print_interpreters_table(capsys):
+    """
+    Test the print_interpreters_table function.
+
+    This test verifies that interpreters are listed by ascending version, 
+    numerically rather than alphabetically, with their full version and real path.
+
+    Args:
+        capsys (pytest.Capsys): The pytest fixture to capture output to sys.stdout.
+    """
+    registry = {
+        '3.10': {'path': '/usr/bin/python3.10', 'realpath': '/usr/bin/python3.10', 'version': '3.10.14'},
+        '3.9': {'path': '/usr/bin/python3.9', 'realpath': '/usr/lib/python3.9/bin', 'version': '3.9.19'}
+    }
+    print_interpreters_table(registry)
+    lines = capsys.readouterr().out.splitlines()
+
+    assert lines[0].split() == ['PYTHON', 'VERSION', 'PATH']
+    assert '3.9.19' in lines[1] and '/usr/lib/python3.9/bin' in lines[1]
+    assert '3.10.14' in lines[2]
+
+    print_interpreters_table({})
+    assert 'No Python interpreters found' in capsys.readouterr().out
+
+def test_find_projects(tmp_path):
+    """
+    Test the find_projects function.
+
+    This test verifies that only ready projects are found, sorted by name, and that
+    hidden directories such as the staging directory and files are skipped.
+
+    Args:
+        tmp_path (Path): The pytest fixture providing a temporary directory.
+    """
+    for name in ('ProjectB', 'ProjectA', '.pyscaffold-staging'):
+        (tmp_path / name / 'env').mkdir(parents=True)
+        (tmp_path / name / 'setup.py').touch()
+    (tmp_path / 'NotAProject').mkdir()
+    (tmp_path / 'notes.txt').touch()
+
+    assert find_projects(tmp_path) == ['ProjectA', 'ProjectB']
+
+def test_listing_ready(tmp_path):
+    """
+    Test the listing_ready function.
+
+    This test verifies that a project is ready with a 'setup.py' file and an 'env' or 'venv'
+    directory, that entries of the wrong type do not count, and that a missing directory is not ready.
+
+    Args:
+        tmp_path (Path): The pytest fixture providing a temporary directory.
+    """
+    (tmp_path / 'setup.py').touch()
+    assert not listing_ready(tmp_path)
+
+    (tmp_path / 'env').touch()
+    assert not listing_ready(tmp_path)
+
+    (tmp_path / 'venv').mkdir()
+    assert listing_ready(tmp_path)
+    assert not listing_ready(tmp_path / 'missing')
+
+def test_scan_projects(tmp_path):
+    """
+    Test the scan_projects function.
+
+    This test verifies that every project directory is yielded with its readiness, that hidden
+    entries and files are skipped, and that results are yielded before the scan has finished.
+
+    Args:
+        tmp_path (Path): The pytest fixture providing a temporary directory.
+    """
+    for name in ('ProjectA', '.pyscaffold-pool'):
+        (tmp_path / name / 'env').mkdir(parents=True)
+        (tmp_path / name / 'setup.py').touch()
+    (tmp_path / 'NotAProject').mkdir()
+    (tmp_path / 'notes.txt').touch()
+
+    scan = scan_projects(tmp_path)
+
+    assert next(scan) in {('ProjectA', True), ('NotAProject', False)}
+    assert sorted(scan_projects(tmp_path)) == [('NotAProject', False), ('ProjectA', True)]
+
+def test_print_projects(capsys):
+    """
+    Test the print_projects function.
+
+    This test verifies that each project is printed with its readiness as it is consumed,
+    followed by a summary, and that the number of projects is returned.
+
+    Args:
+        capsys (pytest.CaptureFixture): The pytest fixture to capture output.
+    """
+    assert print_projects(iter([('ProjectA', True), ('ProjectB', False)])) == 2
+
+    lines = capsys.readouterr().out.splitlines()
+    assert 'ready' in lines[0] and lines[0].endswith(' ProjectA')
+    assert 'not ready' in lines[1] and lines[1].endswith(' ProjectB')
+    assert lines[2] == '2 project(s), 1 ready'
+
+def test_print_sync_report(capsys):
+    """
+    Test the print_sync_report function.
+
+    This test verifies that only projects with changes or errors are listed, and that
+    the summary counts the synced and failed projects and the rewritten files.
+
+    Args:
+        capsys (pytest.Capsys): The pytest fixture to capture output to sys.stdout.
+    """
+    report = {
+        'ProjectA': {'shared': {'LICENSE': 'modified'}, 'files': {'setup.py': 'updated', 'LICENSE': 'edited', 'cli.py': 'added'}},
+        'ProjectB': {'shared': {'LICENSE': 'linked'}, 'files': {'setup.py': 'unchanged'}},
+        'ProjectD': {'shared': {'LICENSE': 'restored'}, 'files': {'LICENSE': 'unchanged'}},
+        'ProjectC': {'error': 'Permission denied'}
+    }
+    print_sync_report(report)
+    lines = capsys.readouterr().out.splitlines()
+
+    assert lines[0] == 'ProjectA: 1 added, 1 updated, 1 edited, 1 unshared'
+    assert lines[1] == 'ProjectD: 1 restored'
+    assert 'ProjectC: Permission denied' in lines[2]
+    assert lines[3] == 'Synced 3 project(s), 1 failed: 3 file(s) rewritten'
+
+    print_sync_report(report, dry_run=True)
+    assert '3 file(s) would be rewritten' in capsys.readouterr().out
+
 if __name__ == "__main__":
     pytest.main()
\ No newline at end of file
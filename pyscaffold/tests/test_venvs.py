@@ -0,0 +1,257 @@
+"""
+Pyscaffold Test Virtual Environments
+
+This module contains tests for the strategies used to create a project's virtual environment. It verifies
+that the cached base environment is built once per Python version and that clones of it are relocated
+to their new path without modifying the cached template.
+
+Fixtures:
+- cache_dir: Points the pyscaffold cache directory at a temporary directory for the whole module.
+
+Tests:
+- test_create_environment_in_process: Verifies that an environment of the running Python version is built without a subprocess.
+- test_create_environment_foreign_version: Ensures other Python versions still run `python -m venv` with the same options.
+- test_build_template: Verifies that the base environment is built in the cache directory with its own paths.
+- test_build_template_reuses_existing: Ensures an existing base environment is not rebuilt.
+- test_create_from_cache: Validates that a clone works from its new location and shares files with the template.
+- test_relocate_virtual_environment: Checks that baked paths are rewritten without touching linked files.
+- test_fill_pool: Verifies that the pool is filled with relocated environments and not overfilled.
+- test_create_from_pool: Validates that a pooled environment is moved into a project, patched and refilled.
+- test_create_from_pool_empty: Ensures an empty pool falls back to `python -m venv`.
+- test_create_shared_pip: Validates that an environment without pip still runs the shared pip.
+- test_deploy_virtual_environment_unknown_strategy: Ensures an unknown strategy raises a `ValueError`.
+"""
+
+import os
+import sys
+import subprocess
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+from pyscaffold import venvs
+from pyscaffold.pyscaffold import Pyscaffold
+
+@pytest.fixture(scope="module")
+def cache_dir(tmp_path_factory):
+    """
+    Fixture to point the pyscaffold cache directory at a temporary directory.
+
+    Returns:
+        Path: The temporary cache directory.
+    """
+    cache = tmp_path_factory.mktemp("cache")
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv('XDG_CACHE_HOME', str(cache))
+        yield cache / 'pyscaffold'
+
+def test_create_environment_in_process(tmp_path):
+    """
+    Test creating a virtual environment of the running Python version.
+
+    Validates that:
+        - No subprocess is spawned to create an environment without pip.
+        - The environment's interpreter works and reports the environment as its prefix.
+    """
+    venv_path = tmp_path / 'env'
+    python_version = f'{sys.version_info[0]}.{sys.version_info[1]}'
+
+    with mock.patch('pyscaffold.interpreters.is_running_interpreter', return_value=True):
+        with mock.patch('pyscaffold.venvs.subprocess.run') as mock_run:
+            venvs.create_environment(venv_path, python_version, 'unused', with_pip=False, prompt='env')
+
+    mock_run.assert_not_called()
+    prefix = subprocess.run([venv_path / 'bin' / 'python', '-c', 'import sys; print(sys.prefix)'], capture_output=True, text=True, check=True)
+    assert prefix.stdout.strip() == str(venv_path)
+    assert '(env)' in (venv_path / 'bin' / 'activate').read_text()
+
+def test_create_environment_foreign_version(tmp_path):
+    """
+    Test creating a virtual environment of another Python version.
+
+    Validates that:
+        - The requested interpreter is run with `-m venv` and the matching options.
+    """
+    venv_path = tmp_path / 'env'
+
+    with mock.patch('pyscaffold.interpreters.is_running_interpreter', return_value=False):
+        with mock.patch('pyscaffold.venvs.subprocess.run') as mock_run:
+            venvs.create_environment(venv_path, '9.8', '/usr/bin/python9.8', with_pip=False, prompt='env')
+
+    mock_run.assert_called_once_with(
+        ['/usr/bin/python9.8', '-m', 'venv', '--without-pip', '--prompt', 'env', str(venv_path)],
+        check=True, stdout=subprocess.DEVNULL
+    )
+
+def test_build_template(cache_dir):
+    """
+    Test building the cached base environment.
+
+    Validates that:
+        - The base environment lives under the cache directory.
+        - Its baked paths point at its final location rather than the staging directory.
+    """
+    template = venvs.build_template('3.11', 'python3.11')
+
+    assert template == cache_dir / 'venvs' / '3.11' / 'env'
+    assert (template / 'bin' / 'pip').exists()
+    assert f'VIRTUAL_ENV="{template}"' in (template / 'bin' / 'activate').read_text()
+    assert '.building-' not in (template / 'pyvenv.cfg').read_text()
+
+def test_build_template_reuses_existing(cache_dir):
+    """
+    Test that an existing base environment is reused.
+
+    Validates that:
+        - No `venv` subprocess is spawned when the template already exists.
+    """
+    venvs.build_template('3.11', 'python3.11')
+
+    with mock.patch('pyscaffold.venvs.subprocess.run') as mock_run:
+        venvs.build_template('3.11', 'python3.11')
+
+    mock_run.assert_not_called()
+
+def test_create_from_cache(cache_dir, tmp_path):
+    """
+    Test creating a virtual environment from the cached base environment.
+
+    Validates that:
+        - The clone's interpreter reports the clone as its prefix.
+        - The clone's pip runs and its shebang points into the clone.
+        - Package files are shared with the template instead of copied.
+    """
+    venv_path = tmp_path / 'env'
+
+    venvs.create_from_cache(venv_path, '3.11', 'python3.11', tmp_path)
+
+    prefix = subprocess.run([venv_path / 'bin' / 'python', '-c', 'import sys; print(sys.prefix)'], capture_output=True, text=True, check=True)
+    assert prefix.stdout.strip() == str(venv_path)
+
+    pip = subprocess.run([venv_path / 'bin' / 'pip', '--version'], capture_output=True, text=True, check=True)
+    assert str(venv_path) in pip.stdout
+    assert (venv_path / 'bin' / 'pip').read_text().startswith(f'#!{venv_path}/bin/python')
+
+    template = venvs.template_path('3.11')
+    module = next((venv_path / 'lib').glob('python3.11/site-packages/pip/__init__.py'))
+    template_module = template / module.relative_to(venv_path)
+    assert os.path.samefile(module, template_module) or module.read_bytes() == template_module.read_bytes()
+
+def test_relocate_virtual_environment(tmp_path):
+    """
+    Test rewriting the paths baked into a moved virtual environment.
+
+    Validates that:
+        - `pyvenv.cfg` and the scripts in `bin/` are rewritten to the new path.
+        - A file hardlinked elsewhere is replaced rather than modified in place.
+    """
+    old_path = Path('/old/location/env')
+    venv_path = tmp_path / 'env'
+    (venv_path / 'bin').mkdir(parents=True)
+    (venv_path / 'pyvenv.cfg').write_text(f'command = python3.11 -m venv {old_path}\n')
+    (venv_path / 'bin' / 'activate').write_text(f'VIRTUAL_ENV="{old_path}"\n')
+    shared = tmp_path / 'shared-activate'
+    os.link(venv_path / 'bin' / 'activate', shared)
+
+    venvs.relocate_virtual_environment(venv_path, old_path)
+
+    assert (venv_path / 'pyvenv.cfg').read_text() == f'command = python3.11 -m venv {venv_path}\n'
+    assert (venv_path / 'bin' / 'activate').read_text() == f'VIRTUAL_ENV="{venv_path}"\n'
+    assert shared.read_text() == f'VIRTUAL_ENV="{old_path}"\n'
+
+def test_fill_pool(tmp_path):
+    """
+    Test filling the prewarmed virtual environment pool.
+
+    Validates that:
+        - The pool holds the requested number of ready environments under the projects root.
+        - Each environment's baked paths point at its location in the pool.
+        - A second fill builds nothing.
+    """
+    assert venvs.fill_pool(tmp_path, '3.11', 'python3.11', 2) == 2
+
+    entries = venvs.pool_entries(tmp_path, '3.11')
+    assert len(entries) == 2
+    assert all(entry.parent == tmp_path / '.pyscaffold-pool' / '3.11' for entry in entries)
+    assert f'VIRTUAL_ENV="{entries[0]}"' in (entries[0] / 'bin' / 'activate').read_text()
+    assert '(env)' in (entries[0] / 'bin' / 'activate').read_text()
+
+    assert venvs.fill_pool(tmp_path, '3.11', 'python3.11', 2) == 0
+
+def test_create_from_pool(tmp_path):
+    """
+    Test creating a virtual environment from the pool.
+
+    Validates that:
+        - The oldest pooled environment is moved into the project and works from there.
+        - A background refill is requested.
+    """
+    venvs.fill_pool(tmp_path, '3.11', 'python3.11', 1)
+    entry = venvs.pool_entries(tmp_path, '3.11')[0]
+    venv_path = tmp_path / 'PooledProject' / 'env'
+    venv_path.parent.mkdir()
+
+    with mock.patch('pyscaffold.venvs.refill_pool_in_background') as mock_refill:
+        venvs.create_from_pool(venv_path, '3.11', 'python3.11', tmp_path)
+
+    assert not entry.exists()
+    assert venvs.pool_entries(tmp_path, '3.11') == []
+    mock_refill.assert_called_once_with(tmp_path, '3.11')
+
+    prefix = subprocess.run([venv_path / 'bin' / 'python', '-c', 'import sys; print(sys.prefix)'], capture_output=True, text=True, check=True)
+    assert prefix.stdout.strip() == str(venv_path)
+    assert f'VIRTUAL_ENV="{venv_path}"' in (venv_path / 'bin' / 'activate').read_text()
+
+def test_create_from_pool_empty(tmp_path):
+    """
+    Test creating a virtual environment when the pool is empty.
+
+    Validates that:
+        - The environment is created with `python -m venv` and a refill is still requested.
+    """
+    venv_path = tmp_path / 'env'
+
+    with mock.patch('pyscaffold.venvs.refill_pool_in_background') as mock_refill:
+        with mock.patch('pyscaffold.venvs.create_standard') as mock_create:
+            venvs.create_from_pool(venv_path, '3.11', 'python3.11', tmp_path)
+
+    mock_create.assert_called_once_with(venv_path, '3.11', 'python3.11', tmp_path)
+    mock_refill.assert_called_once_with(tmp_path, '3.11')
+
+def test_create_shared_pip(cache_dir, tmp_path):
+    """
+    Test creating a lightweight virtual environment that shares pip.
+
+    Validates that:
+        - No copy of pip is installed in the environment.
+        - `pip` and `python -m pip` both run from the shared installation with the environment's interpreter.
+    """
+    venv_path = tmp_path / 'env'
+
+    venvs.create_shared_pip(venv_path, '3.11', 'python3.11', tmp_path)
+
+    site_packages = venv_path / 'lib' / 'python3.11' / 'site-packages'
+    assert not (site_packages / 'pip').exists()
+
+    shared_site_packages = venvs.template_path('3.11') / 'lib' / 'python3.11' / 'site-packages'
+    pip = subprocess.run([venv_path / 'bin' / 'pip', '--version'], capture_output=True, text=True, check=True)
+    assert str(shared_site_packages) in pip.stdout
+
+    module = subprocess.run([venv_path / 'bin' / 'python', '-m', 'pip', '--version'], capture_output=True, text=True, check=True, cwd=tmp_path)
+    assert str(shared_site_packages) in module.stdout
+
+    prefix = subprocess.run([venv_path / 'bin' / 'python', '-c', 'import sys; print(sys.prefix)'], capture_output=True, text=True, check=True)
+    assert prefix.stdout.strip() == str(venv_path)
+
+def test_deploy_virtual_environment_unknown_strategy(tmp_path):
+    """
+    Test deploying a virtual environment with an unknown strategy.
+
+    Validates that:
+        - A `ValueError` is raised before anything is created.
+    """
+    with pytest.raises(ValueError, match="Unknown virtual environment strategy 'magic'"):
+        Pyscaffold.deploy_virtual_environment(tmp_path, '3.11', 'magic')
+
+    assert not (tmp_path / 'env').exists()
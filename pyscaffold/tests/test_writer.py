@@ -0,0 +1,158 @@
+"""
+Pyscaffold Test Writer
+
+This module contains tests for the bulk file writer. It verifies that files are written with their exact
+content on a thread pool, that errors are reported once every job has finished, and that each durability
+mode syncs files and directories as it promises.
+
+Tests:
+- test_write_file: Verifies that a file is created or truncated with its full content.
+- test_write_all: Validates that every job is written and recorded for the commit.
+- test_write_all_error: Ensures a failing job raises after the other jobs were written.
+- test_unknown_durability: Checks that an unknown durability mode is rejected.
+- test_commit_none: Verifies that nothing is synced without durability.
+- test_commit_batch: Validates that a batch commit syncs the filesystem once.
+- test_commit_batch_without_syncfs: Ensures a batch commit syncs every file and directory when `syncfs` is unavailable.
+- test_commit_full: Validates that full durability syncs each file as it is written and the directories at commit.
+- test_syncfs: Checks that the filesystem is synced where `syncfs` is available.
+"""
+
+import os
+from unittest import mock
+
+import pytest
+
+from pyscaffold import writer
+from pyscaffold.writer import BulkWriter, write_file
+
+def test_write_file(tmp_path):
+    """
+    Test writing a single file.
+
+    Validates that:
+        - A new file holds the content and an existing file is truncated.
+    """
+    path = tmp_path / 'setup.py'
+
+    write_file(path, b'setup(name="project")\n')
+    write_file(path, b'setup()\n')
+
+    assert path.read_bytes() == b'setup()\n'
+
+def test_write_all(tmp_path):
+    """
+    Test writing a batch of files on the thread pool.
+
+    Validates that:
+        - Every file is written with its content and the count is returned.
+        - The written files are recorded for the commit.
+    """
+    jobs = [(tmp_path / f'module_{index}.py', f'x = {index}\n'.encode()) for index in range(20)]
+
+    with BulkWriter(workers=4) as bulk_writer:
+        assert bulk_writer.write_all(jobs) == 20
+
+    assert all(path.read_bytes() == content for path, content in jobs)
+    assert bulk_writer.written == [str(path) for path, _ in jobs]
+
+def test_write_all_error(tmp_path):
+    """
+    Test a batch in which a job fails.
+
+    Validates that:
+        - The job's error is raised.
+        - The other jobs were still written.
+    """
+    jobs = [(tmp_path / 'missing' / 'a.py', b''), (tmp_path / 'b.py', b'b = 1\n')]
+
+    with BulkWriter(workers=2) as bulk_writer:
+        with pytest.raises(FileNotFoundError):
+            bulk_writer.write_all(jobs)
+
+    assert (tmp_path / 'b.py').read_bytes() == b'b = 1\n'
+
+def test_unknown_durability():
+    """
+    Test creating a writer with an unknown durability mode.
+
+    Validates that:
+        - A `ValueError` is raised.
+    """
+    with pytest.raises(ValueError):
+        BulkWriter('always')
+
+def test_commit_none(tmp_path):
+    """
+    Test committing without durability.
+
+    Validates that:
+        - No file, directory or filesystem is synced.
+    """
+    with mock.patch('pyscaffold.writer.os.fsync') as mock_fsync, mock.patch('pyscaffold.writer.syncfs') as mock_syncfs:
+        with BulkWriter('none', workers=2) as bulk_writer:
+            bulk_writer.write_all([(tmp_path / 'a.py', b''), (tmp_path / 'b.py', b'')])
+            bulk_writer.commit(tmp_path)
+
+    mock_fsync.assert_not_called()
+    mock_syncfs.assert_not_called()
+    assert bulk_writer.written == []
+
+def test_commit_batch(tmp_path):
+    """
+    Test committing with batch durability.
+
+    Validates that:
+        - Files are not synced while they are written.
+        - The commit syncs the filesystem once and nothing else.
+    """
+    with mock.patch('pyscaffold.writer.os.fsync') as mock_fsync, mock.patch('pyscaffold.writer.syncfs', return_value=True) as mock_syncfs:
+        with BulkWriter('batch', workers=2) as bulk_writer:
+            bulk_writer.write_all([(tmp_path / 'a.py', b''), (tmp_path / 'b.py', b'')])
+            bulk_writer.commit(tmp_path)
+
+    mock_syncfs.assert_called_once_with(tmp_path)
+    mock_fsync.assert_not_called()
+
+def test_commit_batch_without_syncfs(tmp_path):
+    """
+    Test committing with batch durability where `syncfs` is unavailable.
+
+    Validates that:
+        - Every written file and their directory are synced at commit.
+    """
+    with mock.patch('pyscaffold.writer.syncfs', return_value=False):
+        with mock.patch('pyscaffold.writer.fsync_path') as mock_fsync_path:
+            with BulkWriter('batch', workers=2) as bulk_writer:
+                bulk_writer.write_all([(tmp_path / 'a.py', b''), (tmp_path / 'b.py', b'')])
+                bulk_writer.commit(tmp_path)
+
+    synced = [call.args[0] for call in mock_fsync_path.call_args_list]
+    assert synced == [str(tmp_path / 'a.py'), str(tmp_path / 'b.py'), str(tmp_path)]
+
+def test_commit_full(tmp_path):
+    """
+    Test committing with full durability.
+
+    Validates that:
+        - Each file is synced as it is written.
+        - The commit syncs the directories holding the files, deepest first.
+    """
+    (tmp_path / 'pkg').mkdir()
+
+    with mock.patch('pyscaffold.writer.os.fsync', wraps=os.fsync) as mock_fsync:
+        with BulkWriter('full', workers=2) as bulk_writer:
+            bulk_writer.write_all([(tmp_path / 'setup.py', b''), (tmp_path / 'pkg' / '__init__.py', b'')])
+            assert mock_fsync.call_count == 2
+            with mock.patch('pyscaffold.writer.fsync_path') as mock_fsync_path:
+                bulk_writer.commit(tmp_path)
+
+    assert [call.args[0] for call in mock_fsync_path.call_args_list] == [str(tmp_path / 'pkg'), str(tmp_path)]
+
+def test_syncfs(tmp_path):
+    """
+    Test syncing the filesystem holding a directory.
+
+    Validates that:
+        - The filesystem is synced where the C library provides `syncfs`, and reported as not synced otherwise.
+    """
+    assert writer.syncfs(tmp_path) is (writer._libc_syncfs() is not None)
@@ -0,0 +1,196 @@
+"""
+Pyscaffold Tree
+
+This module contains the in-memory model of a generated project. A `ProjectTree` maps
+each file's path, relative to the project root, to its rendered content, so a project can
+be rendered once and then written to disk in a single pass, compared against an existing
+project, or inspected without touching the disk at all. Files whose content is the same for
+every project can be marked as shared and hardlinked from a blob store when written.
+
+Classes:
+    ProjectTree: A rendered project held in memory as a path to bytes mapping.
+"""
+
+import os
+import stat
+import collections
+from pathlib import Path, PurePosixPath
+
+from pyscaffold.writer import write_file
+
+# Whether files, directories and links can be created relative to a directory descriptor
+DIR_FD_SUPPORTED = {os.open, os.mkdir, os.stat, os.link} <= os.supports_dir_fd
+
+class ProjectTree():
+    """
+    A rendered project held in memory, mapping relative file paths to their contents.
+    """
+
+    def __init__(self, files: dict = None):
+        """
+        Initialize the tree.
+
+        Args:
+            files (dict, optional): Relative file paths mapped to their contents as str or bytes.
+        """
+        self.files = {}
+        self.shared = set()
+        self.sources = {}
+        for path, content in (files or {}).items():
+            self.add(path, content)
+
+    def add(self, path, content, shared: bool = False, source: tuple = None) -> None:
+        """
+        Add a file to the tree, replacing any file at the same path.
+
+        Args:
+            path (str or PurePosixPath): The file's path relative to the project root.
+            content (str or bytes): The file's content. Text is encoded as UTF-8.
+            shared (bool): Whether the content is the same for every project, so the file can
+                be linked from a blob store (default: False).
+            source (tuple, optional): The name and version of the template the file was rendered from.
+
+        Raises:
+            ValueError: If the path is absolute or escapes the project root.
+        """
+        path = PurePosixPath(path)
+        if path.is_absolute() or '..' in path.parts:
+            raise ValueError(f"Path '{path}' is not relative to the project root.")
+        self.files[path] = content.encode('utf-8') if isinstance(content, str) else bytes(content)
+        if shared:
+            self.shared.add(path)
+        else:
+            self.shared.discard(path)
+        if source:
+            self.sources[path] = tuple(source)
+        else:
+            self.sources.pop(path, None)
+
+    def subtree(self, directory) -> 'ProjectTree':
+        """
+        Take the files below a directory as a tree of their own.
+
+        Args:
+            directory (str or PurePosixPath): The directory, relative to the project root.
+
+        Returns:
+            ProjectTree: The files below the directory, relative to it, with their shared flags and sources.
+        """
+        directory = PurePosixPath(directory)
+        subtree = ProjectTree()
+        for path, content in self.files.items():
+            if directory in path.parents:
+                subtree.add(path.relative_to(directory), content, path in self.shared, self.sources.get(path))
+        return subtree
+
+    def directories(self) -> list:
+        """
+        List the directories needed to hold the tree's files, parents first.
+
+        Returns:
+            list of PurePosixPath: Every directory below the project root holding a file.
+        """
+        directories = set()
+        for path in self.files:
+            directories.update(parent for parent in path.parents if parent != PurePosixPath('.'))
+        return sorted(directories, key=lambda directory: (len(directory.parts), directory))
+
+    def materialize(self, root: Path, store=None, writer=None, ops: collections.Counter = None) -> int:
+        """
+        Write the tree to disk in one pass.
+
+        The project directory is opened once and every directory and file is created
+        relative to that descriptor, so the path of the project is not resolved again for
+        each file. Each directory is created once, without probing it first, then every
+        file is written with a single `write` of its full content. With a blob store, shared
+        files are hardlinked from the store instead and must not exist yet. With a bulk
+        writer, the files are written on its thread pool; making them durable is left to
+        the writer's `commit`.
+
+        Args:
+            root (Path): The project directory to write into, which must exist.
+            store (BlobStore, optional): The blob store to link shared files from.
+            writer (BulkWriter, optional): The writer to write the files with.
+            ops (collections.Counter, optional): Counts the metadata operations made, by name.
+                The writer counts the files it writes itself.
+
+        Returns:
+            int: The number of files written.
+
+        Raises:
+            OSError: If a directory or file cannot be created, e.g. because a file is in the way.
+        """
+        ops = ops if ops is not None else collections.Counter()
+        root_fd = os.open(root, os.O_RDONLY | getattr(os, 'O_DIRECTORY', 0)) if DIR_FD_SUPPORTED else None
+        base = '' if root_fd is not None else str(root)
+        ops['open'] += root_fd is not None
+        try:
+            for directory in self.directories():
+                ops['mkdir'] += 1
+                try:
+                    os.mkdir(os.path.join(base, directory), dir_fd=root_fd)
+                except FileExistsError:
+                    ops['stat'] += 1
+                    if not stat.S_ISDIR(os.stat(os.path.join(base, directory), dir_fd=root_fd).st_mode):
+                        raise
+
+            jobs = []
+            for path, content in self.files.items():
+                if store is not None and path in self.shared:
+                    ops['link'] += 1
+                    store.link(content, os.path.join(base, path), root_fd)
+                else:
+                    jobs.append((os.path.join(base, path), content))
+
+            if writer is not None:
+                writer.write_all(jobs, root_fd)
+            else:
+                ops['open'] += len(jobs)
+                for path, content in jobs:
+                    write_file(path, content, dir_fd=root_fd)
+        finally:
+            if root_fd is not None:
+                os.close(root_fd)
+
+        return len(self.files)
+
+    def diff(self, root: Path) -> dict:
+        """
+        Compare the tree with a project on disk.
+
+        Args:
+            root (Path): The project directory to compare against.
+
+        Returns:
+            dict: Each file's path mapped to 'added' if it is missing on disk, 'modified' if
+                its content differs, or 'unchanged'.
+        """
+        statuses = {}
+        for path, content in self.files.items():
+            try:
+                with open(Path(root) / path, 'rb') as f:
+                    statuses[path] = 'unchanged' if f.read() == content else 'modified'
+            except FileNotFoundError:
+                statuses[path] = 'added'
+        return statuses
+
+    def size(self) -> int:
+        """
+        Compute the total size of the tree's files.
+
+        Returns:
+            int: The number of bytes held by the tree.
+        """
+        return sum(len(content) for content in self.files.values())
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    def __iter__(self):
+        return iter(sorted(self.files))
+
+    def __getitem__(self, path) -> bytes:
+        return self.files[PurePosixPath(path)]
+
+    def __contains__(self, path) -> bool:
+        return PurePosixPath(path) in self.files
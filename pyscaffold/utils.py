@@ -4,7 +4,7 @@ Pyscaffold Utilities
 This module contains utility functions for managing Python projects, including 
 checking project existence, validating project readiness, changing directories, 
 setting destination directories, applying naming conventions, preprocessing arguments, 
-executing shell commands, and activating virtual environments.
+executing shell commands, activating virtual environments, finding and listing projects, and reporting results.
 
 """
 import os
@@ -33,17 +33,89 @@ def project_ready(project_path: Path) -> bool:
     """
     Check if a project is ready by verifying the presence of required files and directories.
 
+    Projects whose manifest records their virtual environment are answered from that single
+    file; other projects are checked on disk.
+
     Args:
         project_path (Path): The path to the project directory.
 
     Returns:
         bool: True if the project has a 'setup.py' file and at least one virtual environment directory, otherwise False.
     """
+    from pyscaffold import manifest
+
+    if manifest.project_ready(project_path):
+        return True
     setup_file = project_path / 'setup.py'
     env_dir = project_path / 'env'
     venv_dir = project_path / 'venv'
     return setup_file.is_file() and (env_dir.is_dir() or venv_dir.is_dir())
 
+def listing_ready(project_path) -> bool:
+    """
+    Check if a project is ready from a single listing of its directory.
+
+    The listing's cached type information is used, so unlike `project_ready` no file
+    is read and no path is checked on its own.
+
+    Args:
+        project_path (str or Path): The path to the project directory.
+
+    Returns:
+        bool: True if the project has a 'setup.py' file and an 'env' or 'venv' directory, otherwise False.
+    """
+    has_setup = has_env = False
+    try:
+        with os.scandir(project_path) as children:
+            for child in children:
+                if child.name == 'setup.py':
+                    has_setup = child.is_file()
+                elif child.name in ('env', 'venv') and not has_env:
+                    has_env = child.is_dir()
+                if has_setup and has_env:
+                    return True
+    except OSError:
+        pass
+    return False
+
+def scan_projects(destination: str):
+    """
+    Scan a projects directory once, yielding each project as it is found.
+
+    Hidden entries, such as the staging directory and the virtual environment pool, and
+    files are skipped.
+
+    Args:
+        destination (str): The projects directory.
+
+    Yields:
+        tuple: The name of each project directory and whether it is ready, in directory order.
+    """
+    with os.scandir(destination) as entries:
+        for entry in entries:
+            if not entry.name.startswith('.') and entry.is_dir():
+                yield entry.name, listing_ready(entry.path)
+
+def find_projects(destination: str) -> list:
+    """
+    Find the projects in a projects directory.
+
+    Hidden entries, such as the staging directory and the virtual environment pool, are skipped.
+    Readiness is checked with `project_ready`, so a project whose manifest records its virtual
+    environment is found even if files `sync` should restore are missing.
+
+    Args:
+        destination (str): The projects directory.
+
+    Returns:
+        list of str: The names of the ready projects, sorted.
+    """
+    with os.scandir(destination) as entries:
+        return sorted(
+            entry.name for entry in entries
+            if not entry.name.startswith('.') and entry.is_dir() and project_ready(Path(entry.path))
+        )
+
 def change_directory(project_path: Path) -> None:
     """
     Change the current working directory to the specified project path.
@@ -152,4 +224,122 @@ def activate_virtual_env(project_path):
 
     else:
         print(f"Could not find the virtual environment activation script for '{project_path.name}'.")
-        return False
\ No newline at end of file
+        return False
+
+def print_results_table(results) -> None:
+    """
+    Print a per-project summary table of a `start` run.
+
+    The OPS column lists the metadata operations made to create, write and commit each
+    project's files, or '-' if they were not counted.
+
+    Args:
+        results (list of ProjectResult): The outcome of each scaffolded project.
+    """
+    headers = ('PROJECT', 'STATUS', 'DURATION', 'OPS', 'PATH')
+    rows = [
+        (result.name, result.status, f"{result.duration:.2f}s", '-' if result.metadata_ops is None else str(result.metadata_ops), str(result.path))
+        for result in results
+    ]
+    widths = [max(len(row[i]) for row in (headers, *rows)) for i in range(len(headers) - 1)]
+
+    print(' '.join(header.ljust(width) for header, width in zip(headers, widths)) + f" {headers[-1]}")
+    for row in rows:
+        color = colors.OKGREEN if row[1] == 'ok' else colors.FAIL
+        cells = [cell.ljust(width) for cell, width in zip(row, widths)]
+        cells[1] = f"{color}{cells[1]}{colors.ENDC}"
+        print(' '.join(cells) + f" {row[-1]}")
+
+def print_interpreters_table(registry: dict) -> None:
+    """
+    Print the Python interpreters found on PATH, oldest version first.
+
+    Args:
+        registry (dict): Each found version mapped to its 'path', 'realpath' and full 'version'.
+    """
+    if not registry:
+        print("No Python interpreters found in PATH.")
+        return
+
+    headers = ('PYTHON', 'VERSION', 'PATH')
+    rows = [
+        (python_version, interpreter['version'], interpreter['realpath'])
+        for python_version, interpreter in sorted(registry.items(), key=lambda item: tuple(map(int, item[0].split('.'))))
+    ]
+    widths = [max(len(row[i]) for row in (headers, *rows)) for i in range(len(headers) - 1)]
+
+    print(' '.join(header.ljust(width) for header, width in zip(headers, widths)) + f" {headers[-1]}")
+    for row in rows:
+        cells = [cell.ljust(width) for cell, width in zip(row, widths)]
+        cells[0] = f"{colors.OKGREEN}{cells[0]}{colors.ENDC}"
+        print(' '.join(cells) + f" {row[-1]}")
+
+def print_project_tree(project_path: Path, tree) -> None:
+    """
+    Print the files a project would be created with, for a dry run.
+
+    Args:
+        project_path (Path): The location the project would be created at.
+        tree (ProjectTree): The rendered project files.
+    """
+    print(f"Would create project at {project_path} ({len(tree)} files, {tree.size()} bytes)")
+    for path in tree:
+        print(f"  {len(tree[path]):>8}  {path}")
+    print(f"  {'':>8}  env/")
+
+def print_projects(projects) -> int:
+    """
+    Print projects as they are found, followed by a summary.
+
+    Each line is printed as soon as its project is scanned, so listing a large projects
+    directory starts printing at once.
+
+    Args:
+        projects (iterable of tuple): The name of each project and whether it is ready, as yielded by `scan_projects`.
+
+    Returns:
+        int: The number of projects listed.
+    """
+    listed = ready_count = 0
+    for project_name, ready in projects:
+        listed += 1
+        if ready:
+            ready_count += 1
+            print(f"{colors.OKGREEN}{'ready':<9}{colors.ENDC} {project_name}")
+        else:
+            print(f"{colors.WARNING}{'not ready':<9}{colors.ENDC} {project_name}")
+
+    print(f"{listed} project(s), {ready_count} ready")
+    return listed
+
+def print_sync_report(report: dict, dry_run: bool = False) -> None:
+    """
+    Print the projects a `sync` run changed, followed by a summary.
+
+    Projects that were already up to date are only counted, so syncing a large projects
+    directory prints one line per project that needed attention.
+
+    Args:
+        report (dict): The name of each synced project mapped to its 'shared' and 'files' statuses, or to its 'error'.
+        dry_run (bool): Whether the files were only classified, not written (default: False).
+    """
+    rewritten = 0
+    for project_name, project_report in report.items():
+        if 'error' in project_report:
+            print(f"{colors.FAIL}{project_name}: {project_report['error']}{colors.ENDC}")
+            continue
+
+        counts = {}
+        for status in project_report['files'].values():
+            counts[status] = counts.get(status, 0) + 1
+        counts['unshared'] = list(project_report['shared'].values()).count('modified')
+        counts['restored'] = list(project_report['shared'].values()).count('restored')
+        rewritten += counts.get('added', 0) + counts.get('updated', 0) + counts['restored']
+
+        changes = [f"{counts[status]} {status}" for status in ('added', 'updated', 'edited', 'unshared', 'restored') if counts.get(status)]
+        if changes:
+            print(f"{project_name}: {', '.join(changes)}")
+
+    failed = sum('error' in project_report for project_report in report.values())
+    verb = 'would be rewritten' if dry_run else 'rewritten'
+    print(f"Synced {len(report) - failed} project(s), {failed} failed: {rewritten} file(s) {verb}")
@@ -0,0 +1,420 @@
+"""
+Pyscaffold Virtual Environments
+
+This module contains the strategies used to create a project's virtual environment.
+Besides running `python -m venv` for every project, a pristine base environment can be
+built once per Python version in the pyscaffold cache directory and cloned into each
+new project, linking its files instead of reinstalling pip, or taken ready-built from a
+pool kept topped up in the background under the projects root. Lightweight environments
+can also be created without pip and share the pip of the cached base environment.
+
+Functions:
+    create_environment: Create a bare virtual environment, in-process when the Python version is the running one.
+    create_standard: Create a virtual environment by running `python -m venv`.
+    create_from_cache: Create a virtual environment by cloning the cached base environment.
+    create_from_pool: Create a virtual environment by taking a prewarmed one from the pool.
+    create_shared_pip: Create a virtual environment without pip that uses a shared pip installation.
+    link_shared_pip: Expose a shared pip installation inside a virtual environment.
+    fill_pool: Build prewarmed virtual environments until the pool is full.
+    refill_pool_in_background: Start a detached `pyscaffold pool fill` process.
+    build_template: Build the cached base environment for a Python version.
+    clone_tree: Copy a directory tree using reflinks or hardlinks where possible.
+    relocate_virtual_environment: Rewrite the paths baked into a moved virtual environment.
+"""
+
+import os
+import sys
+import uuid
+import venv
+import shutil
+import fcntl
+import subprocess
+from pathlib import Path
+
+from pyscaffold import interpreters
+from pyscaffold.config import Config
+
+# Linux ioctl request cloning one file's extents into another (a reflink)
+FICLONE = 0x40049409
+
+def create_environment(venv_path: Path, python_version: str, python_executable: str, with_pip: bool = True, prompt: str = None) -> None:
+    """
+    Create a bare virtual environment, the way `python -m venv` does.
+
+    When the requested version is the interpreter running pyscaffold, the environment is
+    built in-process with `venv.EnvBuilder`, saving the startup of a second interpreter.
+    Other versions are created by running their own interpreter.
+
+    Args:
+        venv_path (Path): The path of the virtual environment to create.
+        python_version (str): The Python version of the environment.
+        python_executable (str): The interpreter used when the version is not the running one.
+        with_pip (bool): Whether to bootstrap pip into the environment (default: True).
+        prompt (str, optional): The prompt of the activation scripts. Defaults to the directory name.
+
+    Raises:
+        subprocess.CalledProcessError: If there is an error creating the virtual environment.
+    """
+    if interpreters.is_running_interpreter(python_version):
+        builder = venv.EnvBuilder(symlinks=os.name != 'nt', with_pip=with_pip, prompt=prompt)
+        builder.create(str(venv_path))
+        return
+
+    command = [python_executable, '-m', 'venv']
+    if not with_pip:
+        command.append('--without-pip')
+    if prompt:
+        command += ['--prompt', prompt]
+    subprocess.run(command + [str(venv_path)], check=True, stdout=subprocess.DEVNULL)
+
+def create_standard(venv_path: Path, python_version: str, python_executable: str, projects_root: Path) -> None:
+    """
+    Create a virtual environment by running `python -m venv`.
+
+    Args:
+        venv_path (Path): The path of the virtual environment to create.
+        python_version (str): The Python version of the environment.
+        python_executable (str): The interpreter used to create the environment.
+        projects_root (Path): The directory holding the projects.
+
+    Raises:
+        subprocess.CalledProcessError: If there is an error creating the virtual environment.
+    """
+    create_environment(venv_path, python_version, python_executable)
+
+def template_path(python_version: str) -> Path:
+    """
+    Retrieve the path of the cached base environment for a Python version.
+
+    The environment directory is named 'env' so that the prompt baked into its
+    activation scripts matches the one of a freshly created project environment.
+
+    Args:
+        python_version (str): The Python version of the base environment.
+
+    Returns:
+        Path: The path of the cached base environment.
+    """
+    return Config().get_cache_directory_path() / 'venvs' / python_version / 'env'
+
+def build_template(python_version: str, python_executable: str) -> Path:
+    """
+    Build the cached base environment for a Python version if it does not exist yet.
+
+    The environment is built next to its final location and renamed into place, and
+    builds are serialized with a lock file, so concurrent runs never see a partial template.
+
+    Args:
+        python_version (str): The Python version of the base environment.
+        python_executable (str): The interpreter used to create the environment.
+
+    Returns:
+        Path: The path of the cached base environment.
+
+    Raises:
+        subprocess.CalledProcessError: If there is an error creating the base environment.
+    """
+    template = template_path(python_version)
+    if (template / 'bin' / 'python').exists():
+        return template
+
+    template.parent.mkdir(parents=True, exist_ok=True)
+    with open(template.parent / '.lock', 'w') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        if (template / 'bin' / 'python').exists():
+            return template
+
+        if template.exists():
+            # A template whose interpreter link is broken, e.g. after an interpreter upgrade
+            shutil.rmtree(template)
+
+        staging = template.parent / f'.building-{os.getpid()}'
+        shutil.rmtree(staging, ignore_errors=True)
+        try:
+            create_environment(staging / 'env', python_version, python_executable)
+            relocate_virtual_environment(staging / 'env', staging / 'env', template)
+            os.rename(staging / 'env', template)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    return template
+
+def _clone_file(source: str, destination: str, mode: list) -> None:
+    """
+    Clone a single file, trying a reflink, then a hardlink, then a plain copy.
+
+    Args:
+        source (str): The file to clone.
+        destination (str): The path of the clone.
+        mode (list): A one-item list holding the cheapest method known to work, shared across calls.
+    """
+    if mode[0] == 'reflink':
+        try:
+            with open(source, 'rb') as src, open(destination, 'wb') as dst:
+                fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+            shutil.copystat(source, destination)
+            return
+        except OSError:
+            os.unlink(destination)
+            mode[0] = 'hardlink'
+
+    if mode[0] == 'hardlink':
+        try:
+            os.link(source, destination)
+            return
+        except OSError:
+            mode[0] = 'copy'
+
+    shutil.copy2(source, destination)
+
+def clone_tree(source: Path, destination: Path) -> None:
+    """
+    Copy a directory tree using reflinks or hardlinks where possible.
+
+    Symbolic links are recreated as they are. Files are reflinked when the filesystem
+    supports it, hardlinked when it does not, and copied as a last resort.
+
+    Args:
+        source (Path): The directory tree to clone.
+        destination (Path): The path of the clone, which must not exist yet.
+    """
+    mode = ['reflink']
+    source = str(source)
+    for root, dirs, files in os.walk(source):
+        target_root = os.path.normpath(os.path.join(destination, os.path.relpath(root, source)))
+        os.mkdir(target_root)
+        shutil.copystat(root, target_root)
+        for name in dirs + files:
+            path = os.path.join(root, name)
+            target = os.path.join(target_root, name)
+            if os.path.islink(path):
+                os.symlink(os.readlink(path), target)
+                if name in dirs:
+                    dirs.remove(name)
+            elif name in files:
+                _clone_file(path, target, mode)
+
+def relocate_virtual_environment(venv_path: Path, old_path: Path, new_path: Path = None) -> None:
+    """
+    Rewrite the paths baked into a virtual environment that was moved or cloned.
+
+    `pyvenv.cfg`, the activation scripts and the console-script shebangs in `bin/` are
+    rewritten from `old_path` to `new_path`. Files are replaced rather than edited in
+    place, so links shared with a cached template are never modified.
+
+    Args:
+        venv_path (Path): The current location of the virtual environment.
+        old_path (Path): The location the environment was created at.
+        new_path (Path, optional): The location to write into the environment. Defaults to `venv_path`.
+    """
+    old = os.fsencode(str(old_path))
+    new = os.fsencode(str(new_path or venv_path))
+    if old == new:
+        return
+
+    candidates = [venv_path / 'pyvenv.cfg']
+    candidates += [path for path in (venv_path / 'bin').iterdir() if not path.is_symlink() and path.is_file()]
+
+    for path in candidates:
+        content = path.read_bytes()
+        if old not in content:
+            continue
+        replacement = path.with_name(f'.{path.name}.relocate')
+        replacement.write_bytes(content.replace(old, new))
+        shutil.copymode(path, replacement)
+        os.replace(replacement, path)
+
+def create_from_cache(venv_path: Path, python_version: str, python_executable: str, projects_root: Path) -> None:
+    """
+    Create a virtual environment by cloning the cached base environment.
+
+    The base environment is built on first use for each Python version.
+
+    Args:
+        venv_path (Path): The path of the virtual environment to create.
+        python_version (str): The Python version of the environment.
+        python_executable (str): The interpreter used to build the base environment.
+        projects_root (Path): The directory holding the projects.
+
+    Raises:
+        subprocess.CalledProcessError: If there is an error creating the base environment.
+    """
+    template = build_template(python_version, python_executable)
+    clone_tree(template, venv_path)
+    relocate_virtual_environment(venv_path, template)
+
+def pool_path(projects_root: Path, python_version: str) -> Path:
+    """
+    Retrieve the path of the prewarmed virtual environment pool for a Python version.
+
+    The pool lives under the projects root so that taking an environment from it is a
+    single rename on the same filesystem.
+
+    Args:
+        projects_root (Path): The directory holding the projects.
+        python_version (str): The Python version of the pooled environments.
+
+    Returns:
+        Path: The path of the pool.
+    """
+    return Path(projects_root) / '.pyscaffold-pool' / python_version
+
+def pool_entries(projects_root: Path, python_version: str) -> list:
+    """
+    List the ready-built virtual environments in the pool.
+
+    Environments still being built are hidden behind a leading dot and are not listed.
+
+    Args:
+        projects_root (Path): The directory holding the projects.
+        python_version (str): The Python version of the pooled environments.
+
+    Returns:
+        list of Path: The ready environments, oldest name first.
+    """
+    pool = pool_path(projects_root, python_version)
+    try:
+        names = sorted(name for name in os.listdir(pool) if not name.startswith('.'))
+    except FileNotFoundError:
+        return []
+    return [pool / name for name in names]
+
+def fill_pool(projects_root: Path, python_version: str, python_executable: str, size: int) -> int:
+    """
+    Build prewarmed virtual environments until the pool holds `size` of them.
+
+    Each environment is built under a hidden name and renamed into the pool once it is
+    complete. Only one filler runs per pool at a time; a second one returns immediately.
+
+    Args:
+        projects_root (Path): The directory holding the projects.
+        python_version (str): The Python version of the pooled environments.
+        python_executable (str): The interpreter used to create the environments.
+        size (int): The number of ready environments to keep in the pool.
+
+    Returns:
+        int: The number of environments built.
+
+    Raises:
+        subprocess.CalledProcessError: If there is an error creating an environment.
+    """
+    pool = pool_path(projects_root, python_version)
+    pool.mkdir(parents=True, exist_ok=True)
+    built = 0
+
+    with open(pool / '.lock', 'w') as lock:
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return built
+
+        while len(pool_entries(projects_root, python_version)) < size:
+            name = uuid.uuid4().hex
+            staging = pool / f'.building-{name}'
+            try:
+                create_environment(staging, python_version, python_executable, prompt='env')
+                relocate_virtual_environment(staging, staging, pool / name)
+                os.rename(staging, pool / name)
+            finally:
+                shutil.rmtree(staging, ignore_errors=True)
+            built += 1
+
+    return built
+
+def refill_pool_in_background(projects_root: Path, python_version: str) -> None:
+    """
+    Start a detached `pyscaffold pool fill` process for a pool.
+
+    Args:
+        projects_root (Path): The directory holding the projects.
+        python_version (str): The Python version of the pooled environments.
+    """
+    subprocess.Popen(
+        [sys.executable, '-m', 'pyscaffold', 'pool', 'fill', '--python-version', python_version, '--destination', str(projects_root)],
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+
+def create_from_pool(venv_path: Path, python_version: str, python_executable: str, projects_root: Path) -> None:
+    """
+    Create a virtual environment by taking a prewarmed one from the pool.
+
+    The environment is renamed into place and its paths patched; a background refill is
+    then started. When the pool is empty the environment is created with `python -m venv`.
+
+    Args:
+        venv_path (Path): The path of the virtual environment to create.
+        python_version (str): The Python version of the environment.
+        python_executable (str): The interpreter used when the pool is empty.
+        projects_root (Path): The directory holding the projects and the pool.
+
+    Raises:
+        subprocess.CalledProcessError: If the pool is empty and there is an error creating the environment.
+    """
+    for entry in pool_entries(projects_root, python_version):
+        try:
+            os.rename(entry, venv_path)
+        except FileNotFoundError:
+            # Another run took this environment first
+            continue
+        relocate_virtual_environment(venv_path, entry)
+        break
+    else:
+        create_standard(venv_path, python_version, python_executable, projects_root)
+
+    refill_pool_in_background(projects_root, python_version)
+
+SHARED_PIP_LAUNCHER = (
+    "#!{python}\n"
+    "import sys\n"
+    "from pip._internal.cli.main import main\n"
+    "if __name__ == '__main__':\n"
+    "    sys.exit(main())\n"
+)
+
+def link_shared_pip(venv_path: Path, python_version: str, shared_env: Path) -> None:
+    """
+    Expose the pip installed in a shared environment inside a virtual environment.
+
+    A `.pth` file appends the shared environment's site-packages to the environment's
+    `sys.path`, and `pip` launchers run it with the environment's interpreter, so packages
+    are still installed into the environment itself. Packages installed in the environment
+    take precedence over the shared ones.
+
+    Args:
+        venv_path (Path): The virtual environment, created without pip.
+        python_version (str): The Python version of both environments.
+        shared_env (Path): The environment whose pip is shared.
+    """
+    site_packages = Path('lib') / f'python{python_version}' / 'site-packages'
+    (venv_path / site_packages / '_pyscaffold_shared_pip.pth').write_text(f'{shared_env / site_packages}\n')
+
+    launcher = SHARED_PIP_LAUNCHER.format(python=venv_path / 'bin' / 'python')
+    for name in ('pip', 'pip3', f'pip{python_version}'):
+        script = venv_path / 'bin' / name
+        script.write_text(launcher)
+        script.chmod(0o755)
+
+def create_shared_pip(venv_path: Path, python_version: str, python_executable: str, projects_root: Path) -> None:
+    """
+    Create a virtual environment without pip that uses the pip of the cached base environment.
+
+    Args:
+        venv_path (Path): The path of the virtual environment to create.
+        python_version (str): The Python version of the environment.
+        python_executable (str): The interpreter used to create the environment.
+        projects_root (Path): The directory holding the projects.
+
+    Raises:
+        subprocess.CalledProcessError: If there is an error creating either environment.
+    """
+    shared_env = build_template(python_version, python_executable)
+    create_environment(venv_path, python_version, python_executable, with_pip=False)
+    link_shared_pip(venv_path, python_version, shared_env)
+
+VENV_STRATEGIES = {
+    'standard': create_standard,
+    'cache': create_from_cache,
+    'pool': create_from_pool,
+    'shared-pip': create_shared_pip
+}
@@ -0,0 +1,208 @@
+"""
+Pyscaffold Writer
+
+This module contains the bulk file writer of the Pyscaffold application. A `BulkWriter`
+takes many (path, content) jobs and writes them on a small thread pool, so the latency of
+each `open`/`write`/`close` overlaps instead of adding up file by file.
+
+How durable the written files are is chosen with a durability mode:
+
+- 'none': files are left in the page cache and flushed whenever the kernel decides.
+- 'batch': nothing is synced per file; `commit` makes everything durable at once with a
+  single `syncfs` of the filesystem, or by syncing the written files where `syncfs` is
+  not available, followed by their directories.
+- 'full': every file is synced as soon as it is written, and `commit` syncs the directories
+  holding them.
+
+Classes:
+    BulkWriter: Write many files on a thread pool with a selectable durability, counting
+        the metadata operations it makes.
+
+Functions:
+    write_file: Create or truncate a file and write its full content.
+    fsync_path: Sync a file or directory to disk.
+    syncfs: Sync the whole filesystem holding a path.
+
+Attributes:
+    DURABILITY_MODES (tuple): The supported durability modes.
+"""
+
+import os
+import functools
+import collections
+
+DURABILITY_MODES = ('none', 'batch', 'full')
+
+FILE_MODE = 0o644
+
+def write_file(path, content: bytes, durable: bool = False, dir_fd: int = None) -> None:
+    """
+    Create or truncate a file and write its full content.
+
+    Args:
+        path (str or Path): The path of the file.
+        content (bytes): The file's content.
+        durable (bool): Whether to sync the file to disk before closing it (default: False).
+        dir_fd (int, optional): A directory descriptor a relative path is resolved from.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, FILE_MODE, dir_fd=dir_fd)
+    try:
+        view = memoryview(content)
+        while view:
+            view = view[os.write(fd, view):]
+        if durable:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+
+def fsync_path(path) -> None:
+    """
+    Sync a file or directory to disk.
+
+    Args:
+        path (str or Path): The file or directory to sync.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+@functools.lru_cache(maxsize=None)
+def _libc_syncfs():
+    """
+    Look up the C library's `syncfs`, which the os module does not expose.
+
+    Returns:
+        callable: The `syncfs` function, or None if the platform has none.
+    """
+    import ctypes
+
+    try:
+        return getattr(ctypes.CDLL(None, use_errno=True), 'syncfs', None)
+    except OSError:
+        return None
+
+def syncfs(path) -> bool:
+    """
+    Sync the whole filesystem holding a path with a single `syncfs` call.
+
+    Args:
+        path (str or Path): A file or directory on the filesystem to sync.
+
+    Returns:
+        bool: True if the filesystem was synced, False if `syncfs` is not available or failed.
+    """
+    function = _libc_syncfs()
+    if function is None:
+        return False
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return function(fd) == 0
+    finally:
+        os.close(fd)
+
+class BulkWriter():
+    """
+    Write many files on a small thread pool with a selectable durability.
+    """
+
+    def __init__(self, durability: str = 'none', workers: int = None):
+        """
+        Initialize the writer. The thread pool is started with the first batch of jobs.
+
+        Args:
+            durability (str): One of DURABILITY_MODES (default: 'none').
+            workers (int, optional): The number of writer threads. Defaults to the CPU count, at most 8.
+
+        Raises:
+            ValueError: If the durability mode is not supported.
+        """
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"Unknown durability mode '{durability}'. Choose from: {', '.join(DURABILITY_MODES)}.")
+        self.durability = durability
+        self.workers = workers or min(8, os.cpu_count() or 1)
+        self.written = []
+        self.ops = collections.Counter()
+        self._executor = None
+
+    def write_all(self, jobs, dir_fd: int = None) -> int:
+        """
+        Write files on the thread pool and wait for all of them.
+
+        The parent directories must exist. With 'full' durability, each file is synced
+        before its job completes. Relative paths resolved from a directory descriptor are
+        recorded as they are and must be committed with that directory as the root.
+
+        Args:
+            jobs (iterable of tuple): (path, content) pairs, the content being bytes.
+            dir_fd (int, optional): A directory descriptor the paths are resolved from. It must
+                stay open until the call returns.
+
+        Returns:
+            int: The number of files written.
+
+        Raises:
+            OSError: The first error raised by a job, once every job has finished.
+        """
+        jobs = [(str(path), content) for path, content in jobs]
+        durable = self.durability == 'full'
+        if len(jobs) < 2 or self.workers < 2:
+            for path, content in jobs:
+                write_file(path, content, durable, dir_fd)
+        else:
+            if self._executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='pyscaffold-writer')
+            futures = [self._executor.submit(write_file, path, content, durable, dir_fd) for path, content in jobs]
+            errors = [future.exception() for future in futures]
+            for error in errors:
+                if error is not None:
+                    raise error
+        self.written.extend(path for path, _ in jobs)
+        self.ops['open'] += len(jobs)
+        if durable:
+            self.ops['fsync'] += len(jobs)
+        return len(jobs)
+
+    def commit(self, root=None) -> None:
+        """
+        Make the files written so far as durable as the writer's mode requires.
+
+        Args:
+            root (str or Path, optional): The directory the files were written under, which is
+                synced along with the files' directories. Relative paths are resolved from it.
+        """
+        written, self.written = self.written, []
+        if self.durability == 'none':
+            return
+        if root is not None:
+            written = [os.path.join(str(root), path) for path in written]
+        if self.durability == 'batch':
+            self.ops['syncfs'] += 1
+            if syncfs(root if root is not None else written[0] if written else os.curdir):
+                return
+            self.ops['fsync'] += len(written)
+            for path in written:
+                fsync_path(path)
+
+        directories = {os.path.dirname(path) for path in written}
+        if root is not None:
+            directories.add(str(root))
+        self.ops['fsync'] += len(directories)
+        for directory in sorted(directories, key=len, reverse=True):
+            fsync_path(directory)
+
+    def close(self) -> None:
+        """
+        Stop the thread pool, if it was started.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self) -> 'BulkWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()